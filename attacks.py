@@ -0,0 +1,82 @@
+"""
+Includes the attack tables of a board size: for every piece type,
+the cells the piece attacks from each cell of the board as a bitmask,
+the cell (row, column) being the bit row * columns + column.
+The masks are compiled from the lines and the offsets of the piece
+types, see get_targets().
+"""
+from pieces import PIECE_TYPES, get_targets
+from chess_exceptions import InvalidArgumentException
+
+_TABLES = {}
+
+
+class AttackTable(object):
+    """
+    Represents the attack bitmasks of all the piece types on a board size.
+    """
+    def __init__(self, rows, columns):
+        """
+        Initializes a new instance of the AttackTable class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :return: A new instance of the AttackTable class.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.cells = rows * columns
+        self.masks = {}
+        for symbol, piece_type in PIECE_TYPES:
+            self.masks[symbol] = [self._get_mask(piece_type, cell // columns,
+                                                 cell % columns)
+                                  for cell in xrange(self.cells)]
+        super(AttackTable, self).__init__()
+
+    @property
+    def full_mask(self):
+        """
+        Returns the bitmask of all the cells of the board.
+        :return: An integer.
+        """
+        return (1 << self.cells) - 1
+
+    def get_mask(self, symbol, cell):
+        """
+        Returns the cells a piece attacks from a certain cell.
+        :param symbol: A string that represents the type of the piece.
+        :param cell: An integer that represents the index of the cell.
+        :return: An integer bitmask.
+        """
+        try:
+            return self.masks[symbol][cell]
+        except KeyError:
+            raise InvalidArgumentException("unknown piece type: %s" % symbol)
+
+    def _get_mask(self, piece_type, row, column):
+        """
+        Calculates the cells a piece attacks from a certain position.
+        :param piece_type: A subclass of the Piece class.
+        :param row: An integer that represents the row of the piece.
+        :param column: An integer that represents the column of the piece.
+        :return: An integer bitmask.
+        """
+        mask = 0
+        for y_axis, x_axis in get_targets(piece_type.riders, piece_type.leaps,
+                                          row, column, self.rows,
+                                          self.columns):
+            mask |= 1 << (y_axis * self.columns + x_axis)
+        return mask
+
+
+def get_attack_table(rows, columns):
+    """
+    Returns the attack table of a board size, the tables are built
+    once and kept for the next calls.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :return: An instance of the AttackTable class.
+    """
+    table = _TABLES.get((rows, columns))
+    if table is None:
+        table = _TABLES[rows, columns] = AttackTable(rows, columns)
+    return table
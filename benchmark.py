@@ -0,0 +1,106 @@
+"""
+Includes the benchmark of the solvers, it solves a set of problems and
+prints the time and the memory each of them took.
+
+Every problem is solved in a new process, so the peak memory of a
+problem is not hidden by the peak of a larger one solved before it.
+"""
+import multiprocessing
+import optparse
+import time
+from board import Board, STRATEGIES, MOVES
+from pieces import create_pieces
+from memory import MemoryReport, format_size
+
+# the name, the board size, the pieces and the way the solutions are
+# found: "laps" moves the pieces around, with each of the strategies
+# passed on the command line, "exact" uses the conflict graph
+PROBLEMS = [
+    ("3x3 K2 R1", 3, 3, {"K": 2, "R": 1}, "laps"),
+    ("4x4 R2 N4", 4, 4, {"R": 2, "N": 4}, "laps"),
+    ("6x6 K2 Q2 N1", 6, 6, {"K": 2, "Q": 2, "N": 1}, "exact"),
+    ("8x8 Q8", 8, 8, {"Q": 8}, "exact"),
+]
+
+STRUCTURES = ["cells", "cache", "pieces", "solutions"]
+
+
+def run_problem(problem):
+    """
+    Solves a problem and measures the time and the memory it takes.
+    :param problem: A tuple of the name, the rows, the columns, the
+    piece counts, the method and the seed of the problem, the method
+    is "exact" or one of the strategies of the laps.
+    :return: A dict with the number of the solutions, the time in
+    seconds, the peak memory and the memory of each structure.
+    """
+    _, rows, columns, counts, method, seed = problem
+    memory = MemoryReport()
+    memory.start()
+    start_time = time.time()
+    board = Board(rows, columns, create_pieces(counts), seed)
+    if method == "exact":
+        solutions = board.find_all_configurations()
+    else:
+        solutions = board.find_independent_configurations(strategy=method)
+    seconds = time.time() - start_time
+    memory.stop()
+    memory.measure_board(board, solutions)
+    return {"solutions": len(solutions), "seconds": seconds,
+            "peak_rss": memory.peak_rss, "peak_heap": memory.peak_heap,
+            "structures": dict(memory.structures)}
+
+
+def render_row(name, method, result):
+    """
+    Renders the result of a problem as a row of the benchmark table.
+    :param name: A string that names the problem.
+    :param method: A string, the way the solutions were found.
+    :param result: A dict that run_problem() returned.
+    :return: A string.
+    """
+    peak_heap = result["peak_heap"]
+    columns = [name, method, str(result["solutions"]),
+               "%.2f s" % result["seconds"],
+               format_size(result["peak_rss"]),
+               format_size(peak_heap) if peak_heap is not None else "-"]
+    columns.extend(format_size(result["structures"][structure])
+                   for structure in STRUCTURES)
+    return ' | '.join(columns)
+
+
+def main():
+    """
+    Runs the benchmark and prints its table.
+    :return: None
+    """
+    parser = optparse.OptionParser("usage: %prog [options]")
+    parser.add_option("--seed", dest="seed", default=0, type="int",
+                      help="Seed of the order the pieces are placed in")
+    parser.add_option("--strategy", dest="strategies", default=[],
+                      action="append", type="choice", choices=STRATEGIES,
+                      help="Strategy the laps problems are solved with, "
+                           "it can be passed several times "
+                           "[default: moves]")
+    options, _ = parser.parse_args()
+    strategies = options.strategies or [MOVES]
+
+    print ' | '.join(["problem", "method", "solutions", "time", "peak RSS",
+                      "peak heap"] + STRUCTURES)
+    for name, rows, columns, counts, search in PROBLEMS:
+        methods = strategies if search == "laps" else [search]
+        for method in methods:
+            # a new process for every problem, its peak is its own
+            pool = multiprocessing.Pool(1)
+            try:
+                result = pool.apply(run_problem, ((name, rows, columns,
+                                                   counts, method,
+                                                   options.seed),))
+            finally:
+                pool.close()
+                pool.join()
+            print render_row(name, method, result)
+
+
+if __name__ == '__main__':
+    main()
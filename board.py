@@ -3,26 +3,242 @@ Includes classes that represent the main
 elements of the problem: Board and Cell
 """
 import random
+from pieces import RIDERS, LEAPS, VERTICAL, HORIZONTAL, DIAGONAL,\
+    ANTI_DIAGONAL, count_pieces
+from conflict_graph import get_conflict_graph
 from chess_exceptions import InvalidSetupException, InvalidArgumentException,\
     InvalidMoveException
 
+# the ways the destinations of a piece are found while exploring: the
+# moves of the piece, all the free cells, or the free cells where the
+# piece is neither attacked nor attacks, "auto" picks one for the board
+MOVES = "moves"
+FREE = "free"
+SAFE = "safe"
+AUTO = "auto"
+STRATEGIES = (MOVES, FREE, SAFE, AUTO)
+# "auto" tries all the free cells on the boards up to this number of
+# cells, and the safe cells when there are at least this many cells for
+# every piece, the moves of the pieces otherwise
+AUTO_FREE_CELLS = 16
+AUTO_SAFE_DENSITY = 8
+
+
+def count_laps(rows, columns, pieces):
+    """
+    Counts the laps of the search, a lap is the position from which
+    the pieces start being placed.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :param pieces: An integer, the number of the pieces.
+    :return: An integer, not positive when the pieces do not fit.
+    """
+    return rows * columns - pieces + 1
+
+
+class AttackIndex(object):
+    """
+    Keeps count of the pieces on every row, column, diagonal and
+    anti-diagonal of a board, of the pieces that ride each of these
+    lines and of the cells the leaping pieces attack, so that the
+    attacks on a cell can be found without going through the moves
+    of all the pieces.
+    """
+    def __init__(self, rows, columns):
+        """
+        Initializes a new instance of the AttackIndex class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :return: A new instance of the AttackIndex class.
+        """
+        self.rows = rows
+        self.columns = columns
+        lines = rows + columns - 1
+        self._pieces = {}
+        self._row_pieces = [0] * rows
+        self._column_pieces = [0] * columns
+        self._diagonal_pieces = [0] * lines
+        self._anti_diagonal_pieces = [0] * lines
+        self._row_riders = [0] * rows
+        self._column_riders = [0] * columns
+        self._diagonal_riders = [0] * lines
+        self._anti_diagonal_riders = [0] * lines
+        self._leaps = {}
+        super(AttackIndex, self).__init__()
+
+    def add(self, symbol, row, column):
+        """
+        Adds a piece to the index.
+        :param symbol: A string that represents the type of the piece.
+        :param row: An integer that represents the row of the piece.
+        :param column: An integer that represents the column of the piece.
+        :return: None.
+        """
+        self._update(symbol, row, column, 1)
+        self._pieces[row, column] = symbol
+
+    def remove(self, symbol, row, column):
+        """
+        Removes a piece from the index.
+        :param symbol: A string that represents the type of the piece.
+        :param row: An integer that represents the row of the piece.
+        :param column: An integer that represents the column of the piece.
+        :return: None.
+        """
+        self._update(symbol, row, column, -1)
+        del self._pieces[row, column]
+
+    def get_piece(self, row, column):
+        """
+        Gets the type of the piece standing on a cell.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: A string, or None if the cell is free.
+        """
+        return self._pieces.get((row, column))
+
+    def count_attacks(self, row, column):
+        """
+        Counts the pieces that attack a cell, a piece
+        standing on the cell is not counted.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: An integer.
+        """
+        diagonal = row - column + self.columns - 1
+        attacks = self._row_riders[row] + self._column_riders[column] +\
+            self._diagonal_riders[diagonal] +\
+            self._anti_diagonal_riders[row + column] +\
+            self._leaps.get((row, column), 0)
+        symbol = self._pieces.get((row, column))
+        if symbol:
+            # a rider is counted on each of its own lines
+            attacks -= len(RIDERS.get(symbol, ()))
+        return attacks
+
+    def is_attacked(self, row, column):
+        """
+        Checks if any piece attacks a cell, a piece
+        standing on the cell is not taken into account.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: A boolean.
+        """
+        return self.count_attacks(row, column) > 0
+
+    def attacks_any(self, symbol, row, column):
+        """
+        Checks if a piece of a certain type placed on a cell would
+        attack any of the pieces, a piece standing on the
+        cell is not taken into account.
+        :param symbol: A string that represents the type of the piece.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: A boolean.
+        """
+        own = 1 if (row, column) in self._pieces else 0
+        riders = RIDERS.get(symbol, ())
+        if HORIZONTAL in riders and self._row_pieces[row] > own:
+            return True
+        if VERTICAL in riders and self._column_pieces[column] > own:
+            return True
+        if DIAGONAL in riders and\
+                self._diagonal_pieces[row - column + self.columns - 1] > own:
+            return True
+        if ANTI_DIAGONAL in riders and\
+                self._anti_diagonal_pieces[row + column] > own:
+            return True
+        for row_offset, column_offset in LEAPS.get(symbol, ()):
+            if (row + row_offset, column + column_offset) in self._pieces:
+                return True
+        return False
+
+    def is_column_ridden(self, column):
+        """
+        Checks if a piece that attacks its whole column stands on a
+        column, the cells of such a column are taken for the others.
+        :param column: An integer that represents the column.
+        :return: A boolean.
+        """
+        return self._column_riders[column] > 0
+
+    def count_attacked(self, symbol, row, column):
+        """
+        Counts the pieces a piece of a certain type placed on a cell
+        would attack, a piece standing on the cell is not counted.
+        :param symbol: A string that represents the type of the piece.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: An integer.
+        """
+        own = 1 if (row, column) in self._pieces else 0
+        attacked = 0
+        riders = RIDERS.get(symbol, ())
+        if HORIZONTAL in riders:
+            attacked += self._row_pieces[row] - own
+        if VERTICAL in riders:
+            attacked += self._column_pieces[column] - own
+        if DIAGONAL in riders:
+            attacked += self._diagonal_pieces[row - column +
+                                              self.columns - 1] - own
+        if ANTI_DIAGONAL in riders:
+            attacked += self._anti_diagonal_pieces[row + column] - own
+        for row_offset, column_offset in LEAPS.get(symbol, ()):
+            if (row + row_offset, column + column_offset) in self._pieces:
+                attacked += 1
+        return attacked
+
+    def _update(self, symbol, row, column, step):
+        """
+        Updates the counters of the lines and the cells a piece attacks.
+        :param symbol: A string that represents the type of the piece.
+        :param row: An integer that represents the row of the piece.
+        :param column: An integer that represents the column of the piece.
+        :param step: 1 when the piece is added, -1 when it is removed.
+        :return: None.
+        """
+        diagonal = row - column + self.columns - 1
+        anti_diagonal = row + column
+        self._row_pieces[row] += step
+        self._column_pieces[column] += step
+        self._diagonal_pieces[diagonal] += step
+        self._anti_diagonal_pieces[anti_diagonal] += step
+        riders = RIDERS.get(symbol, ())
+        if HORIZONTAL in riders:
+            self._row_riders[row] += step
+        if VERTICAL in riders:
+            self._column_riders[column] += step
+        if DIAGONAL in riders:
+            self._diagonal_riders[diagonal] += step
+        if ANTI_DIAGONAL in riders:
+            self._anti_diagonal_riders[anti_diagonal] += step
+        for row_offset, column_offset in LEAPS.get(symbol, ()):
+            target = (row + row_offset, column + column_offset)
+            if 0 <= target[0] < self.rows and 0 <= target[1] < self.columns:
+                leaps = self._leaps.get(target, 0) + step
+                if leaps:
+                    self._leaps[target] = leaps
+                else:
+                    del self._leaps[target]
+
 
 class Cell(object):
     """
     Represents a cell of the board.
     """
-    def __init__(self, row, column):
+    def __init__(self, row, column, index=None):
         """
         Initializes a new instance of the Cell class.
         :param row: An integer that represents the row of the cell.
         :param column: An integer that represents the column of the cell.
+        :param index: An instance of the AttackIndex class
+        the attacks on the cell are read from.
         :return: A new instance of the Cell class.
         """
-        self.attacks = 0
         self.piece = None
-        self.taken = False
         self._row = row
         self._column = column
+        self._index = index
 
     def __str__(self):
         """
@@ -33,6 +249,27 @@ class Cell(object):
             return str(self.piece)
         return str(self.attacks)
 
+    @property
+    def attacks(self):
+        """
+        Gets the number of the pieces that attack the cell.
+        :return: An integer.
+        """
+        if self._index is None:
+            return 0
+        return self._index.count_attacks(self._row, self._column)
+
+    @property
+    def taken(self):
+        """
+        Indicates whether a piece that attacks its whole
+        column stands on the column of the cell.
+        :return: A boolean.
+        """
+        if self._index is None:
+            return False
+        return self._index.is_column_ridden(self._column)
+
     @property
     def available(self):
         """
@@ -63,7 +300,7 @@ class Board(object):
     Represents a chess board with MxN dimensions
     and a set of pieces to be placed on it.
     """
-    def __init__(self, rows, columns, pieces):
+    def __init__(self, rows, columns, pieces, seed=None):
         """
         Initializes A Board instance with MxN dimensions and a list of pieces.
 
@@ -72,13 +309,16 @@ class Board(object):
         :param columns: An Integer that represents the
         number of columns of the board.
         :param pieces: A list that holds the chess pieces on the board.
+        :param seed: An integer that makes the order in which the pieces
+        are placed on each lap reproducible, it is random when not passed.
         :return: A new instance of Board class.
         """
         self.rows = rows
         self.columns = columns
         self.pieces = pieces
-        self.matrix = [[Cell(row, column) for column in xrange(self.columns)]
-                       for row in xrange(self.rows)]
+        self.seed = seed
+        self._index = AttackIndex(rows, columns)
+        self._create_cells()
         for piece in self.pieces:
             piece.board = self
             row, column = self.get_next_available_position()
@@ -92,6 +332,24 @@ class Board(object):
         self.calculate_attacks()
         super(Board, self).__init__()
 
+    def _create_cells(self):
+        """
+        Creates the cells of the board.
+        :return: None.
+        """
+        self.matrix = [[Cell(row, column, self._index)
+                        for column in xrange(self.columns)]
+                       for row in xrange(self.rows)]
+
+    def _get_cell(self, row, column):
+        """
+        Returns the cell in a position that is known to be on the board.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: An instance of the Cell class.
+        """
+        return self.matrix[row][column]
+
     @property
     def cache(self):
         """
@@ -116,7 +374,7 @@ class Board(object):
             raise InvalidArgumentException(
                 "piece column number is bigger than board column capacity"
             )
-        return self.matrix[row][column]
+        return self._get_cell(row, column)
 
     def __setitem__(self, pos, value):
         """
@@ -134,14 +392,17 @@ class Board(object):
             raise InvalidMoveException(
                 "piece column number is bigger than board column capacity"
             )
-        cell = self.matrix[row][column]
+        cell = self._get_cell(row, column)
         if value and not cell.available:
             raise InvalidMoveException(
                 "cannot place the piece, spot already occupied"
             )
+        if cell.piece:
+            self._index.remove(cell.piece.symbol, row, column)
         cell.piece = value
         if value:
             value.set_position(row, column)
+            self._index.add(value.symbol, row, column)
 
     def __str__(self):
         """
@@ -167,6 +428,16 @@ class Board(object):
                  else "0" for cell in row]))
         return '\n'.join(parts) + '\n'
 
+    def get_placement(self):
+        """
+        Returns the positions of the pieces on the board
+        without walking through its cells.
+        :return: A tuple of (row, column, symbol) triples
+        sorted by their position.
+        """
+        return tuple(sorted((piece.row, piece.column, str(piece))
+                            for piece in self.pieces))
+
     def get_hash(self, index=None, row=None, column=None):
         """
         Returns a signature that represents a certain
@@ -234,20 +505,76 @@ class Board(object):
                     moves.append((cell.row, cell.column))
         return moves
 
+    def get_safe_postions(self, piece):
+        """
+        Returns the non-occupied positions where a piece would neither
+        be attacked by the other pieces nor attack any of them.
+        :param piece: An instance of the Piece class on the board.
+        :return: A list of tuples that represents the safe positions.
+        """
+        # the piece is left out of the index while the cells are checked
+        self._index.remove(piece.symbol, piece.row, piece.column)
+        try:
+            return [(row, column)
+                    for row, column in self.get_available_postions()
+                    if not self._index.is_attacked(row, column) and
+                    not self._index.attacks_any(piece.symbol, row, column)]
+        finally:
+            self._index.add(piece.symbol, piece.row, piece.column)
+
+    def choose_strategy(self):
+        """
+        Chooses the way the destinations of the pieces are found for
+        the size of the board and the density of its pieces.
+        :return: One of MOVES, FREE and SAFE.
+        """
+        cells = self.rows * self.columns
+        if cells <= AUTO_FREE_CELLS:
+            return FREE
+        if len(self.pieces) * AUTO_SAFE_DENSITY <= cells:
+            return SAFE
+        return MOVES
+
+    def get_candidates(self, piece, strategy):
+        """
+        Returns the destinations a piece is tried on while exploring.
+        :param piece: An instance of the Piece class on the board.
+        :param strategy: One of MOVES, FREE and SAFE.
+        :return: An iterable of (row, column) tuples.
+        """
+        if strategy == MOVES:
+            return piece.get_moves()
+        if strategy == FREE:
+            return self.get_available_postions()
+        return self.get_safe_postions(piece)
+
     def calculate_attacks(self):
         """
-        Calculates the attacks from other pieces for every piece on the board.
+        Does nothing, the attacks and the taken columns of the
+        cells are always up to date through the attack index.
         :return: None.
         """
-        for row in self.matrix:
-            for cell in row:
-                cell.attacks = 0
-        for piece in self.pieces:
-            piece.update_column_status()
-            moves = piece.get_moves()
-            for move in moves:
-                if not move.count(None):
-                    self[move[0], move[1]].attacks += 1
+        pass
+
+    def is_attacked(self, row, column):
+        """
+        Checks if any piece on the board attacks a cell.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: A boolean.
+        """
+        return self._index.is_attacked(row, column)
+
+    def attacks_any(self, piece_type, row, column):
+        """
+        Checks if a piece of a certain type placed on a cell
+        would attack any of the pieces on the board.
+        :param piece_type: A piece class or instance.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: A boolean.
+        """
+        return self._index.attacks_any(piece_type.symbol, row, column)
 
     def has_attacked_piece(self):
         """
@@ -271,7 +598,11 @@ class Board(object):
         for piece in self.pieces:
             self[piece.row, piece.column] = None
         pieces = self.pieces[:]
-        random.shuffle(pieces)
+        if self.seed is None:
+            random.shuffle(pieces)
+        else:
+            random.Random(self.seed * self.rows * self.columns + lap).shuffle(
+                pieces)
         for piece in pieces:
             row, column = self.get_next_available_position(lap)
             if row is None or column is None:
@@ -282,7 +613,17 @@ class Board(object):
         self._cache[self.get_hash()] = True
         return True
 
-    def find_independent_configurations(self, verbose=False):
+    @property
+    def lap_count(self):
+        """
+        Returns the number of laps the search goes through, a lap
+        is the position from which the pieces start being placed.
+        :return: An integer.
+        """
+        return count_laps(self.rows, self.columns, len(self.pieces))
+
+    def find_independent_configurations(self, verbose=False, laps=None,
+                                        writer=None, strategy=MOVES):
         """
         Finds all the unique configurations of the pieces
         on the board where none of the pieces
@@ -290,50 +631,328 @@ class Board(object):
 
         :param verbose: decides whether to print execution
         information while finding the configurations or not.
-        :return: A list of all the unique configurations.
-        """
-        solutions = []
-        lap = 0
-        while True:
-            any_moved = False
-            for index, piece in enumerate(self.pieces):
-                # use get_moves() instead of get_available_postions()
-                # to use only legal moves which can make the algorithm faster
-                # but it can miss more solutions
-
-                moves = piece.get_moves()
-                # moves = self.get_available_postions()
-                destinations = []
-                for move in moves:
-                    if not piece.can_move(index, *move):
-                        continue
-
-                    if not len(destinations) or\
-                            self[move[0], move[1]].attacks <\
-                            self[destinations[0][0],
-                                 destinations[0][1]].attacks:
-                        destinations = [move]
-                    elif len(destinations) and\
-                            self[move[0], move[1]].attacks ==\
-                            self[destinations[0][0],
-                                 destinations[0][1]].attacks:
-                        destinations.append(move)
-
-                for destination in destinations:
-                    any_moved = True
-                    piece.move(*destination)
-                    self.calculate_attacks()
-                    self._cache[self.get_hash()] = True
-                    board_hash = self.get_hash()
-                    if not self.has_attacked_piece() and\
-                            board_hash not in solutions:
-                        if verbose:
-                            print self.print_board()
-                        solutions.append(board_hash)
-            if not any_moved:
-                lap += 1
-                self._cache = {}
-                if not self.reset_position(lap):
-                    break
-                self.calculate_attacks()
-        return solutions
+        :param laps: An iterable of the laps to explore,
+        all the laps of the board are explored by default.
+        :param writer: An instance of the SolutionWriter class
+        that the placement of every solution is written to.
+        :param strategy: One of STRATEGIES, the way the
+        destinations of the pieces are found.
+        :return: A list of the hashes of all the unique configurations,
+        the configurations with the same occupied cells share a hash.
+        """
+        return [board_hash
+                for board_hash in self.explore(verbose, laps, writer,
+                                               strategy)
+                if board_hash is not None]
+
+    def find_all_configurations(self, writer=None):
+        """
+        Finds all the unique configurations of the pieces exactly,
+        by enumerating the independent sets of the conflict graph
+        of the board size instead of moving the pieces around.
+
+        :param writer: An instance of the SolutionWriter class
+        that the placement of every solution is written to.
+        :return: A list of the placements of all the unique
+        configurations, sorted tuples of (row, column, symbol) triples.
+        """
+        return list(self.iter_all_configurations(writer))
+
+    def iter_all_configurations(self, writer=None):
+        """
+        Enumerates all the unique configurations of the pieces exactly,
+        like find_all_configurations() without keeping them.
+
+        :param writer: An instance of the SolutionWriter class
+        that the placement of every solution is written to.
+        :return: A generator of the placements of the unique
+        configurations, sorted tuples of (row, column, symbol) triples.
+        """
+        graph = get_conflict_graph(self.rows, self.columns)
+        for placement in graph.iter_independent_sets(
+                count_pieces(self.pieces)):
+            if writer:
+                writer.write(placement)
+            yield placement
+
+    def explore(self, verbose=False, laps=None, writer=None,
+                strategy=MOVES, deduplicate=True):
+        """
+        Explores the configurations of the pieces on the board one move
+        at a time, so the search can be suspended between any two moves.
+
+        :param verbose: decides whether to print execution
+        information while finding the configurations or not.
+        :param laps: An iterable of the laps to explore,
+        all the laps of the board are explored by default.
+        :param writer: An instance of the SolutionWriter class
+        that the placement of every solution is written to.
+        :param strategy: One of STRATEGIES, the way the destinations
+        of the pieces are found: the moves of the piece are the
+        fastest but miss the most solutions, all the free cells miss
+        the fewest but are the slowest.
+        :param deduplicate: decides whether the placements of the
+        solutions are kept so every solution is only yielded and written
+        once, a solution found again is yielded and written again
+        otherwise.
+        :return: A generator that yields the hash of every new unique
+        configuration and None after any other explored move, the
+        configurations are told apart by their placements since
+        their hashes only hold the occupied cells.
+        """
+        if strategy not in STRATEGIES:
+            raise InvalidArgumentException(
+                "unknown strategy %s" % strategy
+            )
+        if strategy == AUTO:
+            strategy = self.choose_strategy()
+        # the placements of the solutions found so far
+        solutions = set()
+        if laps is None:
+            laps = xrange(self.lap_count)
+        for lap in laps:
+            self._cache = {}
+            if not self.reset_position(lap):
+                raise InvalidArgumentException(
+                    "lap %d is outside the board" % lap
+                )
+            any_moved = True
+            while any_moved:
+                any_moved = False
+                for index, piece in enumerate(self.pieces):
+                    moves = self.get_candidates(piece, strategy)
+                    destinations = []
+                    for move in moves:
+                        if not piece.can_move(index, *move):
+                            continue
+
+                        if not len(destinations) or\
+                                self[move[0], move[1]].attacks <\
+                                self[destinations[0][0],
+                                     destinations[0][1]].attacks:
+                            destinations = [move]
+                        elif len(destinations) and\
+                                self[move[0], move[1]].attacks ==\
+                                self[destinations[0][0],
+                                     destinations[0][1]].attacks:
+                            destinations.append(move)
+
+                    for destination in destinations:
+                        any_moved = True
+                        piece.move(*destination)
+                        board_hash = self.get_hash()
+                        self._cache[board_hash] = True
+                        placement = None
+                        if not self.has_attacked_piece():
+                            placement = self.get_placement()
+                        if placement is not None and\
+                                placement not in solutions:
+                            if verbose:
+                                print self.print_board()
+                            if writer:
+                                writer.write(placement)
+                            if deduplicate:
+                                solutions.add(placement)
+                            yield board_hash
+                        else:
+                            yield None
+
+
+class SparseCell(object):
+    """
+    Represents a view of a cell of a sparse board, the piece of the
+    cell is kept by the board and the attacks and the taken flag are
+    read from its attack index.
+    """
+    def __init__(self, row, column, board):
+        """
+        Initializes a new instance of the SparseCell class.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :param board: An instance of the SparseBoard class.
+        :return: A new instance of the SparseCell class.
+        """
+        self._row = row
+        self._column = column
+        self._board = board
+        super(SparseCell, self).__init__()
+
+    def __str__(self):
+        """
+        :return: A string of the piece type if the cell is occupied,
+        otherwise, it returns the number of the attacks the cell has.
+        """
+        if self.piece:
+            return str(self.piece)
+        return str(self.attacks)
+
+    @property
+    def piece(self):
+        """
+        Gets the piece on the cell.
+        :return: An instance of the Piece class, or None.
+        """
+        return self._board.occupied.get((self._row, self._column))
+
+    @piece.setter
+    def piece(self, value):
+        """
+        Sets the piece on the cell.
+        :param value: An instance of the Piece class, or None.
+        :return: None.
+        """
+        if value:
+            self._board.occupied[self._row, self._column] = value
+        else:
+            self._board.occupied.pop((self._row, self._column), None)
+
+    @property
+    def taken(self):
+        """
+        Indicates whether a piece that attacks its whole
+        column stands on the column of the cell.
+        :return: A boolean.
+        """
+        return self._board.index.is_column_ridden(self._column)
+
+    @property
+    def attacks(self):
+        """
+        Gets the number of the pieces that attack the cell.
+        :return: An integer.
+        """
+        return self._board.index.count_attacks(self._row, self._column)
+
+    @property
+    def available(self):
+        """
+        Indicates whether the cell is occupied with a piece or not.
+        :return: A boolean.
+        """
+        return not self.piece
+
+    @property
+    def row(self):
+        """
+        Gets the current row of the cell.
+        :return: An integer that represents the row of the cell.
+        """
+        return self._row
+
+    @property
+    def column(self):
+        """
+        Gets the current column of the cell.
+        :return: An integer that represents the column of the cell.
+        """
+        return self._column
+
+
+class SparseBoard(Board):
+    """
+    Represents a chess board that only stores its occupied cells,
+    the other cells are created as views when they are accessed, so
+    its size does not depend on the number of the cells.
+    """
+    def _create_cells(self):
+        """
+        Creates the store of the occupied cells.
+        :return: None.
+        """
+        self.matrix = None
+        self.occupied = {}
+
+    def _get_cell(self, row, column):
+        """
+        Returns a view of the cell in a position that is known
+        to be on the board.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: An instance of the SparseCell class.
+        """
+        return SparseCell(row, column, self)
+
+    @property
+    def index(self):
+        """
+        Gets the attack index of the board.
+        :return: An instance of the AttackIndex class.
+        """
+        return self._index
+
+    def __str__(self):
+        """
+        Prints the board with its pieces and all the
+        attacks on boards different positions.
+        :return: A string.
+        """
+        parts = []
+        for row in xrange(self.rows):
+            parts.append(' '.join([str(self._get_cell(row, column))
+                                   for column in xrange(self.columns)]))
+        return '\n'.join(parts) + '\n'
+
+    def print_board(self):
+        """
+        Prints the board with its pieces in a Friendly way.
+        :return: A string.
+        """
+        parts = []
+        for row in xrange(self.rows):
+            parts.append(' '.join(
+                [str(self.occupied[row, column])
+                 if (row, column) in self.occupied
+                 else "0" for column in xrange(self.columns)]))
+        return '\n'.join(parts) + '\n'
+
+    def get_hash(self, index=None, row=None, column=None):
+        """
+        Returns a signature that represents a certain
+        distribution of the pieces on the board, the same
+        one Board.get_hash() returns.
+        :param index: An integer that represents the piece
+        that needs to replaced by the (row, column) piece.
+        :param row: An integer that represents the
+        row of the replacing piece.
+        :param column: An integer that represents the
+        column of the replacing piece.
+        :return: a Long value that represents the
+        distribution of the pieces on the board.
+        """
+        positions = set(self.occupied)
+        if index is not None:
+            test = self.pieces[index]
+            positions.discard((test.row, test.column))
+        if row is not None and column is not None:
+            positions.add((row, column))
+        result = 0L
+        step = max(self.rows, self.columns).bit_length()
+        for position_row, position_column in sorted(positions):
+            result <<= step
+            result |= position_row + 1
+            result <<= step
+            result |= position_column + 1
+        return result
+
+    def get_next_available_position(self, lap=0):
+        """
+        Returns the first non-occupied position on the board after the offset.
+        :param lap: An offset to start from.
+        :return: A tuple that represents the first available position.
+        """
+        for cell in xrange(lap, self.rows * self.columns):
+            position = divmod(cell, self.columns)
+            if position not in self.occupied:
+                return position
+        return None, None
+
+    def get_available_postions(self):
+        """
+        Returns all the non-occupied positions on the board lazily.
+        :return: A generator of tuples that represents
+        all the available positions.
+        """
+        for row in xrange(self.rows):
+            for column in xrange(self.columns):
+                if (row, column) not in self.occupied:
+                    yield row, column
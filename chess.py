@@ -5,11 +5,37 @@ with dimensions MxN where none of the pieces
 is in a position to take any of the others.
 """
 import optparse
+import os
 import time
 from chess_exceptions import InvalidSetupException, InvalidArgumentException,\
     InvalidMoveException, ChessException
-from board import Board
-from pieces import King, Queen, Bishop, Rook, Knight
+from board import Board, SparseBoard, STRATEGIES, MOVES
+from pieces import create_pieces, PIECE_TYPES
+import shards
+import daemon
+import parallel
+import profiling
+from output import FORMATS, open_writer, read_jsonl
+from external_sort import ExternalSorter
+from counting import count_configurations
+from row_profile import RowProfileCounter
+from fast_paths import dispatch_count
+from hybrid import HybridSolver
+from extension import extend_solutions
+from store import SolutionStore, parse_term
+from export import SolutionBuffer
+from sweep import parse_ranges, sweep_counts, render_table, parse_sizes,\
+    sweep_sizes, render_size_table
+from sampling import Sampler
+from min_conflicts import MinConflictsSolver
+from validate import verify_file
+from memory import MemoryReport
+
+# the number of the indexes of bad solutions verify prints
+VERIFY_LISTED = 10
+
+FAIRY_NAMES = [("Z", "amazons"), ("A", "archbishops"),
+               ("C", "chancellors"), ("L", "camels")]
 
 
 def parse_args():
@@ -17,7 +43,15 @@ def parse_args():
     Parse the command-line options of the game.
     :return: Tuple (Any, Any)
     """
-    parser = optparse.OptionParser("usage: %prog [options] pieces list")
+    parser = optparse.OptionParser(
+        "usage: %prog [options] pieces list\n"
+        "       %prog [options] split --shards N [-d DIRECTORY]\n"
+        "       %prog run-shard SHARD_FILE [-o RESULT_FILE]\n"
+        "       %prog merge RESULT_FILE... [-o OUTPUT_FILE]\n"
+        "       %prog extend SOLUTIONS_FILE --add PIECE [pieces list]\n"
+        "       %prog query SOLUTIONS_FILE [--having TERM] [--without TERM]\n"
+        "       %prog verify SOLUTIONS_FILE\n"
+        "       %prog daemon [--port PORT | --socket PATH] [--workers N]")
     parser.add_option("-m", "-m", dest="rows", default=8, type="int",
                       help="Number of rows of the board")
     parser.add_option("-n", "-n", dest="columns", default=8, type="int",
@@ -32,42 +66,587 @@ def parse_args():
                       help="Number of rooks on the board")
     parser.add_option("-N", "--knights", dest="knights", default=0, type="int",
                       help="Number of knights on the board")
+    parser.add_option("-Z", "--amazons", dest="amazons", default=0,
+                      type="int",
+                      help="Number of amazons (queen and knight) "
+                           "on the board")
+    parser.add_option("-A", "--archbishops", dest="archbishops", default=0,
+                      type="int",
+                      help="Number of archbishops (bishop and knight) "
+                           "on the board")
+    parser.add_option("-C", "--chancellors", dest="chancellors", default=0,
+                      type="int",
+                      help="Number of chancellors (rook and knight) "
+                           "on the board")
+    parser.add_option("-L", "--camels", dest="camels", default=0, type="int",
+                      help="Number of camels (3,1 leapers) on the board")
+    parser.add_option("-p", "--processes", dest="processes", default=1,
+                      type="int",
+                      help="Number of processes the laps are explored on")
+    parser.add_option("--exact", dest="exact", default=False,
+                      action="store_true",
+                      help="List all the configurations exactly with the "
+                           "conflict graph instead of moving the pieces")
+    parser.add_option("--strategy", dest="strategy", default=MOVES,
+                      type="choice", choices=STRATEGIES,
+                      help="Cells a piece is tried on when the pieces are "
+                           "moved around: \"moves\" of the piece, all "
+                           "the \"free\" cells, the \"safe\" free cells "
+                           "or \"auto\" to pick one for the board "
+                           "[default: %default]")
+    parser.add_option("--sparse", dest="sparse", default=False,
+                      action="store_true",
+                      help="Store only the occupied cells of the board, "
+                           "for boards with many more cells than pieces")
+    parser.add_option("--memory", dest="memory", default=False,
+                      action="store_true",
+                      help="Report the peak memory of the solve and the "
+                           "memory held by the cells, the cache, the "
+                           "pieces and the solutions of the board")
+    parser.add_option("--profile", dest="profile", default=None,
+                      help="File the profile of the run is written to, a "
+                           "summary of the time spent in each part of the "
+                           "solver is printed")
+    parser.add_option("--seed", dest="seed", default=None, type="int",
+                      help="Seed that makes the search reproducible")
+    parser.add_option("-c", "--count", dest="count", default=False,
+                      action="store_true",
+                      help="Count the configurations without listing them")
+    parser.add_option("--sample", dest="sample", default=None, type="int",
+                      help="Print a number of configurations drawn "
+                           "uniformly at random instead of listing them all")
+    parser.add_option("--first", dest="first", default=False,
+                      action="store_true",
+                      help="Find a single configuration with the "
+                           "min-conflicts search, for very large boards")
+    parser.add_option("--sweep", dest="sweep", default=None,
+                      help="Count the configurations of all the numbers of "
+                           "pieces in some ranges and print them as a "
+                           "table, e.g. \"K=0-3,Q=0-2,N=0-4\"")
+    parser.add_option("--sizes", dest="sizes", default=None,
+                      help="Count the configurations of the pieces on all "
+                           "the board sizes in a range on -p processes and "
+                           "print them as a table, e.g. \"3x3-10x10\"")
+    parser.add_option("--count-method", dest="count_method", default="auto",
+                      choices=["auto", "table", "rows", "hybrid"],
+                      help="How the configurations are counted: table "
+                           "(transposition table), rows (row by row, kings "
+                           "and knights only), hybrid (long-range pieces "
+                           "enumerated, kings and knights counted row by "
+                           "row) or auto")
+    parser.add_option("--table-size", dest="table_size", default=1000000,
+                      type="int",
+                      help="Maximum number of entries of the transposition "
+                           "table used when counting")
+    parser.add_option("-f", "--format", dest="format", default="grid",
+                      choices=sorted(FORMATS),
+                      help="Format the solutions are printed in: %s" %
+                      ', '.join(sorted(FORMATS)))
+    parser.add_option("--add", dest="add", default=None,
+                      choices=[symbol for symbol, _ in PIECE_TYPES],
+                      help="Type of the piece the extend command adds "
+                           "to the stored solutions")
+    parser.add_option("--having", dest="having", default=[],
+                      action="append",
+                      help="Query term the solutions must match, a piece "
+                           "on a cell like Q:3,4, \"*\" matches any type, "
+                           "row or column")
+    parser.add_option("--without", dest="without", default=[],
+                      action="append",
+                      help="Query term the solutions must not match")
+    parser.add_option("--shards", dest="shards", default=1, type="int",
+                      help="Number of shards to split the problem into")
+    parser.add_option("-d", "--directory", dest="directory", default=".",
+                      help="Directory where the shard files are written")
+    parser.add_option("-o", "--output", dest="output", default=None,
+                      help="File where the result is written")
+    parser.add_option("--array", dest="array", default=None,
+                      help="Binary file the solutions are written to as "
+                           "rows of cell indexes, it can be memory-mapped "
+                           "with NumPy")
+    parser.add_option("--sorted", dest="sorted", default=False,
+                      action="store_true",
+                      help="Write the solutions sorted and without "
+                           "repetitions, through sorted runs on disk")
+    parser.add_option("--run-size", dest="run_size", default=100000,
+                      type="int",
+                      help="Number of solutions kept in memory before "
+                           "they are written to a sorted run")
+    parser.add_option("--run-directory", dest="run_directory",
+                      default=None,
+                      help="Directory where the sorted runs are written, "
+                           "the temporary directory by default")
+    parser.add_option("--port", dest="port", default=8765, type="int",
+                      help="Localhost TCP port the daemon listens on")
+    parser.add_option("--socket", dest="socket", default=None,
+                      help="Unix socket the daemon listens on instead "
+                           "of the TCP port")
+    parser.add_option("--workers", dest="workers", default=None, type="int",
+                      help="Number of worker processes, defaults to "
+                           "the number of CPUs")
     return parser.parse_args()
 
 
-def main():
+def get_counts(options):
     """
-    Main function that initializes the program
+    Returns the number of pieces of each type passed in the options.
+    :param options: The parsed command-line options.
+    :return: A dict that maps a piece symbol to the number of pieces.
+    """
+    return {"K": options.kings, "Q": options.queens,
+            "B": options.bishops, "R": options.rooks,
+            "N": options.knights, "Z": options.amazons,
+            "A": options.archbishops, "C": options.chancellors,
+            "L": options.camels}
+
+
+def describe_counts(counts):
+    """
+    Describes the number of pieces of each type, the fairy
+    pieces are only mentioned when there are any.
+    :param counts: A dict that maps a piece symbol to the number of pieces.
+    :return: A string.
+    """
+    description = "kings: %d, queens: %d, bishops: %d, rooks: %d, " \
+                  "knights: %d" % (counts["K"], counts["Q"], counts["B"],
+                                   counts["R"], counts["N"])
+    for symbol, name in FAIRY_NAMES:
+        if counts.get(symbol):
+            description += ", %s: %d" % (name, counts[symbol])
+    return description
+
+
+def split(options):
+    """
+    Splits the problem passed in the options into shard files.
+    :param options: The parsed command-line options.
+    :return: None
+    """
+    descriptors = shards.split_problem(options.rows, options.columns,
+                                       get_counts(options), options.shards,
+                                       options.seed)
+    for descriptor in descriptors:
+        path = os.path.join(options.directory,
+                            "shard-%03d.json" % descriptor["shard"])
+        shards.save(descriptor, path)
+        print "Shard %d written to %s" % (descriptor["shard"], path)
+
+
+def run_shard(options, args):
+    """
+    Solves a single shard file and writes its result.
+    :param options: The parsed command-line options.
+    :param args: The positional arguments, the shard file path.
+    :return: None
+    """
+    if len(args) != 1:
+        raise InvalidArgumentException("run-shard expects one shard file")
+    path = args[0]
+    result = shards.run_shard(shards.load(path))
+    output = options.output or "%s.result.json" % os.path.splitext(path)[0]
+    shards.save(result, output)
+    print "Shard %d: %d solutions found, written to %s" %\
+        (result["shard"], result["count"], output)
+
+
+def merge(options, args):
+    """
+    Merges the results of all the shards of a problem.
+    :param options: The parsed command-line options.
+    :param args: The positional arguments, the shard result paths.
+    :return: None
+    """
+    solutions = shards.merge_results([shards.load(path) for path in args])
+    if options.output:
+        shards.save({"count": len(solutions), "solutions": solutions},
+                    options.output)
+    print "%d solutions found!" % len(solutions)
+
+
+def extend(options, args):
+    """
+    Extends the solutions stored in a JSON lines file with one more piece.
+    :param options: The parsed command-line options.
+    :param args: The positional arguments, the solutions file path.
+    :return: None
+    """
+    if len(args) != 1:
+        raise InvalidArgumentException("extend expects one solutions file")
+    if not options.add:
+        raise InvalidArgumentException("extend expects the piece to add")
+    rows = options.rows
+    columns = options.columns
+    with open(args[0]) as solutions_file:
+        solutions = extend_solutions(rows, columns, read_jsonl(solutions_file),
+                                     options.add)
+    with open_writer(options.output, rows, columns,
+                     options.format) as writer:
+        for placement in solutions:
+            writer.write(placement)
+    print "%d solutions found!" % len(solutions)
+
+
+def query(options, args):
+    """
+    Counts the solutions stored in a JSON lines file that match the
+    query passed in the options, and writes them to the output file.
+    :param options: The parsed command-line options.
+    :param args: The positional arguments, the solutions file path.
+    :return: None
+    """
+    if len(args) != 1:
+        raise InvalidArgumentException("query expects one solutions file")
+    store = SolutionStore.load(args[0], options.rows, options.columns)
+    include = [parse_term(term) for term in options.having]
+    exclude = [parse_term(term) for term in options.without]
+    print "%d of %d solutions match" % (store.count(include, exclude),
+                                        len(store))
+    if options.output:
+        with open_writer(options.output, options.rows, options.columns,
+                         options.format) as writer:
+            for placement in store.select(include, exclude):
+                writer.write(placement)
+
+
+def verify(options, args):
+    """
+    Checks the solutions stored in a binary solution file or a JSON
+    lines file, and reports the invalid and the repeated ones.
+    :param options: The parsed command-line options.
+    :param args: The positional arguments, the solutions file path.
+    :return: None
+    """
+    if len(args) != 1:
+        raise InvalidArgumentException("verify expects one solutions file")
+    report = verify_file(args[0], options.rows, options.columns)
+    print "%d solutions checked, %d invalid, %d duplicates" % (
+        report["count"], len(report["invalid"]), len(report["duplicates"]))
+    for name in ("invalid", "duplicates"):
+        if report[name]:
+            print "%s: %s%s" % (name.capitalize(),
+                                ", ".join(str(index) for index
+                                          in report[name][:VERIFY_LISTED]),
+                                ", ..." if len(report[name]) > VERIFY_LISTED
+                                else "")
+
+
+def serve(options):
+    """
+    Runs the solver daemon until it is interrupted.
+    :param options: The parsed command-line options.
+    :return: None
+    """
+    service = daemon.SolverService(options.workers)
+    server = daemon.create_server(service, options.port, options.socket)
+    print "Listening on %s" % (options.socket or
+                               "127.0.0.1:%d" % server.server_address[1])
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.close()
+        if options.socket and os.path.exists(options.socket):
+            os.remove(options.socket)
+
+
+def count(options, counts):
+    """
+    Counts the configurations of the problem passed in the options.
+    :param options: The parsed command-line options.
+    :param counts: A dict that maps a piece symbol to the number of pieces.
+    :return: None
+    """
+    rows = options.rows
+    columns = options.columns
+    method = options.count_method
+    if method == "auto":
+        total, method = dispatch_count(rows, columns, counts,
+                                       options.table_size)
+        print "Counted by: %s" % method
+    elif method == "rows":
+        counter = RowProfileCounter(rows, columns, counts)
+        total = counter.count()
+        print "Row profile: %d states at most" % counter.max_states
+    elif method == "hybrid":
+        total = HybridSolver(rows, columns, counts).count()
+    else:
+        total, counter = count_configurations(rows, columns, counts,
+                                              options.table_size)
+        table = counter.transpositions
+        print "Transposition table: %d entries, %.1f%% hit rate" %\
+            (len(table), table.hit_rate * 100)
+    print "%d solutions found!" % total
+
+
+def sample(options, counts):
+    """
+    Prints configurations of the problem passed in the
+    options drawn uniformly at random.
+    :param options: The parsed command-line options.
+    :param counts: A dict that maps a piece symbol to the number of pieces.
     :return: None
     """
-    (options, _) = parse_args()
-    kings = options.kings
-    queens = options.queens
-    bishops = options.bishops
-    rooks = options.rooks
-    knights = options.knights
+    rows = options.rows
+    columns = options.columns
+    sampler = Sampler(rows, columns, counts, options.seed, options.table_size)
+    print "%d solutions found!" % sampler.total
+    with open_writer(options.output, rows, columns,
+                     options.format) as writer:
+        for _ in xrange(options.sample):
+            writer.write(sampler.sample())
+    print "%d solutions sampled!" % options.sample
+
+
+def find_first(options, counts):
+    """
+    Prints a single configuration of the problem passed in
+    the options found by the min-conflicts search.
+    :param options: The parsed command-line options.
+    :param counts: A dict that maps a piece symbol to the number of pieces.
+    :return: None
+    """
+    rows = options.rows
+    columns = options.columns
+    solver = MinConflictsSolver(rows, columns, counts, options.seed)
+    placement = solver.solve()
+    if placement is None:
+        print "No solution found after %d moves and %d attempts" %\
+            (solver.steps, solver.attempts)
+        return
+    with open_writer(options.output, rows, columns,
+                     options.format) as writer:
+        writer.write(placement)
+    print "Solution found after %d moves and %d attempts" %\
+        (solver.steps, solver.attempts)
+
+
+def sweep(options):
+    """
+    Counts the configurations of all the numbers of pieces in the
+    ranges passed in the options and prints them as a table.
+    :param options: The parsed command-line options.
+    :return: None
+    """
+    print "Sweeping %s on a board with %d rows and %d columns (%dx%d)" %\
+        (options.sweep, options.rows, options.columns, options.rows,
+         options.columns)
+    results, counter = sweep_counts(options.rows, options.columns,
+                                    parse_ranges(options.sweep),
+                                    options.table_size)
+    print render_table(results),
+    table = counter.transpositions
+    print "Transposition table: %d entries, %.1f%% hit rate" %\
+        (len(table), table.hit_rate * 100)
+
+
+def sweep_dimensions(options):
+    """
+    Counts the configurations of the pieces passed in the options on
+    all the board sizes in a range and prints them as a table.
+    :param options: The parsed command-line options.
+    :return: None
+    """
+    counts = get_counts(options)
+    min_rows, max_rows, min_columns, max_columns = parse_sizes(options.sizes)
+    print "Sweeping the board sizes %s with %s" % (options.sizes,
+                                                   describe_counts(counts))
+    totals = sweep_sizes((min_rows, max_rows), (min_columns, max_columns),
+                         counts, options.processes, options.table_size)
+    table = render_size_table(totals)
+    if options.output:
+        with open(options.output, 'w') as table_file:
+            table_file.write(table)
+        print "Table written to %s" % options.output
+    else:
+        print table,
+
+
+def solve(options):
+    """
+    Solves the whole problem passed in the options.
+    :param options: The parsed command-line options.
+    :return: None
+    """
+    counts = get_counts(options)
     rows = options.rows
     columns = options.columns
     print "Initializing board with %d rows and %d columns (%dx%d)" %\
           (rows, columns, rows, columns)
-    print "Setting kings: %d, queens: %s, " \
-          "bishops: %d, rooks: %s, knights: %d" %\
-          (kings, queens, bishops, rooks, knights)
+    print "Setting %s" % describe_counts(counts)
 
-    pieces = []
-    pieces.extend([King() for _ in xrange(kings)])
-    pieces.extend([Queen() for _ in xrange(queens)])
-    pieces.extend([Bishop() for _ in xrange(bishops)])
-    pieces.extend([Rook() for _ in xrange(rooks)])
-    pieces.extend([Knight() for _ in xrange(knights)])
+    memory = MemoryReport() if options.memory else None
+    if memory:
+        memory.start()
+    board = solutions = None
+    if options.count:
+        count(options, counts)
+    elif options.sample is not None:
+        sample(options, counts)
+    elif options.first:
+        find_first(options, counts)
+    else:
+        board, solutions = list_solutions(options, counts)
+    if memory:
+        # the structures are measured once the peak is recorded
+        memory.stop()
+        if board is not None:
+            memory.measure_board(board, solutions)
+        elif solutions is not None:
+            memory.measure("solutions", solutions)
+        print memory.render()
 
-    start_time = time.time()
 
+def list_solutions(options, counts):
+    """
+    Lists all the solutions of the problem passed in the options.
+    :param options: The parsed command-line options.
+    :param counts: A dict that maps a piece symbol to the number of pieces.
+    :return: A tuple of the board the solutions were found on, None when
+    they were found on several processes, and the solutions, None when
+    they were written sorted.
+    """
+    rows = options.rows
+    columns = options.columns
+    board = None
+    if options.processes > 1:
+        if options.exact or options.sparse:
+            raise InvalidArgumentException(
+                "--exact and --sparse solve on a single process"
+            )
+    else:
+        board_type = SparseBoard if options.sparse else Board
+        board = board_type(rows, columns, create_pieces(counts),
+                           options.seed)
+    if options.array:
+        writer = SolutionBuffer(rows, columns, counts)
+    else:
+        writer = open_writer(options.output, rows, columns, options.format)
+    with writer:
+        solutions = find_solutions(options, counts, board, writer)
+    if options.array:
+        writer.save(options.array)
+    count = writer.count if solutions is None else len(solutions)
+    print "%d solutions found!" % count
+    return board, solutions
+
+
+def find_solutions(options, counts, board, writer):
+    """
+    Finds the solutions of the problem passed in the options
+    the way the options ask for.
+    :param options: The parsed command-line options.
+    :param counts: A dict that maps a piece symbol to the number of pieces.
+    :param board: An instance of the Board class, None when the laps
+    are explored on several processes.
+    :param writer: The writer the solutions are written to.
+    :return: A list of the solutions, None when they were written sorted.
+    """
+    if options.sorted:
+        write_sorted(options, counts, board, writer)
+        return None
+    if board is None:
+        return find_in_parallel(options, counts, writer)
+    if options.exact:
+        return board.find_all_configurations(writer)
+    return board.find_independent_configurations(
+        writer=writer, strategy=options.strategy)
+
+
+def find_in_parallel(options, counts, writer):
+    """
+    Explores the laps of the problem passed in the options on a pool
+    of processes.
+    :param options: The parsed command-line options.
+    :param counts: A dict that maps a piece symbol to the number of pieces.
+    :param writer: The writer the solutions are written to.
+    :return: A list of all the unique configurations.
+    """
+    return parallel.find_independent_configurations(
+        options.rows, options.columns, counts, options.processes,
+        options.seed or 0, strategy=options.strategy, writer=writer)
+
+
+def write_sorted(options, counts, board, writer):
+    """
+    Finds the solutions through the external sorter and writes them
+    sorted and without repetitions, the solutions are not kept in memory
+    on a single process.
+    :param options: The parsed command-line options.
+    :param counts: A dict that maps a piece symbol to the number of pieces.
+    :param board: An instance of the Board class, None when the laps
+    are explored on several processes.
+    :param writer: The writer the sorted solutions are written to.
+    :return: None
+    """
+    sorter = ExternalSorter(options.run_size, directory=options.run_directory)
     try:
-        board = Board(rows, columns, pieces)
+        if board is None:
+            find_in_parallel(options, counts, sorter)
+        else:
+            if options.exact:
+                solutions = board.iter_all_configurations(sorter)
+            else:
+                # the sorter drops the repeated solutions, their
+                # placements are not kept by the search
+                solutions = board.explore(writer=sorter,
+                                          strategy=options.strategy,
+                                          deduplicate=False)
+            for _ in solutions:
+                pass
+        for placement in sorter.merge():
+            writer.write(placement)
+    finally:
+        sorter.close()
+
 
-        solutions = board.find_independent_configurations(True)
-        print "%d solutions found!" % len(solutions)
+def run_command(options, args):
+    """
+    Runs the command passed in the arguments, the whole problem
+    is solved when no command is passed.
+    :param options: The parsed command-line options.
+    :param args: The positional arguments, the command and its arguments.
+    :return: None
+    """
+    command = args[0] if args else None
+    if command == "split":
+        split(options)
+    elif command == "run-shard":
+        run_shard(options, args[1:])
+    elif command == "merge":
+        merge(options, args[1:])
+    elif command == "extend":
+        extend(options, args[1:])
+    elif command == "query":
+        query(options, args[1:])
+    elif command == "verify":
+        verify(options, args[1:])
+    elif command == "daemon":
+        serve(options)
+    elif options.sweep:
+        sweep(options)
+    elif options.sizes:
+        sweep_dimensions(options)
+    else:
+        solve(options)
+
+
+def main():
+    """
+    Main function that initializes the program
+    :return: None
+    """
+    (options, args) = parse_args()
+
+    start_time = time.time()
+
+    try:
+        if options.profile:
+            stats = profiling.profile_call(run_command, (options, args),
+                                           options.profile)
+            print "Profile written to %s" % options.profile
+            print profiling.render_summary(stats)
+        else:
+            run_command(options, args)
 
     except InvalidSetupException, exp:
         print "Bad setup of board/pieces, error was: {%s}" % exp.message
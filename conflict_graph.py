@@ -0,0 +1,171 @@
+"""
+Includes the conflict graph of a board size and the enumerator of its
+independent sets. The vertices of the graph are the (piece type, cell)
+pairs and two of them are adjacent when the pieces would share the cell
+or one of them would attack the other, so the configurations of a
+problem are exactly the independent sets of the graph with the
+requested number of vertices of each type.
+
+The vertex of the type at index t of the graph and the cell c is the
+bit t * cells + c, so a set of vertices is a single integer bitset.
+"""
+from attacks import get_attack_table
+from counting import PLACEMENT_ORDER
+from chess_exceptions import InvalidArgumentException
+
+_GRAPHS = {}
+
+
+class ConflictGraph(object):
+    """
+    Represents the conflict graph of the piece types on a board size
+    as adjacency bitsets.
+    """
+    def __init__(self, rows, columns):
+        """
+        Initializes a new instance of the ConflictGraph class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :return: A new instance of the ConflictGraph class.
+        """
+        table = get_attack_table(rows, columns)
+        self.rows = rows
+        self.columns = columns
+        self.cells = table.cells
+        self.symbols = list(PLACEMENT_ORDER)
+        self.type_masks = [table.full_mask << (index * self.cells)
+                           for index in xrange(len(self.symbols))]
+        self.adjacency = []
+        for symbol in self.symbols:
+            for cell in xrange(self.cells):
+                neighbours = 0
+                for index, other in enumerate(self.symbols):
+                    block = 1 << cell | table.masks[symbol][cell] |\
+                        table.masks[other][cell]
+                    neighbours |= block << (index * self.cells)
+                self.adjacency.append(neighbours)
+        super(ConflictGraph, self).__init__()
+
+    def get_vertex(self, symbol, row, column):
+        """
+        Returns the vertex of a piece type on a cell.
+        :param symbol: A string that represents the type of the piece.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: An integer, the index of the bit of the vertex.
+        """
+        if symbol not in self.symbols:
+            raise InvalidArgumentException("unknown piece type: %s" % symbol)
+        return self.symbols.index(symbol) * self.cells +\
+            row * self.columns + column
+
+    def get_placement(self, vertices):
+        """
+        Returns the placement of a set of vertices.
+        :param vertices: An iterable of the indexes of the vertices.
+        :return: A sorted tuple of (row, column, symbol) triples.
+        """
+        placement = []
+        for vertex in vertices:
+            index, cell = divmod(vertex, self.cells)
+            placement.append((cell // self.columns, cell % self.columns,
+                              self.symbols[index]))
+        return tuple(sorted(placement))
+
+    def is_independent(self, placement):
+        """
+        Checks if none of the pieces of a placement conflicts
+        with another one.
+        :param placement: An iterable of (row, column, symbol) triples.
+        :return: A boolean.
+        """
+        taken = 0
+        for row, column, symbol in placement:
+            vertex = self.get_vertex(symbol, row, column)
+            if taken >> vertex & 1:
+                return False
+            taken |= self.adjacency[vertex]
+        return True
+
+    def iter_independent_sets(self, counts):
+        """
+        Enumerates the independent sets with a certain number of
+        vertices of each type. The search always branches on the type
+        with the fewest spare candidates (the minimum remaining values
+        heuristic), and places the pieces of a type in increasing cell
+        order so that every set is found once.
+        :param counts: A dict that maps a piece symbol to the
+        number of pieces of that type.
+        :return: A generator of sorted tuples of (row, column, symbol)
+        triples.
+        """
+        for symbol in counts:
+            if symbol not in self.symbols:
+                raise InvalidArgumentException(
+                    "unknown piece type: %s" % symbol
+                )
+        remaining = [counts.get(symbol, 0) for symbol in self.symbols]
+        candidates = 0
+        for index, count in enumerate(remaining):
+            if count:
+                candidates |= self.type_masks[index]
+        for vertices in self._iter_sets(remaining, candidates, []):
+            yield self.get_placement(vertices)
+
+    def _iter_sets(self, remaining, candidates, vertices):
+        """
+        Enumerates the independent sets that extend a partial one.
+        :param remaining: A list of the number of the remaining
+        vertices of each type.
+        :param candidates: An integer, the bitset of the vertices
+        that can still be added.
+        :param vertices: A list of the vertices added so far.
+        :return: A generator of lists of vertices.
+        """
+        current = None
+        slack = None
+        for index, count in enumerate(remaining):
+            if not count:
+                continue
+            spare = bin(candidates & self.type_masks[index]).count('1') -\
+                count
+            if spare < 0:
+                return
+            if slack is None or spare < slack:
+                current = index
+                slack = spare
+        if current is None:
+            yield list(vertices)
+            return
+
+        remaining[current] -= 1
+        available = candidates & self.type_masks[current]
+        others = candidates & ~self.type_masks[current]
+        while available:
+            bit = available & -available
+            available ^= bit
+            vertex = bit.bit_length() - 1
+            # the next pieces of the type only take the following cells
+            following = available if remaining[current] else 0
+            vertices.append(vertex)
+            for result in self._iter_sets(
+                    remaining,
+                    (others | following) & ~self.adjacency[vertex],
+                    vertices):
+                yield result
+            vertices.pop()
+        remaining[current] += 1
+
+
+def get_conflict_graph(rows, columns):
+    """
+    Returns the conflict graph of a board size, the graphs are built
+    once and kept for the next calls.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :return: An instance of the ConflictGraph class.
+    """
+    graph = _GRAPHS.get((rows, columns))
+    if graph is None:
+        graph = _GRAPHS[rows, columns] = ConflictGraph(rows, columns)
+    return graph
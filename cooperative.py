@@ -0,0 +1,90 @@
+"""
+Includes a solver that finds the configurations of a board in small
+slices of work, so it can be driven from an event loop (or any other
+scheduler) without blocking it for the whole search.
+
+For example, from a loop that supports scheduling callbacks:
+
+    def run_slice():
+        for solution in solver.step():
+            handle(solution)
+        if not solver.done:
+            loop.add_callback(run_slice)
+"""
+
+
+class CooperativeSolver(object):
+    """
+    Finds the unique configurations of a board a slice at a time.
+    """
+    def __init__(self, board, nodes=1000, laps=None):
+        """
+        Initializes a new instance of the CooperativeSolver class.
+        :param board: An instance of the Board class.
+        :param nodes: An integer that represents the default number of
+        moves explored by each slice of work.
+        :param laps: An iterable of the laps to explore,
+        all the laps of the board are explored by default.
+        :return: A new instance of CooperativeSolver class.
+        """
+        self.board = board
+        self.nodes = nodes
+        self.solutions = []
+        self.explored = 0
+        self.done = False
+        self.cancelled = False
+        self._search = board.explore(laps=laps)
+        super(CooperativeSolver, self).__init__()
+
+    def __iter__(self):
+        """
+        Iterates over the solutions, a slice of work at a time, the
+        caller gets the control back after every solution it receives.
+        :return: A generator of the solutions.
+        """
+        while not self.done:
+            for solution in self.step():
+                yield solution
+
+    def step(self, nodes=None):
+        """
+        Explores a slice of moves of the search.
+        :param nodes: An integer that represents the number of moves
+        to explore, the default of the solver is used when not passed.
+        :return: A list of the solutions found in this slice.
+        """
+        if self.done:
+            return []
+        found = []
+        for _ in xrange(nodes or self.nodes):
+            try:
+                board_hash = next(self._search)
+            except StopIteration:
+                self._release()
+                break
+            self.explored += 1
+            if board_hash is not None:
+                found.append(board_hash)
+        self.solutions.extend(found)
+        return found
+
+    def cancel(self):
+        """
+        Stops the search and releases the board it was working on,
+        the solutions found so far are kept.
+        :return: None.
+        """
+        if not self.done:
+            self.cancelled = True
+            self._search.close()
+            self._release()
+
+    def _release(self):
+        """
+        Marks the search as done and drops its references to the board.
+        :return: None.
+        """
+        self.done = True
+        self.board.cache.clear()
+        self.board = None
+        self._search = None
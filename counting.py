@@ -0,0 +1,280 @@
+"""
+Includes the counting engine, it finds the number of the unique
+configurations of a problem without enumerating them.
+
+A partial placement is reduced to the cells each remaining piece type
+can still take (the cells that are free, not attacked by the placed
+pieces and from which the piece would not attack them) and the number
+of the remaining pieces of each type. Many partial placements reduce
+to the same residual problem, so its count is kept in a transposition
+table and reused.
+"""
+from collections import OrderedDict
+from attacks import get_attack_table
+from chess_exceptions import InvalidArgumentException
+
+# the most constraining types go first, they prune the search earlier
+PLACEMENT_ORDER = "ZCAQRBLNK"
+
+
+class TranspositionTable(object):
+    """
+    Represents a bounded cache of the counts of residual problems,
+    the least recently used entries are evicted first.
+    """
+    def __init__(self, size=1000000):
+        """
+        Initializes a new instance of the TranspositionTable class.
+        :param size: An integer that represents the maximum
+        number of the entries of the table.
+        :return: A new instance of the TranspositionTable class.
+        """
+        if size < 1:
+            raise InvalidArgumentException("table size should be positive")
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        super(TranspositionTable, self).__init__()
+
+    def __len__(self):
+        """
+        :return: The number of the entries of the table.
+        """
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """
+        Returns the ratio of the lookups that found their entry.
+        :return: A float.
+        """
+        lookups = self.hits + self.misses
+        return float(self.hits) / lookups if lookups else 0.0
+
+    def get(self, key):
+        """
+        Looks up the count of a residual problem.
+        :param key: A hashable key of the residual problem.
+        :return: An integer, or None if the table does not hold it.
+        """
+        value = self._entries.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries[key] = value
+        return value
+
+    def put(self, key, value):
+        """
+        Stores the count of a residual problem.
+        :param key: A hashable key of the residual problem.
+        :param value: An integer.
+        :return: None.
+        """
+        self._entries[key] = value
+        if len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+
+class ConfigurationCounter(object):
+    """
+    Counts the unique configurations of a problem.
+    """
+    def __init__(self, rows, columns, counts, table_size=1000000):
+        """
+        Initializes a new instance of the ConfigurationCounter class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :param counts: A dict that maps a piece symbol to the
+        number of pieces of that type.
+        :param table_size: An integer that represents the maximum
+        number of the entries of the transposition table.
+        :return: A new instance of the ConfigurationCounter class.
+        """
+        for symbol in counts:
+            if symbol not in PLACEMENT_ORDER:
+                raise InvalidArgumentException(
+                    "unknown piece type: %s" % symbol
+                )
+        self.table = get_attack_table(rows, columns)
+        self.transpositions = TranspositionTable(table_size)
+        self.symbols = [symbol for symbol in PLACEMENT_ORDER
+                        if counts.get(symbol)]
+        self.counts = tuple(counts[symbol] for symbol in self.symbols)
+        self._masks = [self.table.masks[symbol] for symbol in self.symbols]
+        super(ConfigurationCounter, self).__init__()
+
+    def count(self, masks=None):
+        """
+        Counts the configurations of the problem.
+        :param masks: A list of the bitmasks of the cells each piece
+        type can take, in the order of the symbols of the counter,
+        all the cells of the board are available by default.
+        :return: An integer.
+        """
+        if masks is None:
+            masks = [self.table.full_mask] * len(self.symbols)
+        return self.count_state(self.counts, tuple(masks))
+
+    def count_state(self, remaining, masks):
+        """
+        Counts the completions of a residual problem.
+        :param remaining: A tuple of the number of the remaining
+        pieces of each type, in the order of the symbols of the counter.
+        :param masks: A tuple of the bitmasks of the cells each
+        piece type can take, in the same order.
+        :return: An integer.
+        """
+        current = next((index for index, count in enumerate(remaining)
+                        if count), None)
+        if current is None:
+            return 1
+        for index in xrange(current, len(remaining)):
+            if bin(masks[index]).count('1') < remaining[index]:
+                return 0
+        key = (remaining, masks)
+        total = self.transpositions.get(key)
+        if total is not None:
+            return total
+
+        total = 0
+        next_remaining = list(remaining)
+        next_remaining[current] -= 1
+        next_remaining = tuple(next_remaining)
+        available = masks[current]
+        while available:
+            bit = available & -available
+            available ^= bit
+            total += self.count_state(
+                next_remaining,
+                self.place(current, bit, next_remaining, masks, available))
+        self.transpositions.put(key, total)
+        return total
+
+    def get_masks(self, placement):
+        """
+        Returns the cells each piece type of the counter can take
+        once the pieces of a placement are on the board.
+        :param placement: An iterable of (row, column, symbol) triples,
+        the pieces can be of any type.
+        :return: A tuple of bitmasks, in the order of the symbols of the
+        counter.
+        """
+        masks = [self.table.full_mask] * len(self.symbols)
+        for row, column, symbol in placement:
+            cell = row * self.table.columns + column
+            taken = 1 << cell | self.table.get_mask(symbol, cell)
+            for index, symbol_masks in enumerate(self._masks):
+                masks[index] &= ~(taken | symbol_masks[cell])
+        return tuple(masks)
+
+    def iter_states(self, types=None, masks=None):
+        """
+        Enumerates the placements of the pieces of the first types
+        of the counter, placing the pieces of a type in
+        increasing cell order.
+        :param types: An integer, the number of the types to place,
+        all the types are placed by default.
+        :param masks: A list of the bitmasks of the cells each piece
+        type can take, all the cells are available by default.
+        :return: A generator of (placement, masks) tuples, the placement
+        being a sorted tuple of (row, column, symbol) triples and the masks
+        being the cells each type can still take.
+        """
+        if types is None:
+            types = len(self.symbols)
+        if masks is None:
+            masks = [self.table.full_mask] * len(self.symbols)
+        for cells, state_masks in self._iter_states(self.counts, tuple(masks),
+                                                    types, []):
+            columns = self.table.columns
+            yield tuple(sorted((cell // columns, cell % columns, symbol)
+                               for cell, symbol in cells)), state_masks
+
+    def iter_placements(self, masks=None):
+        """
+        Enumerates the configurations of the problem.
+        :param masks: A list of the bitmasks of the cells each piece
+        type can take, all the cells are available by default.
+        :return: A generator of the placements of the configurations,
+        sorted tuples of (row, column, symbol) triples.
+        """
+        for placement, _ in self.iter_states(masks=masks):
+            yield placement
+
+    def _iter_states(self, remaining, masks, types, cells):
+        """
+        Enumerates the placements that extend a partial one.
+        :param remaining: A tuple of the number of the remaining
+        pieces of each type.
+        :param masks: A tuple of the bitmasks of the cells
+        each piece type can take.
+        :param types: An integer, the number of the types to place.
+        :param cells: A list of the (cell, symbol) tuples placed so far.
+        :return: A generator of (cells, masks) tuples.
+        """
+        current = next((index for index, count in enumerate(remaining)
+                        if count), None)
+        if current is None or current >= types:
+            yield list(cells), masks
+            return
+        if bin(masks[current]).count('1') < remaining[current]:
+            return
+        next_remaining = list(remaining)
+        next_remaining[current] -= 1
+        next_remaining = tuple(next_remaining)
+        available = masks[current]
+        while available:
+            bit = available & -available
+            available ^= bit
+            cells.append((bit.bit_length() - 1, self.symbols[current]))
+            for state in self._iter_states(
+                    next_remaining,
+                    self.place(current, bit, next_remaining, masks, available),
+                    types, cells):
+                yield state
+            cells.pop()
+
+    def place(self, current, bit, remaining, masks, available):
+        """
+        Returns the cells each piece type can take after
+        placing a piece of the current type.
+        :param current: An integer, the index of the type of the piece.
+        :param bit: An integer, the bitmask of the cell of the piece.
+        :param remaining: A tuple of the number of the remaining
+        pieces of each type after placing the piece.
+        :param masks: A tuple of the bitmasks of the cells
+        each piece type can take before placing the piece.
+        :param available: An integer, the bitmask of the cells the
+        next pieces of the current type can take, the pieces of the
+        same type are placed in increasing cell order.
+        :return: A tuple of bitmasks.
+        """
+        cell = bit.bit_length() - 1
+        taken = bit | self._masks[current][cell]
+        result = []
+        for index, count in enumerate(remaining):
+            if not count:
+                result.append(0)
+            else:
+                mask = available if index == current else masks[index]
+                result.append(mask & ~(taken | self._masks[index][cell]))
+        return tuple(result)
+
+
+def count_configurations(rows, columns, counts, table_size=1000000):
+    """
+    Counts the unique configurations of a problem.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :param counts: A dict that maps a piece symbol to the
+    number of pieces of that type.
+    :param table_size: An integer that represents the maximum
+    number of the entries of the transposition table.
+    :return: A tuple of the count and the counter, which holds
+    the statistics of the transposition table.
+    """
+    counter = ConfigurationCounter(rows, columns, counts, table_size)
+    return counter.count(), counter
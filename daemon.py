@@ -0,0 +1,272 @@
+"""
+Includes a long-running solver service that accepts problems as JSON
+lines over a localhost TCP port or a Unix socket, solves them on a pool
+of worker processes and streams the solutions back.
+
+A request is a single JSON line like:
+    {"rows": 4, "columns": 4, "pieces": {"K": 2, "R": 1}}
+and the response is one JSON line per solution, in the format of the
+JSON lines output, sent as soon as the lap it was found on is solved:
+    {"pieces": [["K", 0, 0], ["K", 0, 2], ["R", 2, 1]]}
+followed by a summary line:
+    {"count": 95, "cached": false}
+or an error line:
+    {"error": "..."}
+"""
+import json
+import multiprocessing
+import SocketServer
+import threading
+from collections import OrderedDict
+from board import MOVES, count_laps
+from pieces import PIECE_TYPES
+from parallel import solve_lap
+from output import SolutionWriter
+from chess_exceptions import ChessException, InvalidArgumentException,\
+    InvalidSetupException
+
+
+def get_key(problem):
+    """
+    Returns the key that identifies a problem, problems with
+    the same key have the same solutions.
+    :param problem: A dict with the rows, columns and pieces of the problem.
+    :return: A tuple.
+    """
+    try:
+        rows = int(problem["rows"])
+        columns = int(problem["columns"])
+        pieces = problem.get("pieces", {})
+        symbols = [symbol for symbol, _ in PIECE_TYPES]
+        for symbol in pieces:
+            if symbol not in symbols:
+                raise InvalidArgumentException(
+                    "unknown piece type: %s" % symbol
+                )
+        counts = tuple((str(symbol), int(pieces[symbol]))
+                       for symbol in symbols if pieces.get(symbol))
+    except (KeyError, TypeError, ValueError, AttributeError), exp:
+        raise InvalidArgumentException("malformed problem: %s" % exp)
+    return rows, columns, counts
+
+
+class _InFlight(object):
+    """
+    Represents a computation that requests for the same problem read
+    the solutions of as they are found.
+    """
+    def __init__(self):
+        """
+        Initializes a new instance of the _InFlight class.
+        :return: A new instance of _InFlight class.
+        """
+        self.solutions = []
+        self.done = False
+        self.error = None
+        self._condition = threading.Condition()
+        super(_InFlight, self).__init__()
+
+    def add(self, placements):
+        """
+        Adds the solutions found on a lap and wakes up the readers.
+        :param placements: A list of the placements of the solutions.
+        :return: None.
+        """
+        with self._condition:
+            self.solutions.extend(placements)
+            self._condition.notify_all()
+
+    def finish(self, error=None):
+        """
+        Marks the computation as over and wakes up the readers.
+        :param error: The exception the computation failed with, if any.
+        :return: None.
+        """
+        with self._condition:
+            self.error = error
+            self.done = True
+            self._condition.notify_all()
+
+    def iter_solutions(self):
+        """
+        Reads the solutions from the first one, waiting for the
+        ones that are not found yet.
+        :return: A generator of the placements of the solutions.
+        """
+        index = 0
+        while True:
+            with self._condition:
+                while index == len(self.solutions) and not self.done:
+                    self._condition.wait()
+                placements = self.solutions[index:]
+                done = self.done
+            for placement in placements:
+                yield placement
+            index += len(placements)
+            if done:
+                break
+        if self.error is not None:
+            raise self.error
+
+
+class SolverService(object):
+    """
+    Solves problems on a pool of worker processes, keeps the
+    recent results in memory and lets identical in-flight
+    requests share a single computation.
+    """
+    def __init__(self, workers=None, cache_size=128):
+        """
+        Initializes a new instance of the SolverService class.
+        :param workers: An integer that represents the number of worker
+        processes, the number of CPUs is used by default.
+        :param cache_size: An integer that represents the number of
+        results kept in memory.
+        :return: A new instance of SolverService class.
+        """
+        self.cache_size = cache_size
+        self._pool = multiprocessing.Pool(workers)
+        self._results = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        super(SolverService, self).__init__()
+
+    def solve(self, problem):
+        """
+        Solves a problem, reusing a recent or an in-flight computation.
+        :param problem: A dict with the rows, columns and
+        pieces of the problem.
+        :return: A tuple of an iterable of the placements of the
+        solutions, which yields them as the laps are solved, and a
+        boolean that tells whether the result came from the cache.
+        """
+        key = get_key(problem)
+        rows, columns, counts = key
+        if count_laps(rows, columns,
+                      sum(count for _, count in counts)) < 1:
+            raise InvalidSetupException(
+                "pieces number exceed the board capacity"
+            )
+        with self._lock:
+            if key in self._results:
+                solutions = self._results.pop(key)
+                self._results[key] = solutions
+                return solutions, True
+            in_flight = self._pending.get(key)
+            if in_flight is None:
+                in_flight = self._pending[key] = _InFlight()
+                thread = threading.Thread(target=self._run,
+                                          args=(key, in_flight))
+                thread.daemon = True
+                thread.start()
+        return in_flight.iter_solutions(), False
+
+    def _run(self, key, in_flight):
+        """
+        Solves the laps of a problem on the worker processes and
+        hands the new solutions of every lap to the requests.
+        :param key: A tuple that identifies the problem, see get_key().
+        :param in_flight: An instance of the _InFlight class.
+        :return: None.
+        """
+        rows, columns, counts = key
+        laps = count_laps(rows, columns, sum(count for _, count in counts))
+        tasks = [(rows, columns, dict(counts), None, lap, MOVES)
+                 for lap in xrange(laps)]
+        seen = set()
+        error = None
+        try:
+            for lap_solutions in self._pool.imap(solve_lap, tasks):
+                placements = []
+                for _, placement in lap_solutions:
+                    if placement not in seen:
+                        seen.add(placement)
+                        placements.append(placement)
+                in_flight.add(placements)
+        except Exception, exp:
+            error = exp
+        with self._lock:
+            del self._pending[key]
+            if error is None:
+                self._results[key] = in_flight.solutions
+                while len(self._results) > self.cache_size:
+                    self._results.popitem(last=False)
+        in_flight.finish(error)
+
+    def close(self):
+        """
+        Stops the worker processes.
+        :return: None.
+        """
+        self._pool.terminate()
+        self._pool.join()
+
+
+class SolverHandler(SocketServer.StreamRequestHandler):
+    """
+    Handles the JSON line requests of a single connection.
+    """
+    def handle(self):
+        """
+        Answers every request line of the connection.
+        :return: None.
+        """
+        for line in iter(self.rfile.readline, ''):
+            if not line.strip():
+                continue
+            try:
+                problem = json.loads(line)
+                rows, columns, _ = get_key(problem)
+                solutions, cached = self.server.service.solve(problem)
+                # every solution is sent as soon as it is written
+                with SolutionWriter(self.wfile, rows, columns, "jsonl",
+                                    buffer_size=1) as writer:
+                    for placement in solutions:
+                        writer.write(placement)
+            except (ChessException, ValueError), exp:
+                self._send({"error": str(exp)})
+                continue
+            self._send({"count": writer.count, "cached": cached})
+
+    def _send(self, message):
+        """
+        Writes a single JSON line to the connection.
+        :param message: A dict.
+        :return: None.
+        """
+        self.wfile.write(json.dumps(message) + '\n')
+        self.wfile.flush()
+
+
+class TCPSolverServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
+    """
+    Serves the solver over a TCP port.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class UnixSolverServer(SocketServer.ThreadingMixIn,
+                       SocketServer.UnixStreamServer):
+    """
+    Serves the solver over a Unix socket.
+    """
+    daemon_threads = True
+
+
+def create_server(service, port=None, socket_path=None, host="127.0.0.1"):
+    """
+    Creates a server that answers the requests with the passed service.
+    :param service: An instance of the SolverService class.
+    :param port: An integer that represents the TCP port to listen on.
+    :param socket_path: A string that represents the path of the Unix
+    socket to listen on, it is used instead of the port when passed.
+    :param host: A string that represents the address to listen on.
+    :return: A server instance.
+    """
+    if socket_path:
+        server = UnixSolverServer(socket_path, SolverHandler)
+    else:
+        server = TCPSolverServer((host, port or 0), SolverHandler)
+    server.service = service
+    return server
@@ -0,0 +1,221 @@
+"""
+Includes the flat solution buffer, it keeps the solutions of a problem
+as a single array of cell indexes instead of a Python object per
+solution, so they can be handed to NumPy without copying them.
+
+Every solution takes one row of as many cells as there are pieces, the
+pieces being ordered by their type (see PIECE_TYPES) and, within a type,
+by their cell, so a single vector of the piece types describes all the
+rows. The cell (row, column) is the index row * columns + column.
+
+The solution files hold a header and the rows as native 32-bit integers,
+so they can be memory-mapped as they are. NumPy is optional, the buffer
+and the files can be used without it.
+"""
+import os
+import struct
+from array import array
+from pieces import PIECE_TYPES
+from chess_exceptions import InvalidArgumentException, InvalidSetupException
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# magic, rows, columns and number of pieces, followed by the piece
+# types padded to a multiple of 4 bytes
+MAGIC = "CHSS"
+HEADER = struct.Struct("=4s3i")
+
+
+def _require_numpy():
+    """
+    Checks that NumPy is installed.
+    :return: None.
+    """
+    if numpy is None:
+        raise InvalidSetupException("numpy is required for the array views")
+
+
+class SolutionBuffer(object):
+    """
+    Represents the solutions of a problem as a flat array of cell indexes,
+    it has the write() method of SolutionWriter so the solvers can
+    write their solutions straight into it.
+    """
+    def __init__(self, rows, columns, counts):
+        """
+        Initializes a new instance of the SolutionBuffer class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :param counts: A dict that maps a piece symbol to the
+        number of pieces of that type.
+        :return: A new instance of the SolutionBuffer class.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.symbols = ''.join(symbol * counts.get(symbol, 0)
+                               for symbol, _ in PIECE_TYPES)
+        self.cells = array('i')
+        self._order = dict((symbol, index)
+                           for index, (symbol, _) in enumerate(PIECE_TYPES))
+        super(SolutionBuffer, self).__init__()
+
+    def __enter__(self):
+        """
+        :return: The buffer itself.
+        """
+        return self
+
+    def __exit__(self, *_):
+        """
+        Does nothing, the buffer is kept in memory.
+        :return: None.
+        """
+        pass
+
+    @property
+    def count(self):
+        """
+        Gets the number of the solutions in the buffer, like
+        SolutionWriter.count.
+        :return: An integer.
+        """
+        if not self.symbols:
+            return 0
+        return len(self.cells) // len(self.symbols)
+
+    def write(self, placement):
+        """
+        Appends a solution to the buffer.
+        :param placement: An iterable of (row, column, symbol) triples.
+        :return: None.
+        """
+        placement = list(placement)
+        for row, column, _ in placement:
+            # a cell off the board would wrap onto a cell of another row
+            if not (0 <= row < self.rows and 0 <= column < self.columns):
+                raise InvalidArgumentException(
+                    "the solution has a piece outside the board"
+                )
+        pieces = sorted((self._order.get(symbol, -1), row * self.columns +
+                         column, symbol) for row, column, symbol in placement)
+        if ''.join(symbol for _, _, symbol in pieces) != self.symbols:
+            raise InvalidArgumentException(
+                "the solution does not hold the pieces of the buffer"
+            )
+        self.cells.extend(cell for _, cell, _ in pieces)
+
+    def flush(self):
+        """
+        Does nothing, the buffer is kept in memory.
+        :return: None.
+        """
+        pass
+
+    def get_placement(self, index):
+        """
+        Returns a solution of the buffer.
+        :param index: An integer, the index of the solution.
+        :return: A sorted tuple of (row, column, symbol) triples.
+        """
+        size = len(self.symbols)
+        cells = self.cells[index * size:(index + 1) * size]
+        return tuple(sorted((cell // self.columns, cell % self.columns,
+                             symbol)
+                            for cell, symbol in zip(cells, self.symbols)))
+
+    def to_array(self):
+        """
+        Returns the solutions as a NumPy array that shares the memory
+        of the buffer, writing to the buffer afterwards may move it.
+        :return: An int32 array of shape (solutions, pieces).
+        """
+        _require_numpy()
+        if not self.cells:
+            return numpy.zeros((0, len(self.symbols)), dtype=numpy.int32)
+        return numpy.frombuffer(self.cells, dtype=numpy.int32).reshape(
+            self.count, len(self.symbols))
+
+    def get_types(self):
+        """
+        Returns the piece type of every column of the array.
+        :return: A NumPy array of one character strings.
+        """
+        _require_numpy()
+        return numpy.array(list(self.symbols), dtype='S1')
+
+    def save(self, path):
+        """
+        Writes the solutions to a file that can be memory-mapped.
+        :param path: A string that represents the path of the file.
+        :return: None.
+        """
+        with open(path, 'wb') as solutions_file:
+            solutions_file.write(HEADER.pack(MAGIC, self.rows, self.columns,
+                                             len(self.symbols)))
+            solutions_file.write(_pad(self.symbols))
+            self.cells.tofile(solutions_file)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads the solutions of a file into a new buffer.
+        :param path: A string that represents the path of the file.
+        :return: An instance of the SolutionBuffer class.
+        """
+        rows, columns, symbols, offset = read_header(path)
+        counts = {}
+        for symbol in symbols:
+            counts[symbol] = counts.get(symbol, 0) + 1
+        solutions = cls(rows, columns, counts)
+        with open(path, 'rb') as solutions_file:
+            solutions_file.seek(offset)
+            solutions.cells.fromstring(solutions_file.read())
+        return solutions
+
+
+def _pad(symbols):
+    """
+    Pads the piece types of a header to a multiple of 4 bytes.
+    :param symbols: A string of the piece types.
+    :return: A string.
+    """
+    return symbols + ' ' * (-len(symbols) % 4)
+
+
+def read_header(path):
+    """
+    Reads the header of a solution file.
+    :param path: A string that represents the path of the file.
+    :return: A tuple of the rows, the columns, the piece types
+    and the offset of the solutions in the file.
+    """
+    with open(path, 'rb') as solutions_file:
+        header = solutions_file.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise InvalidArgumentException("%s is not a solution file" % path)
+        magic, rows, columns, pieces = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise InvalidArgumentException("%s is not a solution file" % path)
+        symbols = solutions_file.read(pieces + -pieces % 4)[:pieces]
+    return rows, columns, symbols, HEADER.size + len(_pad(symbols))
+
+
+def open_memmap(path):
+    """
+    Maps the solutions of a file to a read-only NumPy array,
+    without reading them into memory.
+    :param path: A string that represents the path of the file.
+    :return: A tuple of the int32 array of shape (solutions, pieces)
+    and the piece type of every column.
+    """
+    _require_numpy()
+    _, _, symbols, offset = read_header(path)
+    types = numpy.array(list(symbols), dtype='S1')
+    if not symbols or os.path.getsize(path) == offset:
+        # an empty region cannot be mapped
+        return numpy.zeros((0, len(symbols)), dtype=numpy.int32), types
+    cells = numpy.memmap(path, dtype=numpy.int32, mode='r', offset=offset)
+    return cells.reshape(-1, len(symbols)), types
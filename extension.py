@@ -0,0 +1,63 @@
+"""
+Includes the extension of the solutions of a problem to the same
+problem with one more piece. A new piece can only go on the cells of a
+solution that are free, not attacked and from which it would not attack
+any piece, so the solutions of the larger problem are found from the
+stored ones without solving it again.
+"""
+from conflict_graph import get_conflict_graph
+
+
+def get_safe_cells(graph, placement, symbol):
+    """
+    Returns the cells a piece of a certain type can be added on
+    without attacking or being attacked by the pieces of a placement.
+    :param graph: An instance of the ConflictGraph class.
+    :param placement: An iterable of (row, column, symbol) triples.
+    :param symbol: A string that represents the type of the new piece.
+    :return: An integer bitmask of the cells.
+    """
+    offset = graph.get_vertex(symbol, 0, 0)
+    blocked = 0
+    for row, column, piece_symbol in placement:
+        blocked |= graph.adjacency[graph.get_vertex(piece_symbol, row,
+                                                    column)]
+    return ~(blocked >> offset) & ((1 << graph.cells) - 1)
+
+
+def iter_extensions(graph, placement, symbol):
+    """
+    Enumerates the placements made of a placement and a new piece.
+    :param graph: An instance of the ConflictGraph class.
+    :param placement: An iterable of (row, column, symbol) triples.
+    :param symbol: A string that represents the type of the new piece.
+    :return: A generator of sorted tuples of (row, column, symbol) triples.
+    """
+    placement = tuple(placement)
+    safe = get_safe_cells(graph, placement, symbol)
+    while safe:
+        bit = safe & -safe
+        safe ^= bit
+        cell = bit.bit_length() - 1
+        yield tuple(sorted(placement + ((cell // graph.columns,
+                                         cell % graph.columns, symbol),)))
+
+
+def extend_solutions(rows, columns, solutions, symbol):
+    """
+    Extends the solutions of a problem to the same problem with one
+    more piece of a certain type. A solution of the larger problem is
+    found once for every piece of the type it holds, so the extensions
+    are deduplicated.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :param solutions: An iterable of all the solutions of the problem,
+    tuples of (row, column, symbol) triples.
+    :param symbol: A string that represents the type of the new piece.
+    :return: A sorted list of the solutions of the larger problem.
+    """
+    graph = get_conflict_graph(rows, columns)
+    extended = set()
+    for placement in solutions:
+        extended.update(iter_extensions(graph, placement, symbol))
+    return sorted(extended)
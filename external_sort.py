@@ -0,0 +1,170 @@
+"""
+Includes the external sorter of the solutions, it keeps the solutions
+written to it in sorted runs on disk, so that more solutions than fit
+in memory can be sorted and deduplicated.
+
+The solutions are buffered in memory until the buffer holds a run, the
+run is then sorted and written to a temporary file. The runs are merged
+back k at a time, and the equal solutions, which come out of the merge
+next to each other, are only yielded once. A run holds a solution per
+line, its pieces written as "row,column,symbol" and separated by spaces.
+"""
+import heapq
+import os
+import shutil
+import tempfile
+from chess_exceptions import InvalidArgumentException
+
+
+def encode(placement):
+    """
+    Encodes a placement as a line of a run.
+    :param placement: A sorted tuple of (row, column, symbol) triples.
+    :return: A string.
+    """
+    return ' '.join("%d,%d,%s" % piece for piece in placement) + '\n'
+
+
+def decode(line):
+    """
+    Decodes a placement from a line of a run.
+    :param line: A string that encode() returned.
+    :return: A sorted tuple of (row, column, symbol) triples.
+    """
+    placement = []
+    for piece in line.split():
+        row, column, symbol = piece.split(',')
+        placement.append((int(row), int(column), symbol))
+    return tuple(placement)
+
+
+def read_run(path):
+    """
+    Reads the placements of a run.
+    :param path: A string that represents the path of the run file.
+    :return: A generator of the placements in the order of the run.
+    """
+    with open(path) as run_file:
+        for line in run_file:
+            yield decode(line)
+
+
+def unique(placements):
+    """
+    Skips the repetitions of the placements of a sorted sequence.
+    :param placements: A sorted iterable of placements.
+    :return: A generator of the different placements.
+    """
+    last = None
+    for placement in placements:
+        if placement != last:
+            yield placement
+            last = placement
+
+
+class ExternalSorter(object):
+    """
+    Sorts and deduplicates the solutions written to it on disk, it has
+    the write() method of SolutionWriter so the solvers can write their
+    solutions straight into it.
+    """
+    def __init__(self, run_size=100000, fan_in=64, directory=None):
+        """
+        Initializes a new instance of the ExternalSorter class.
+        :param run_size: An integer, the number of the solutions
+        kept in memory before they are written to a run.
+        :param fan_in: An integer, the number of the runs merged at once.
+        :param directory: A string, the directory the runs are written
+        in, the temporary directory of the system by default.
+        :return: A new instance of the ExternalSorter class.
+        """
+        if run_size < 1:
+            raise InvalidArgumentException("run size should be positive")
+        if fan_in < 2:
+            raise InvalidArgumentException("at least 2 runs are merged")
+        self.run_size = run_size
+        self.fan_in = fan_in
+        self.directory = directory
+        self.count = 0
+        self.runs = []
+        self._buffer = set()
+        self._run_directory = None
+        self._next_run = 0
+        super(ExternalSorter, self).__init__()
+
+    def __enter__(self):
+        """
+        :return: The sorter itself.
+        """
+        return self
+
+    def __exit__(self, *_):
+        """
+        Does nothing, the runs are kept until the sorter is closed.
+        :return: None.
+        """
+        pass
+
+    def write(self, placement):
+        """
+        Adds a solution to the buffer, the buffer is written
+        to a run when it is full.
+        :param placement: A sorted tuple of (row, column, symbol) triples.
+        :return: None.
+        """
+        self._buffer.add(tuple(placement))
+        self.count += 1
+        if len(self._buffer) >= self.run_size:
+            self._write_run(sorted(self._buffer))
+            self._buffer = set()
+
+    def flush(self):
+        """
+        Does nothing, the buffer is merged with the runs.
+        :return: None.
+        """
+        pass
+
+    def merge(self):
+        """
+        Merges the runs and the buffer.
+        :return: A generator of the different solutions in sorted order.
+        """
+        while len(self.runs) >= self.fan_in:
+            # merge the oldest runs into a new one until they can all
+            # be opened at once
+            merged = self.runs[:self.fan_in]
+            self.runs = self.runs[self.fan_in:]
+            self._write_run(unique(heapq.merge(*[read_run(path)
+                                                 for path in merged])))
+            for path in merged:
+                os.remove(path)
+        sources = [read_run(path) for path in self.runs]
+        sources.append(iter(sorted(self._buffer)))
+        return unique(heapq.merge(*sources))
+
+    def close(self):
+        """
+        Removes the runs.
+        :return: None.
+        """
+        if self._run_directory is not None:
+            shutil.rmtree(self._run_directory)
+            self._run_directory = None
+        self.runs = []
+        self._buffer = set()
+
+    def _write_run(self, placements):
+        """
+        Writes a sorted run to a new file.
+        :param placements: A sorted iterable of placements.
+        :return: None.
+        """
+        if self._run_directory is None:
+            self._run_directory = tempfile.mkdtemp(prefix="chess-runs-",
+                                                   dir=self.directory)
+        path = os.path.join(self._run_directory, "run-%06d" % self._next_run)
+        self._next_run += 1
+        with open(path, 'w') as run_file:
+            run_file.writelines(encode(placement) for placement in placements)
+        self.runs.append(path)
@@ -0,0 +1,120 @@
+"""
+Includes the dispatcher that answers the counting problems with a known
+or cheaply computable answer directly, and hands the rest to the
+counting engines.
+"""
+from counting import ConfigurationCounter
+from attacks import get_attack_table
+from row_profile import RowProfileCounter, SHORT_RANGE
+
+# the widest board side the kings and the knights are counted row by
+# row for, the states of a row grow exponentially with its width
+MAX_PROFILE_WIDTH = 12
+
+
+def binomial(total, chosen):
+    """
+    Returns the number of ways to choose a subset of a set.
+    :param total: An integer, the size of the set.
+    :param chosen: An integer, the size of the subset.
+    :return: An integer.
+    """
+    if chosen < 0 or chosen > total:
+        return 0
+    result = 1
+    for index in xrange(min(chosen, total - chosen)):
+        result = result * (total - index) // (index + 1)
+    return result
+
+
+def count_rooks(rows, columns, rooks):
+    """
+    Counts the placements of non-attacking rooks, every rook takes a row
+    and a column of its own: C(rows, k) * C(columns, k) * k!.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :param rooks: An integer that represents the number of rooks.
+    :return: An integer.
+    """
+    result = binomial(rows, rooks) * binomial(columns, rooks)
+    for index in xrange(2, rooks + 1):
+        result *= index
+    return result
+
+
+def count_bishops(rows, columns, bishops, table_size=1000000):
+    """
+    Counts the placements of non-attacking bishops. The bishops on the
+    light cells never attack the ones on the dark cells, so both colours
+    are counted on their own for every split of the bishops.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :param bishops: An integer that represents the number of bishops.
+    :param table_size: An integer that represents the maximum
+    number of the entries of the transposition tables.
+    :return: An integer.
+    """
+    light = 0
+    for cell in xrange(rows * columns):
+        if (cell // columns + cell % columns) % 2 == 0:
+            light |= 1 << cell
+    dark = get_attack_table(rows, columns).full_mask & ~light
+    light_counts = _count_colour(rows, columns, bishops, light, table_size)
+    dark_counts = _count_colour(rows, columns, bishops, dark, table_size)
+    return sum(light_counts[index] * dark_counts[bishops - index]
+               for index in xrange(bishops + 1))
+
+
+def _count_colour(rows, columns, bishops, mask, table_size):
+    """
+    Counts the placements of up to a number of bishops on cells of one colour.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :param bishops: An integer, the maximum number of bishops.
+    :param mask: An integer, the bitmask of the cells of the colour.
+    :param table_size: An integer that represents the maximum
+    number of the entries of the transposition tables.
+    :return: A list, the count of every number of bishops.
+    """
+    counts = [1]
+    for index in xrange(1, bishops + 1):
+        if not counts[-1]:
+            counts.append(0)
+            continue
+        counter = ConfigurationCounter(rows, columns, {"B": index}, table_size)
+        counts.append(counter.count([mask]))
+    return counts
+
+
+def dispatch_count(rows, columns, counts, table_size=1000000):
+    """
+    Counts the configurations of a problem with the
+    cheapest way that applies to it.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :param counts: A dict that maps a piece symbol to the
+    number of pieces of that type.
+    :param table_size: An integer that represents the maximum
+    number of the entries of the transposition table.
+    :return: A tuple of the count and the name of the way it was found.
+    """
+    counts = dict((symbol, count) for symbol, count in counts.items()
+                  if count)
+    pieces = sum(counts.values())
+    symbols = set(counts)
+    if pieces > rows * columns:
+        return 0, "capacity"
+    if not pieces:
+        return 1, "empty"
+    if pieces == 1:
+        return rows * columns, "single piece"
+    if symbols == set("R"):
+        return count_rooks(rows, columns, counts["R"]), "rooks"
+    if symbols == set("B"):
+        return count_bishops(rows, columns, counts["B"],
+                             table_size), "bishops by colour"
+    if symbols <= set(SHORT_RANGE) and\
+            min(rows, columns) <= MAX_PROFILE_WIDTH:
+        return RowProfileCounter(rows, columns, counts).count(), "row profile"
+    counter = ConfigurationCounter(rows, columns, counts, table_size)
+    return counter.count(), "transposition table"
@@ -0,0 +1,102 @@
+"""
+Includes the hybrid solver: the long-range pieces (queens, rooks and
+bishops) are enumerated, and for each of their placements the kings
+and knights are counted on the cells left to them by the row profile
+counter instead of being enumerated.
+"""
+from counting import ConfigurationCounter
+from row_profile import RowProfileCounter, SHORT_RANGE
+
+
+class HybridSolver(object):
+    """
+    Counts and lazily enumerates the configurations of a problem by
+    splitting its pieces into long-range and short-range ones.
+    """
+    def __init__(self, rows, columns, counts):
+        """
+        Initializes a new instance of the HybridSolver class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :param counts: A dict that maps a piece symbol to the
+        number of pieces of that type.
+        :return: A new instance of the HybridSolver class.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.counter = ConfigurationCounter(rows, columns, counts)
+        self.short_counts = dict((symbol, count)
+                                 for symbol, count in counts.items()
+                                 if count and symbol in SHORT_RANGE)
+        self._short_counter = ConfigurationCounter(rows, columns,
+                                                   self.short_counts)
+        self._long_types = len([symbol for symbol in self.counter.symbols
+                                if symbol not in SHORT_RANGE])
+        self._short_counts_cache = {}
+        self._patterns = {}
+        super(HybridSolver, self).__init__()
+
+    def count(self):
+        """
+        Counts the configurations of the problem.
+        :return: An integer.
+        """
+        return sum(self._count_short(masks) for _, masks
+                   in self.counter.iter_states(self._long_types))
+
+    def iter_long_placements(self):
+        """
+        Enumerates the placements of the long-range pieces.
+        :return: A generator of sorted tuples of (row, column, symbol) triples.
+        """
+        for placement, _ in self.counter.iter_states(self._long_types):
+            yield placement
+
+    def count_completions(self, long_placement):
+        """
+        Counts the placements of the kings and knights
+        that complete a placement of the long-range pieces.
+        :param long_placement: An iterable of (row, column, symbol) triples.
+        :return: An integer.
+        """
+        return self._count_short(self.counter.get_masks(long_placement))
+
+    def iter_completions(self, long_placement):
+        """
+        Enumerates the configurations that complete a
+        placement of the long-range pieces.
+        :param long_placement: An iterable of (row, column, symbol) triples.
+        :return: A generator of sorted tuples of (row, column, symbol) triples.
+        """
+        long_placement = tuple(long_placement)
+        masks = self._short_counter.get_masks(long_placement)
+        for placement in self._short_counter.iter_placements(masks):
+            yield tuple(sorted(long_placement + placement))
+
+    def iter_solutions(self):
+        """
+        Enumerates all the configurations of the problem.
+        :return: A generator of sorted tuples of (row, column, symbol) triples.
+        """
+        for long_placement in self.iter_long_placements():
+            for placement in self.iter_completions(long_placement):
+                yield placement
+
+    def _count_short(self, masks):
+        """
+        Counts the placements of the kings and knights on
+        the cells a placement of the long-range pieces leaves.
+        :param masks: A tuple of the bitmasks of the cells each type of
+        the counter can take.
+        :return: An integer.
+        """
+        short_masks = dict(zip(self.counter.symbols[self._long_types:],
+                               masks[self._long_types:]))
+        key = tuple(sorted(short_masks.items()))
+        count = self._short_counts_cache.get(key)
+        if count is None:
+            count = RowProfileCounter(self.rows, self.columns,
+                                      self.short_counts, short_masks,
+                                      self._patterns).count()
+            self._short_counts_cache[key] = count
+        return count
@@ -0,0 +1,156 @@
+"""
+Includes the memory report of a solve, it records the peak memory of
+the process and breaks down the memory held by the main structures of a
+board: its cells, its cache of the visited configurations, the pieces
+and the solutions found.
+
+The peak resident set size is read from the operating system. The peak
+of the Python heap is only known when the tracemalloc module is
+available, it is started with the report and slows the solve down. The
+structures are measured by summing the sizes of their objects, each
+object being counted once.
+"""
+import resource
+import sys
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def get_peak_rss(who=resource.RUSAGE_SELF):
+    """
+    Returns the peak resident set size of the process.
+    :param who: resource.RUSAGE_SELF for the process itself or
+    resource.RUSAGE_CHILDREN for the largest of its child processes.
+    :return: An integer, the number of bytes.
+    """
+    peak = resource.getrusage(who).ru_maxrss
+    # the peak is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def get_deep_size(obj, seen):
+    """
+    Sums the sizes of an object and of the objects it holds, the
+    items of the containers and the attributes of the instances.
+    :param obj: The object to measure.
+    :param seen: A set of the ids of the objects already
+    measured, they are not counted again.
+    :return: An integer, the number of bytes.
+    """
+    size = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            pending.extend(current.iterkeys())
+            pending.extend(current.itervalues())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        elif hasattr(current, "__dict__"):
+            pending.append(current.__dict__)
+    return size
+
+
+def format_size(size):
+    """
+    Formats a number of bytes with its unit.
+    :param size: An integer, the number of bytes.
+    :return: A string, e.g. "1.5 MB".
+    """
+    if size < 1024:
+        return "%d B" % size
+    for unit in ("KB", "MB", "GB"):
+        size /= 1024.0
+        if size < 1024 or unit == "GB":
+            return "%.1f %s" % (size, unit)
+
+
+class MemoryReport(object):
+    """
+    Records the peak memory of a solve and the memory
+    held by the structures of its board.
+    """
+    def __init__(self):
+        """
+        Initializes a new instance of the MemoryReport class.
+        :return: A new instance of the MemoryReport class.
+        """
+        self.peak_rss = None
+        self.peak_children_rss = None
+        self.peak_heap = None
+        self.structures = []
+        super(MemoryReport, self).__init__()
+
+    def start(self):
+        """
+        Starts tracing the allocations of the heap, when tracemalloc
+        is available.
+        :return: None.
+        """
+        if tracemalloc is not None:
+            tracemalloc.start()
+
+    def stop(self):
+        """
+        Records the peak memory of the process and stops tracing.
+        :return: None.
+        """
+        if tracemalloc is not None and tracemalloc.is_tracing():
+            _, self.peak_heap = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        self.peak_rss = get_peak_rss()
+        self.peak_children_rss = get_peak_rss(resource.RUSAGE_CHILDREN)
+
+    def measure(self, name, obj, seen=None):
+        """
+        Records the memory held by a structure.
+        :param name: A string that names the structure.
+        :param obj: The structure to measure.
+        :param seen: A set of the ids of the objects already measured.
+        :return: An integer, the number of bytes.
+        """
+        size = get_deep_size(obj, set() if seen is None else seen)
+        self.structures.append((name, size))
+        return size
+
+    def measure_board(self, board, solutions):
+        """
+        Records the memory held by the structures of a board. The
+        board and its attack index are left out of every structure,
+        so the objects shared by them are not counted over and over.
+        :param board: An instance of the Board class.
+        :param solutions: The solutions container of the solve.
+        :return: None.
+        """
+        seen = set([id(board), id(board._index)])
+        self.measure("pieces", board.pieces, seen)
+        if board.matrix is not None:
+            self.measure("cells", board.matrix, seen)
+        else:
+            self.measure("cells", board.occupied, seen)
+        self.measure("cache", board.cache, seen)
+        self.measure("solutions", solutions, seen)
+
+    def render(self):
+        """
+        Renders the report.
+        :return: A string.
+        """
+        lines = []
+        if self.peak_rss is not None:
+            lines.append("Peak RSS: %s" % format_size(self.peak_rss))
+        if self.peak_children_rss:
+            lines.append("Peak RSS of the child processes: %s" %
+                         format_size(self.peak_children_rss))
+        if self.peak_heap is not None:
+            lines.append("Peak heap: %s" % format_size(self.peak_heap))
+        for name, size in self.structures:
+            lines.append("  %s: %s" % (name, format_size(size)))
+        return '\n'.join(lines)
@@ -0,0 +1,316 @@
+"""
+Includes the min-conflicts solver, it looks for a single configuration
+of a problem instead of going through all of them, which makes it
+usable on boards far too large for the exhaustive search.
+
+All the pieces are put on the board first, then a piece that attacks
+or is attacked by others is repeatedly moved to the candidate cell
+with the fewest conflicts, the ties being broken at random. The
+candidate cells are the row and the column of the piece and a fixed
+number of random cells, each scored from an AttackIndex in constant
+time, so moving a piece costs O(rows + columns) rather than a pass
+over the whole board. The search starts over from a new random
+placement when it does not reach a configuration in time.
+
+The conflicts of every piece are kept up to date as the pieces move:
+placing or lifting a piece only changes the conflicts of the pieces on
+its row, column and diagonals and on the cells a leap away from it,
+which are found from the pieces kept by line and by cell. The
+conflicted pieces are kept in a list, so picking one does not go
+through all the pieces.
+"""
+import random
+from board import AttackIndex
+from pieces import PIECE_TYPES, RIDERS, LEAPS, HORIZONTAL, VERTICAL,\
+    DIAGONAL, ANTI_DIAGONAL
+from chess_exceptions import InvalidArgumentException, InvalidSetupException
+
+# the offsets a piece of every type leaps to, and those of all the types
+LEAP_SETS = dict((symbol, frozenset(leaps))
+                 for symbol, leaps in LEAPS.iteritems())
+ALL_LEAPS = frozenset(offset for leaps in LEAPS.itervalues()
+                      for offset in leaps)
+
+
+def count_pair_attacks(symbol, cell, target):
+    """
+    Counts the attacks of a piece on a cell, the same way the
+    AttackIndex counts them: once for the line they share if the piece
+    rides it, and once if the piece leaps to the cell.
+    :param symbol: A string that represents the type of the piece.
+    :param cell: A (row, column) tuple, the cell of the piece.
+    :param target: A (row, column) tuple, the attacked cell.
+    :return: An integer.
+    """
+    row, column = cell
+    target_row, target_column = target
+    riders = RIDERS.get(symbol, ())
+    attacks = 0
+    if row == target_row:
+        attacks += HORIZONTAL in riders
+    elif column == target_column:
+        attacks += VERTICAL in riders
+    elif row - column == target_row - target_column:
+        attacks += DIAGONAL in riders
+    elif row + column == target_row + target_column:
+        attacks += ANTI_DIAGONAL in riders
+    if (target_row - row, target_column - column) in LEAP_SETS[symbol]:
+        attacks += 1
+    return attacks
+
+
+class MinConflictsSolver(object):
+    """
+    Finds a single configuration of a problem with the min-conflicts search.
+    """
+    def __init__(self, rows, columns, counts, seed=None, max_steps=10000,
+                 restarts=10, samples=100):
+        """
+        Initializes a new instance of the MinConflictsSolver class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :param counts: A dict that maps a piece symbol to the
+        number of pieces of that type.
+        :param seed: An integer that makes the search reproducible.
+        :param max_steps: An integer, the number of the moves
+        tried before the search starts over.
+        :param restarts: An integer, the number of the times
+        the search starts over before giving up.
+        :param samples: An integer, the number of the random cells
+        considered for a move besides the row and the column of the piece.
+        :return: A new instance of the MinConflictsSolver class.
+        """
+        symbols = [symbol for symbol, _ in PIECE_TYPES]
+        for symbol in counts:
+            if symbol not in symbols:
+                raise InvalidArgumentException(
+                    "unknown piece type: %s" % symbol
+                )
+        if sum(counts.values()) > rows * columns:
+            raise InvalidSetupException(
+                "pieces number exceed the board capacity"
+            )
+        self.rows = rows
+        self.columns = columns
+        self.symbols = [symbol for symbol in symbols
+                        for _ in xrange(counts.get(symbol, 0))]
+        self.max_steps = max_steps
+        self.restarts = restarts
+        self.samples = samples
+        self.random = random.Random(seed)
+        self.steps = 0
+        self.attempts = 0
+        self._index = None
+        self._positions = None
+        self._conflicts = None
+        self._conflicted = None
+        self._conflicted_at = None
+        self._lines = None
+        self._cells = None
+        super(MinConflictsSolver, self).__init__()
+
+    def solve(self):
+        """
+        Looks for a configuration of the problem.
+        :return: A sorted tuple of (row, column, symbol) triples,
+        or None if no configuration was found.
+        """
+        self.steps = 0
+        self.attempts = 0
+        for _ in xrange(self.restarts + 1):
+            self.attempts += 1
+            self._place_all()
+            for _ in xrange(self.max_steps):
+                if not self._conflicted:
+                    return self.get_placement()
+                self.steps += 1
+                self._move(self.random.choice(self._conflicted))
+            if not self._conflicted:
+                return self.get_placement()
+        return None
+
+    def get_placement(self):
+        """
+        Returns the current placement of the pieces.
+        :return: A sorted tuple of (row, column, symbol) triples.
+        """
+        return tuple(sorted((row, column, symbol) for symbol, (row, column)
+                            in zip(self.symbols, self._positions)))
+
+    def get_conflicts(self, piece):
+        """
+        Returns the number of the attacks a piece is involved in.
+        :param piece: An integer, the index of the piece.
+        :return: An integer.
+        """
+        return self._conflicts[piece]
+
+    def _place_all(self):
+        """
+        Puts the pieces on the board one by one, each on the
+        candidate cell with the fewest conflicts.
+        :return: None.
+        """
+        self._index = AttackIndex(self.rows, self.columns)
+        self._positions = [None] * len(self.symbols)
+        self._conflicts = [0] * len(self.symbols)
+        self._conflicted = []
+        self._conflicted_at = {}
+        self._lines = {}
+        self._cells = {}
+        order = range(len(self.symbols))
+        self.random.shuffle(order)
+        for piece in order:
+            row, column = self._random_cell()
+            self._positions[piece] = (row, column)
+            self._move(piece, add_only=True)
+
+    def _move(self, piece, add_only=False):
+        """
+        Moves a piece to the candidate cell with the fewest conflicts.
+        :param piece: An integer, the index of the piece.
+        :param add_only: A boolean, whether the piece is not
+        in the index yet.
+        :return: None.
+        """
+        symbol = self.symbols[piece]
+        row, column = self._positions[piece]
+        if not add_only:
+            self._remove(piece)
+        best = []
+        best_conflicts = None
+        for cell in self._get_candidates(row, column):
+            if cell != (row, column) and self._index.get_piece(*cell):
+                continue
+            conflicts = self._index.count_attacks(*cell) +\
+                self._index.count_attacked(symbol, *cell)
+            if best_conflicts is None or conflicts < best_conflicts:
+                best = [cell]
+                best_conflicts = conflicts
+            elif conflicts == best_conflicts:
+                best.append(cell)
+        self._add(piece, *self.random.choice(best))
+
+    def _add(self, piece, row, column):
+        """
+        Puts a piece on a cell and adds its attacks
+        to the conflicts of the pieces.
+        :param piece: An integer, the index of the piece.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: None.
+        """
+        self._update_conflicts(piece, row, column, 1)
+        self._positions[piece] = (row, column)
+        self._index.add(self.symbols[piece], row, column)
+        self._cells[row, column] = piece
+        for line in self._get_lines(row, column):
+            self._lines.setdefault(line, set()).add(piece)
+
+    def _remove(self, piece):
+        """
+        Lifts a piece from its cell and takes its attacks
+        off the conflicts of the pieces.
+        :param piece: An integer, the index of the piece.
+        :return: None.
+        """
+        row, column = self._positions[piece]
+        self._index.remove(self.symbols[piece], row, column)
+        del self._cells[row, column]
+        for line in self._get_lines(row, column):
+            self._lines[line].discard(piece)
+        self._update_conflicts(piece, row, column, -1)
+
+    def _update_conflicts(self, piece, row, column, step):
+        """
+        Updates the conflicts of the pieces that a piece placed on, or
+        lifted from, a cell attacks or is attacked by. The piece itself
+        is not on the board while its neighbours are looked up.
+        :param piece: An integer, the index of the piece.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :param step: 1 when the piece is placed, -1 when it is lifted.
+        :return: None.
+        """
+        neighbours = set()
+        for line in self._get_lines(row, column):
+            neighbours.update(self._lines.get(line, ()))
+        for row_offset, column_offset in ALL_LEAPS:
+            other = self._cells.get((row + row_offset,
+                                     column + column_offset))
+            if other is not None:
+                neighbours.add(other)
+        symbol = self.symbols[piece]
+        for other in neighbours:
+            cell = self._positions[other]
+            conflicts = count_pair_attacks(symbol, (row, column), cell) +\
+                count_pair_attacks(self.symbols[other], cell, (row, column))
+            if conflicts:
+                self._set_conflicts(other, self._conflicts[other] +
+                                    step * conflicts)
+                self._set_conflicts(piece, self._conflicts[piece] +
+                                    step * conflicts)
+
+    def _set_conflicts(self, piece, conflicts):
+        """
+        Sets the conflicts of a piece and keeps the
+        list of the conflicted pieces up to date.
+        :param piece: An integer, the index of the piece.
+        :param conflicts: An integer, the new number of conflicts.
+        :return: None.
+        """
+        self._conflicts[piece] = conflicts
+        position = self._conflicted_at.get(piece)
+        if conflicts and position is None:
+            self._conflicted_at[piece] = len(self._conflicted)
+            self._conflicted.append(piece)
+        elif not conflicts and position is not None:
+            # the last conflicted piece takes the place of this one
+            last = self._conflicted.pop()
+            if last != piece:
+                self._conflicted[position] = last
+                self._conflicted_at[last] = position
+            del self._conflicted_at[piece]
+
+    def _get_lines(self, row, column):
+        """
+        Returns the keys of the lines that go through a cell.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: A tuple of the row, column, diagonal and
+        anti-diagonal keys.
+        """
+        return ((HORIZONTAL, row), (VERTICAL, column),
+                (DIAGONAL, row - column), (ANTI_DIAGONAL, row + column))
+
+    def _get_candidates(self, row, column):
+        """
+        Returns the cells a piece standing on a cell can be moved to.
+        All the cells of a small board are candidates, otherwise the row
+        and the column of the piece and random cells are.
+        :param row: An integer that represents the row of the piece.
+        :param column: An integer that represents the column of the piece.
+        :return: A set of (row, column) tuples.
+        """
+        if self.rows * self.columns <= self.rows + self.columns +\
+                self.samples:
+            return set((candidate_row, candidate_column)
+                       for candidate_row in xrange(self.rows)
+                       for candidate_column in xrange(self.columns))
+        candidates = set((row, candidate_column)
+                         for candidate_column in xrange(self.columns))
+        candidates.update((candidate_row, column)
+                          for candidate_row in xrange(self.rows))
+        candidates.update(self._random_cell() for _ in xrange(self.samples))
+        return candidates
+
+    def _random_cell(self):
+        """
+        Picks a random free cell of the board.
+        :return: A (row, column) tuple.
+        """
+        while True:
+            cell = (self.random.randrange(self.rows),
+                    self.random.randrange(self.columns))
+            if not self._index.get_piece(*cell):
+                return cell
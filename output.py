@@ -0,0 +1,204 @@
+"""
+Includes the buffered writer of the solutions and the formats it
+can render them in. The solutions are rendered from their placement,
+a sorted tuple of (row, column, symbol) triples, see Board.get_placement(),
+so the board is never walked or changed to print them.
+"""
+import json
+import sys
+from chess_exceptions import InvalidArgumentException
+
+
+def render_grid(placement, rows, columns):
+    """
+    Renders a placement as a grid of the board, like Board.print_board().
+    :param placement: A tuple of (row, column, symbol) triples.
+    :param rows: An integer that represents the number of rows of the board.
+    :param columns: An integer that represents the
+    number of columns of the board.
+    :return: A string.
+    """
+    grid = [["0"] * columns for _ in xrange(rows)]
+    for row, column, symbol in placement:
+        grid[row][column] = symbol
+    return '\n'.join(' '.join(row) for row in grid) + '\n\n'
+
+
+def render_compact(placement, rows, columns):
+    """
+    Renders a placement as a single line list of the pieces positions,
+    e.g. "K:0,0 K:0,2 R:2,1".
+    :param placement: A tuple of (row, column, symbol) triples.
+    :param rows: An integer that represents the number of rows of the board.
+    :param columns: An integer that represents the
+    number of columns of the board.
+    :return: A string.
+    """
+    return ' '.join("%s:%d,%d" % (symbol, row, column)
+                    for row, column, symbol in placement) + '\n'
+
+
+def render_fen(placement, rows, columns):
+    """
+    Renders a placement as FEN-like rows, the rows are separated by "/"
+    and the runs of empty cells are replaced by their length, e.g. "K1K/3/1R1".
+    :param placement: A tuple of (row, column, symbol) triples.
+    :param rows: An integer that represents the number of rows of the board.
+    :param columns: An integer that represents the
+    number of columns of the board.
+    :return: A string.
+    """
+    parts = []
+    pieces = iter(placement)
+    piece = next(pieces, None)
+    for row in xrange(rows):
+        part = []
+        empty = 0
+        for column in xrange(columns):
+            if piece and piece[0] == row and piece[1] == column:
+                if empty:
+                    part.append(str(empty))
+                    empty = 0
+                part.append(piece[2])
+                piece = next(pieces, None)
+            else:
+                empty += 1
+        if empty:
+            part.append(str(empty))
+        parts.append(''.join(part))
+    return '/'.join(parts) + '\n'
+
+
+def render_jsonl(placement, rows, columns):
+    """
+    Renders a placement as a JSON line,
+    e.g. {"pieces": [["K", 0, 0], ["K", 0, 2], ["R", 2, 1]]}.
+    :param placement: A tuple of (row, column, symbol) triples.
+    :param rows: An integer that represents the number of rows of the board.
+    :param columns: An integer that represents the
+    number of columns of the board.
+    :return: A string.
+    """
+    return json.dumps({"pieces": [[symbol, row, column]
+                                  for row, column, symbol in placement]}) +\
+        '\n'
+
+
+def read_jsonl(stream):
+    """
+    Reads the placements of the solutions written in the JSON lines format.
+    :param stream: A file-like object of the lines of render_jsonl().
+    :return: A generator of sorted tuples of (row, column, symbol) triples.
+    """
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            pieces = json.loads(line)["pieces"]
+            yield tuple(sorted((int(row), int(column), str(symbol))
+                               for symbol, row, column in pieces))
+        except (ValueError, KeyError, TypeError):
+            raise InvalidArgumentException(
+                "malformed solution line: %s" % line.strip()
+            )
+
+
+FORMATS = {
+    "grid": render_grid,
+    "compact": render_compact,
+    "fen": render_fen,
+    "jsonl": render_jsonl,
+}
+
+
+class SolutionWriter(object):
+    """
+    Renders the solutions in a certain format and writes
+    them to a stream in batches.
+    """
+    def __init__(self, stream, rows, columns, fmt="grid", buffer_size=1000,
+                 close_stream=False):
+        """
+        Initializes a new instance of the SolutionWriter class.
+        :param stream: A file-like object the solutions are written to.
+        :param rows: An integer that represents the
+        number of rows of the board.
+        :param columns: An integer that represents the
+        number of columns of the board.
+        :param fmt: A string, one of the keys of FORMATS.
+        :param buffer_size: An integer that represents the number of
+        solutions rendered before they are written to the stream.
+        :param close_stream: decides whether the stream is closed
+        when the writer exits or not.
+        :return: A new instance of SolutionWriter class.
+        """
+        if fmt not in FORMATS:
+            raise InvalidArgumentException("unknown output format: %s" % fmt)
+        self.stream = stream
+        self.rows = rows
+        self.columns = columns
+        self.buffer_size = buffer_size
+        self.close_stream = close_stream
+        self.count = 0
+        self._render = FORMATS[fmt]
+        self._buffer = []
+        super(SolutionWriter, self).__init__()
+
+    def __enter__(self):
+        """
+        :return: The writer itself.
+        """
+        return self
+
+    def __exit__(self, *_):
+        """
+        Writes the remaining buffered solutions,
+        and closes the stream if the writer owns it.
+        :return: None.
+        """
+        try:
+            self.flush()
+        finally:
+            if self.close_stream:
+                self.stream.close()
+
+    def write(self, placement):
+        """
+        Renders a solution into the buffer, the buffer is written
+        to the stream when it is full.
+        :param placement: A tuple of (row, column, symbol) triples.
+        :return: None.
+        """
+        self._buffer.append(self._render(placement, self.rows, self.columns))
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered solutions to the stream.
+        :return: None.
+        """
+        if self._buffer:
+            self.stream.write(''.join(self._buffer))
+            self._buffer = []
+        self.stream.flush()
+
+
+def open_writer(path, rows, columns, fmt="grid"):
+    """
+    Opens a writer on a new file, or on the standard output when no
+    path is passed, the file is closed when the writer exits.
+    :param path: A string that represents the path of the file, or None.
+    :param rows: An integer that represents the number of rows of the board.
+    :param columns: An integer that represents the
+    number of columns of the board.
+    :param fmt: A string, one of the keys of FORMATS.
+    :return: A new instance of SolutionWriter class.
+    """
+    if fmt not in FORMATS:
+        raise InvalidArgumentException("unknown output format: %s" % fmt)
+    if not path:
+        return SolutionWriter(sys.stdout, rows, columns, fmt)
+    return SolutionWriter(open(path, 'w'), rows, columns, fmt,
+                          close_stream=True)
@@ -0,0 +1,74 @@
+"""
+Includes the functions that explore the laps of a board on a pool of
+processes, every lap is explored on its own board with its own cache
+of the visited configurations.
+"""
+import multiprocessing
+from board import Board, MOVES, count_laps
+from pieces import create_pieces
+from chess_exceptions import InvalidSetupException
+
+
+def solve_lap(task):
+    """
+    Explores a single lap on a new board.
+    :param task: A tuple of the rows, columns, piece counts,
+    seed, the lap to explore and the strategy.
+    :return: A list of the unique configurations found on the lap,
+    tuples of their hashes and their placements.
+    """
+    rows, columns, counts, seed, lap, strategy = task
+    board = Board(rows, columns, create_pieces(counts), seed)
+    return [(board_hash, board.get_placement())
+            for board_hash in board.explore(laps=[lap], strategy=strategy)
+            if board_hash is not None]
+
+
+def find_independent_configurations(rows, columns, counts, processes=None,
+                                    seed=0, laps=None, strategy=MOVES,
+                                    writer=None):
+    """
+    Finds the unique configurations of the pieces on the board by
+    exploring the laps in parallel, the result is the same for the
+    same seed whatever the number of processes is.
+    :param rows: An integer that represents the number of rows of the board.
+    :param columns: An integer that represents the
+    number of columns of the board.
+    :param counts: A dict that maps a piece symbol to the
+    number of pieces of that type.
+    :param processes: An integer that represents the number of
+    processes, the number of CPUs is used by default.
+    :param seed: An integer that seeds the order in which
+    the pieces are placed on each lap.
+    :param laps: An iterable of the laps to explore,
+    all the laps of the board are explored by default.
+    :param strategy: One of board.STRATEGIES, the way the
+    destinations of the pieces are found.
+    :param writer: An instance of the SolutionWriter class that the
+    placement of every solution is written to.
+    :return: A list of the hashes of all the unique configurations,
+    ordered by the lap they were first found on.
+    """
+    lap_count = count_laps(rows, columns, sum(counts.values()))
+    if lap_count < 1:
+        raise InvalidSetupException("pieces number exceed the board capacity")
+    if laps is None:
+        laps = xrange(lap_count)
+    tasks = [(rows, columns, counts, seed, lap, strategy) for lap in laps]
+    pool = multiprocessing.Pool(processes)
+    try:
+        results = pool.imap(solve_lap, tasks)
+        solutions = []
+        seen = set()
+        for lap_solutions in results:
+            for board_hash, placement in lap_solutions:
+                # the hashes only hold the occupied cells
+                if placement not in seen:
+                    seen.add(placement)
+                    solutions.append(board_hash)
+                    if writer:
+                        writer.write(placement)
+    finally:
+        pool.terminate()
+        pool.join()
+    return solutions
@@ -1,15 +1,51 @@
 """
 Includes classes that represent the different types
 of pieces that can be placed on the board, like:
-King, Queen, Bishop, Rook, Knight.
+King, Queen, Bishop, Rook, Knight and the fairy pieces
+Amazon, Archbishop, Chancellor and Camel.
+
+A piece type is described by the lines it rides and the offsets it
+leaps to. A rider attacks every cell of the lines through its cell in
+its directions (the pieces never block each other), a leaper attacks
+the cells at its offsets. The moves of every type are compiled from
+this description once per board size, see get_targets().
 """
 from chess_exceptions import InvalidSetupException, InvalidMoveException
 
+# the directions of the lines of the board, the cells of a line
+# are listed in the order of their steps from the piece
+VERTICAL = (1, 0)
+HORIZONTAL = (0, 1)
+ANTI_DIAGONAL = (-1, 1)
+DIAGONAL = (1, 1)
+ORTHOGONAL = (VERTICAL, HORIZONTAL)
+DIAGONALS = (ANTI_DIAGONAL, DIAGONAL)
+LINES = ORTHOGONAL + DIAGONALS
+
+KING_LEAPS = ((-1, -1), (-1, 0), (-1, 1), (0, 1),
+              (1, 1), (1, 0), (1, -1), (0, -1))
+KNIGHT_LEAPS = ((-2, -1), (-1, -2), (1, -2), (2, -1),
+                (2, 1), (1, 2), (-1, 2), (-2, 1))
+CAMEL_LEAPS = ((-3, -1), (-1, -3), (1, -3), (3, -1),
+               (3, 1), (1, 3), (-1, 3), (-3, 1))
+
+# the boards up to this number of cells get their moves compiled
+# into tables, the moves on larger ones are found on every call
+MAX_TABLE_CELLS = 4096
+
+_MOVE_TABLES = {}
+
 
 class Piece(object):
     """
     Represents the base class of pieces.
     """
+    symbol = None
+    # the directions of the lines the piece attacks, see LINES
+    riders = ()
+    # the (row, column) offsets of the cells the piece leaps to
+    leaps = ()
+
     def __init__(self):
         """
         Initializes a new instance of the Piece class.
@@ -88,16 +124,13 @@ class Piece(object):
         """
         if not self.board:
             raise InvalidSetupException("piece is not set to a board")
-        return []
-
-    def update_column_status(self, taken=True):
-        """
-        Updates the `taken` properties of all the cells of the piece's column.
-        :param taken: A boolean that decides whether the column's
-        cells will be set as taken or not.
-        :return: None.
-        """
-        pass
+        rows = self.board.rows
+        columns = self.board.columns
+        if rows * columns > MAX_TABLE_CELLS:
+            return get_targets(self.riders, self.leaps, self.row,
+                               self.column, rows, columns)
+        table = get_move_table(type(self), rows, columns)
+        return list(table[self.row * columns + self.column])
 
     def can_move(self, index, row, column):
         """
@@ -113,6 +146,8 @@ class Piece(object):
             raise InvalidSetupException("piece is not set to a board")
 
         cell = self.board[row, column]
+        if VERTICAL in self.riders and column != self.column and cell.taken:
+            return False
         if not cell.available:
             return False
         if self.board.cache.get(self.board.get_hash(index, row, column), None):
@@ -130,17 +165,18 @@ class Piece(object):
         if not self.board:
             raise InvalidSetupException("piece is not set to a board")
 
-        self.update_column_status(False)
         if not [self.row, self.column].count(None):
             self.board[self.row, self.column] = None
         self.board[row, column] = self
-        self.update_column_status()
 
 
 class King(Piece):
     """
     Represents the King piece.
     """
+    symbol = "K"
+    leaps = KING_LEAPS
+
     def __init__(self):
         """
         Initializes a new instance of the King class.
@@ -155,42 +191,14 @@ class King(Piece):
         """
         return "K"
 
-    def get_moves(self):
-        """
-        Returns the legal moves of the King's piece.
-        :return: A list of tuples that represent the legal available moves.
-        """
-        moves = super(King, self).get_moves()
-        row = self.row
-        column = self.column
-
-        rows = self.board.rows
-        columns = self.board.columns
-
-        # add all the cells surrounding the piece
-        if row - 1 >= 0 and column - 1 >= 0:
-            moves.append((row - 1, column - 1))
-        if row - 1 >= 0:
-            moves.append((row - 1, column))
-        if row - 1 >= 0 and column + 1 < columns:
-            moves.append((row - 1, column + 1))
-        if column + 1 < columns:
-            moves.append((row, column + 1))
-        if row + 1 < rows and column + 1 < columns:
-            moves.append((row + 1, column + 1))
-        if row + 1 < rows:
-            moves.append((row + 1, column))
-        if row + 1 < rows and column - 1 >= 0:
-            moves.append((row + 1, column - 1))
-        if column - 1 >= 0:
-            moves.append((row, column - 1))
-        return moves
-
 
 class Queen(Piece):
     """
     Represents the Queen piece.
     """
+    symbol = "Q"
+    riders = LINES
+
     def __init__(self):
         """
         Initializes a new instance of the Queen class.
@@ -205,74 +213,14 @@ class Queen(Piece):
         """
         return "Q"
 
-    def get_moves(self):
-        """
-        Returns the legal moves of the Queen's piece.
-        :return: A list of tuples that represent the legal available moves.
-        """
-        moves = super(Queen, self).get_moves()
-        row = self.row
-        column = self.column
-
-        rows = self.board.rows
-        columns = self.board.columns
-
-        # add all the cells in the piece's column
-        for y_axis in xrange(rows):
-            if y_axis == row:
-                continue
-            moves.append((y_axis, column))
-
-        # add all the cells in the piece's row
-        for x_axis in xrange(columns):
-            if x_axis == column:
-                continue
-            moves.append((row, x_axis))
-
-        # add all the cells in the piece's diagonals
-        for x_axis in xrange(0, row + column + 1):
-            y_axis = row + column - x_axis
-            if x_axis < columns and y_axis < rows and\
-                    x_axis != column and y_axis != row:
-                moves.append((y_axis, x_axis))
-
-        for y_axis in xrange(row - column, max(rows, columns)):
-            x_axis = y_axis - row + column
-            if 0 <= x_axis < columns and 0 <= y_axis < rows and\
-                    x_axis != column and y_axis != row:
-                moves.append((y_axis, x_axis))
-
-        return moves
-
-    def update_column_status(self, taken=True):
-        """
-        Updates the `taken` properties of all the cells of the piece's column.
-        :param taken: A boolean that decides whether the column's
-        cells will be set as taken or not.
-        :return: None.
-        """
-        for index in xrange(self.board.rows):
-            self.board[index, self.column].taken = taken
-
-    def can_move(self, index, row, column):
-        """
-        Decides whether if the piece can be moved to the passed position.
-        :param index: An integer that represents the index
-        of the piece in the board piece set.
-        :param row: An integer that represents the row of the tested position.
-        :param column: An integer that represents the
-        column of the tested position.
-        :return: A boolean.
-        """
-        if column != self.column and self.board[row, column].taken:
-            return False
-        return super(Queen, self).can_move(index, row, column)
-
 
 class Bishop(Piece):
     """
     Represents the Bishop piece.
     """
+    symbol = "B"
+    riders = DIAGONALS
+
     def __init__(self):
         """
         Initializes a new instance of the Bishop class.
@@ -287,38 +235,14 @@ class Bishop(Piece):
         """
         return "B"
 
-    def get_moves(self):
-        """
-        Returns the legal moves of the Bishop's piece.
-        :return: A list of tuples that represent the legal available moves.
-        """
-        moves = super(Bishop, self).get_moves()
-        row = self.row
-        column = self.column
-
-        rows = self.board.rows
-        columns = self.board.columns
-
-        # add all the cells in the piece's diagonals
-        for x_axis in xrange(0, row + column + 1):
-            y_axis = row + column - x_axis
-            if x_axis < columns and y_axis < rows and\
-                    x_axis != column and y_axis != row:
-                moves.append((y_axis, x_axis))
-
-        for y_axis in xrange(row - column, max(rows, columns)):
-            x_axis = y_axis - row + column
-            if 0 <= x_axis < columns and 0 <= y_axis < rows and\
-                    x_axis != column and y_axis != row:
-                moves.append((y_axis, x_axis))
-
-        return moves
-
 
 class Rook(Piece):
     """
     Represents the Rook piece.
     """
+    symbol = "R"
+    riders = ORTHOGONAL
+
     def __init__(self):
         """
         Initializes a new instance of the Rook class.
@@ -333,102 +257,208 @@ class Rook(Piece):
         """
         return "R"
 
-    def get_moves(self):
+
+class Knight(Piece):
+    """
+    Represents the Knight piece.
+    """
+    symbol = "N"
+    leaps = KNIGHT_LEAPS
+
+    def __init__(self):
         """
-        Returns the legal moves of the Rook's piece.
-        :return: A list of tuples that represent the legal available moves.
+        Initializes a new instance of the Knight class.
+        :return: A new instance of Knight class.
         """
-        moves = super(Rook, self).get_moves()
-        row = self.row
-        column = self.column
+        super(Knight, self).__init__()
 
-        rows = self.board.rows
-        columns = self.board.columns
+    def __str__(self):
+        """
+        :return: Returns a string representation that
+        differentiate the piece's type.
+        """
+        return "N"
 
-        # add all the cells in the piece's column
-        for y_axis in xrange(rows):
-            if y_axis == row:
-                continue
-            moves.append((y_axis, column))
 
-        # add all the cells in the piece's row
-        for x_axis in xrange(columns):
-            if x_axis == column:
-                continue
-            moves.append((row, x_axis))
+class Amazon(Piece):
+    """
+    Represents the Amazon piece, it moves like a Queen and a Knight.
+    """
+    symbol = "Z"
+    riders = LINES
+    leaps = KNIGHT_LEAPS
 
-        return moves
+    def __init__(self):
+        """
+        Initializes a new instance of the Amazon class.
+        :return: A new instance of Amazon class.
+        """
+        super(Amazon, self).__init__()
 
-    def update_column_status(self, taken=True):
+    def __str__(self):
         """
-        Updates the `taken` properties of all the cells of the piece's column.
-        :param taken: A boolean that decides whether the column's
-        cells will be set as taken or not.
-        :return: None.
+        :return: Returns a string representation that
+        differentiate the piece's type.
         """
-        for index in xrange(self.board.rows):
-            self.board[index, self.column].taken = taken
+        return "Z"
 
-    def can_move(self, index, row, column):
+
+class Archbishop(Piece):
+    """
+    Represents the Archbishop piece, it moves like a
+    Bishop and a Knight.
+    """
+    symbol = "A"
+    riders = DIAGONALS
+    leaps = KNIGHT_LEAPS
+
+    def __init__(self):
         """
-        Decides whether if the piece can be moved to the passed position.
-        :param index: An integer that represents the index
-        of the piece in the board piece set.
-        :param row: An integer that represents the row of the tested position.
-        :param column: An integer that represents the
-        column of the tested position.
-        :return: A boolean.
+        Initializes a new instance of the Archbishop class.
+        :return: A new instance of Archbishop class.
         """
-        if column != self.column and self.board[row, column].taken:
-            return False
-        return super(Rook, self).can_move(index, row, column)
+        super(Archbishop, self).__init__()
+
+    def __str__(self):
+        """
+        :return: Returns a string representation that
+        differentiate the piece's type.
+        """
+        return "A"
 
 
-class Knight(Piece):
+class Chancellor(Piece):
     """
-    Represents the Rook piece.
+    Represents the Chancellor piece, it moves like a
+    Rook and a Knight.
     """
+    symbol = "C"
+    riders = ORTHOGONAL
+    leaps = KNIGHT_LEAPS
+
     def __init__(self):
         """
-        Initializes a new instance of the Knight class.
-        :return: A new instance of Knight class.
+        Initializes a new instance of the Chancellor class.
+        :return: A new instance of Chancellor class.
         """
-        super(Knight, self).__init__()
+        super(Chancellor, self).__init__()
 
     def __str__(self):
         """
         :return: Returns a string representation that
         differentiate the piece's type.
         """
-        return "N"
+        return "C"
 
-    def get_moves(self):
+
+class Camel(Piece):
+    """
+    Represents the Camel piece, a leaper that moves three cells
+    along a line and one across it.
+    """
+    symbol = "L"
+    leaps = CAMEL_LEAPS
+
+    def __init__(self):
         """
-        Returns the legal moves of the Knight's piece.
-        :return: A list of tuples that represent the legal available moves.
+        Initializes a new instance of the Camel class.
+        :return: A new instance of Camel class.
         """
-        moves = super(Knight, self).get_moves()
-        row = self.row
-        column = self.column
+        super(Camel, self).__init__()
 
-        rows = self.board.rows
-        columns = self.board.columns
+    def __str__(self):
+        """
+        :return: Returns a string representation that
+        differentiate the piece's type.
+        """
+        return "L"
+
+
+PIECE_TYPES = [("K", King), ("Q", Queen), ("B", Bishop),
+               ("R", Rook), ("N", Knight), ("Z", Amazon),
+               ("A", Archbishop), ("C", Chancellor), ("L", Camel)]
 
-        if row - 2 >= 0 and column - 1 >= 0:
-            moves.append((row - 2, column - 1))
-        if row - 1 >= 0 and column - 2 >= 0:
-            moves.append((row - 1, column - 2))
-        if row + 1 < rows and column - 2 >= 0:
-            moves.append((row + 1, column - 2))
-        if row + 2 < rows and column - 1 >= 0:
-            moves.append((row + 2, column - 1))
-        if row + 2 < rows and column + 1 < columns:
-            moves.append((row + 2, column + 1))
-        if row + 1 < rows and column + 2 < columns:
-            moves.append((row + 1, column + 2))
-        if row - 1 >= 0 and column + 2 < columns:
-            moves.append((row - 1, column + 2))
-        if row - 2 >= 0 and column + 1 < columns:
-            moves.append((row - 2, column + 1))
-
-        return moves
+# the lines and the offsets of every piece type
+RIDERS = dict((symbol, piece_type.riders)
+              for symbol, piece_type in PIECE_TYPES)
+LEAPS = dict((symbol, piece_type.leaps)
+             for symbol, piece_type in PIECE_TYPES)
+
+
+def get_targets(riders, leaps, row, column, rows, columns):
+    """
+    Finds the cells a piece attacks from a certain position, the cells
+    of its lines first, in the order of its directions, then the
+    cells it leaps to, in the order of its offsets.
+    :param riders: The directions of the lines the piece attacks.
+    :param leaps: The (row, column) offsets of the cells the piece leaps to.
+    :param row: An integer that represents the row of the piece.
+    :param column: An integer that represents the column of the piece.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :return: A list of (row, column) tuples.
+    """
+    cells = []
+    size = max(rows, columns)
+    for row_step, column_step in riders:
+        cells.extend((row + step * row_step, column + step * column_step)
+                     for step in xrange(-size, size + 1) if step)
+    cells.extend((row + row_offset, column + column_offset)
+                 for row_offset, column_offset in leaps)
+    targets = []
+    seen = set()
+    for y_axis, x_axis in cells:
+        # a cell shared by two of the moves of a piece is kept once
+        if 0 <= y_axis < rows and 0 <= x_axis < columns and\
+                (y_axis, x_axis) not in seen:
+            seen.add((y_axis, x_axis))
+            targets.append((y_axis, x_axis))
+    return targets
+
+
+def get_move_table(piece_type, rows, columns):
+    """
+    Returns the moves of a piece type from every cell of a board size,
+    the tables are compiled once and kept for the next calls.
+    :param piece_type: A subclass of the Piece class.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :return: A list of tuples of (row, column) tuples,
+    indexed by row * columns + column.
+    """
+    key = (piece_type.riders, piece_type.leaps, rows, columns)
+    table = _MOVE_TABLES.get(key)
+    if table is None:
+        table = _MOVE_TABLES[key] = [
+            tuple(get_targets(piece_type.riders, piece_type.leaps,
+                              cell // columns, cell % columns,
+                              rows, columns))
+            for cell in xrange(rows * columns)
+        ]
+    return table
+
+
+def create_pieces(counts):
+    """
+    Creates the pieces described by the number of pieces of each type.
+    :param counts: A dict that maps a piece symbol (see PIECE_TYPES)
+    to the number of pieces of that type.
+    :return: A list of new pieces ordered by their type.
+    """
+    pieces = []
+    for symbol, piece_type in PIECE_TYPES:
+        pieces.extend([piece_type() for _ in xrange(counts.get(symbol, 0))])
+    return pieces
+
+
+def count_pieces(pieces):
+    """
+    Counts the pieces of each type in the passed list.
+    :param pieces: A list of pieces.
+    :return: A dict that maps a piece symbol to the number of
+    pieces of that type, types with no pieces are left out.
+    """
+    counts = {}
+    for piece in pieces:
+        counts[str(piece)] = counts.get(str(piece), 0) + 1
+    return counts
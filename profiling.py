@@ -0,0 +1,157 @@
+"""
+Includes the profiling hook of the solves, it runs a command under
+cProfile, writes the raw profile and condenses it into the time spent
+in each subsystem of the solver: the move generation, the attack
+calculation, the hashing, the cache lookups, the accesses to the board
+and its pieces, the search loops and the output.
+
+The time of a function is its own time, without the functions it calls.
+The time of a built-in function (e.g. the methods of the lists and the
+dicts) is given to the subsystems of the functions that called it.
+"""
+import cProfile
+import os
+import pstats
+
+# the functions of every subsystem, by module, all the functions
+# of a module belong to the subsystem when no names are listed
+SUBSYSTEMS = [
+    ("move generation", "pieces.py",
+     ("get_moves", "get_targets", "get_move_table", "can_move", "move",
+      "set_position")),
+    ("move generation", "board.py",
+     ("get_next_available_position", "get_available_postions",
+      "reset_position")),
+    ("attack calculation", "board.py",
+     ("add", "remove", "get_piece", "count_attacks", "is_attacked",
+      "attacks_any", "count_attacked", "_update", "attacks",
+      "calculate_attacks", "has_attacked_piece", "is_column_ridden")),
+    ("attack calculation", "attacks.py", None),
+    ("hashing", "board.py", ("get_hash",)),
+    ("cache lookup", "board.py", ("cache",)),
+    ("cache lookup", "counting.py", ("get", "put", "__len__", "hit_rate")),
+    ("board access", "board.py",
+     ("__getitem__", "__setitem__", "_get_cell", "row", "column", "piece",
+      "taken", "available", "index")),
+    ("board access", "pieces.py", ("row", "column")),
+    ("output", "board.py", ("get_placement", "print_board", "__str__")),
+    ("output", "output.py", None),
+    ("output", "export.py", None),
+    ("output", "external_sort.py", None),
+    ("search", "board.py",
+     ("explore", "find_independent_configurations",
+      "find_all_configurations")),
+    ("search", "conflict_graph.py", None),
+    ("search", "counting.py", None),
+    ("search", "row_profile.py", None),
+    ("search", "fast_paths.py", None),
+    ("search", "hybrid.py", None),
+    ("search", "sampling.py", None),
+    ("search", "min_conflicts.py", None),
+    ("search", "sweep.py", None),
+    ("search", "parallel.py", None),
+]
+
+OTHER = "other"
+BUILT_IN = "built-in"
+
+
+def get_subsystem(filename, function):
+    """
+    Finds the subsystem a function belongs to.
+    :param filename: A string, the path of the module of the function.
+    :param function: A string, the name of the function.
+    :return: A string.
+    """
+    module = os.path.basename(filename)
+    for subsystem, subsystem_module, functions in SUBSYSTEMS:
+        if module == subsystem_module and\
+                (functions is None or function in functions):
+            return subsystem
+    return OTHER
+
+
+def profile_call(function, args, path):
+    """
+    Calls a function under the profiler and writes the raw profile,
+    it can be read with the pstats module or snakeviz.
+    :param function: The function to call.
+    :param args: A tuple of the arguments of the function.
+    :param path: A string that represents the path of the profile file.
+    :return: An instance of the pstats.Stats class.
+    """
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(function, *args)
+    finally:
+        profiler.dump_stats(path)
+    return pstats.Stats(path)
+
+
+def summarize(stats):
+    """
+    Sums the time and the calls of the functions of every subsystem.
+    :param stats: An instance of the pstats.Stats class.
+    :return: A list of (subsystem, seconds, calls) tuples,
+    the slowest subsystem first.
+    """
+    totals = {}
+    for (filename, _, function), entry in stats.stats.iteritems():
+        _, calls, own_time, _, callers = entry
+        if filename == "~" and callers:
+            # a built-in function counts for its callers, the entry of a
+            # caller holds the calls it made and the time they took
+            shares = [(get_subsystem(caller[0], caller[2]),
+                       caller_entry[2], caller_entry[1])
+                      for caller, caller_entry in callers.iteritems()]
+        else:
+            shares = [(get_subsystem(filename, function), own_time, calls)]
+        for subsystem, seconds, share_calls in shares:
+            total_seconds, total_calls = totals.get(subsystem, (0.0, 0))
+            totals[subsystem] = (total_seconds + seconds,
+                                 total_calls + share_calls)
+    return sorted(((subsystem, seconds, calls) for subsystem, (seconds, calls)
+                   in totals.iteritems()),
+                  key=lambda total: total[1], reverse=True)
+
+
+def get_hot_functions(stats, limit=10):
+    """
+    Finds the functions with the largest own time.
+    :param stats: An instance of the pstats.Stats class.
+    :param limit: An integer, the number of the functions.
+    :return: A list of (seconds, calls, function, subsystem) tuples,
+    the slowest function first.
+    """
+    functions = []
+    for (filename, line, function), entry in stats.stats.iteritems():
+        _, calls, own_time, _, _ = entry
+        if filename == "~":
+            name = function
+            subsystem = BUILT_IN
+        else:
+            name = "%s:%d(%s)" % (os.path.basename(filename), line, function)
+            subsystem = get_subsystem(filename, function)
+        functions.append((own_time, calls, name, subsystem))
+    functions.sort(reverse=True)
+    return functions[:limit]
+
+
+def render_summary(stats, limit=10):
+    """
+    Renders the time of every subsystem and the hottest functions.
+    :param stats: An instance of the pstats.Stats class.
+    :param limit: An integer, the number of the functions listed.
+    :return: A string.
+    """
+    total = stats.total_tt or 1.0
+    lines = ["%-20s %10s %6s %12s" % ("subsystem", "seconds", "%", "calls")]
+    for subsystem, seconds, calls in summarize(stats):
+        lines.append("%-20s %10.3f %6.1f %12d" %
+                     (subsystem, seconds, seconds * 100 / total, calls))
+    lines.append("")
+    lines.append("%10s %12s  %s" % ("seconds", "calls", "function"))
+    for seconds, calls, name, subsystem in get_hot_functions(stats, limit):
+        lines.append("%10.3f %12d  %s [%s]" % (seconds, calls, name,
+                                               subsystem))
+    return '\n'.join(lines)
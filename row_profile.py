@@ -0,0 +1,166 @@
+"""
+Includes a counter of the configurations of kings and knights that
+sweeps the board a row at a time. Kings and knights only attack
+within two rows, so the pieces of the last two rows and the number
+of the remaining pieces are all the state a row needs to know about,
+and the count grows polynomially with the number of rows.
+
+The long-range pieces (queens, rooks and bishops) are not handled,
+the cells they leave to the kings and knights can be passed as masks.
+"""
+from collections import defaultdict
+from chess_exceptions import InvalidArgumentException
+
+SHORT_RANGE = "KN"
+
+
+class RowProfileCounter(object):
+    """
+    Counts the configurations of kings and knights row by row.
+    """
+    def __init__(self, rows, columns, counts, masks=None, patterns=None):
+        """
+        Initializes a new instance of the RowProfileCounter class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :param counts: A dict that maps a piece symbol (K or N) to the
+        number of pieces of that type.
+        :param masks: A dict that maps a piece symbol to the bitmask of the
+        cells it can take, the cell (row, column) being the bit
+        row * columns + column, all the cells are available by default.
+        :param patterns: A dict that caches the single row placements,
+        it can be shared by the counters of the same board size.
+        :return: A new instance of the RowProfileCounter class.
+        """
+        for symbol, count in counts.items():
+            if count and symbol not in SHORT_RANGE:
+                raise InvalidArgumentException(
+                    "only kings and knights can be counted row by row"
+                )
+        masks = masks or {}
+        full = (1 << rows * columns) - 1
+        king_mask = masks.get("K", full)
+        knight_mask = masks.get("N", full)
+        # sweep along the longest side so the rows are as short as possible
+        if columns > rows:
+            king_mask = transpose(king_mask, rows, columns)
+            knight_mask = transpose(knight_mask, rows, columns)
+            rows, columns = columns, rows
+        self.rows = rows
+        self.width = columns
+        self.kings = counts.get("K", 0)
+        self.knights = counts.get("N", 0)
+        self.max_states = 0
+        row_mask = (1 << columns) - 1
+        self._row_mask = row_mask
+        self._available = [((king_mask >> row * columns) & row_mask,
+                            (knight_mask >> row * columns) & row_mask)
+                           for row in xrange(rows)]
+        self._patterns = {} if patterns is None else patterns
+        super(RowProfileCounter, self).__init__()
+
+    def count(self):
+        """
+        Counts the configurations.
+        :return: An integer.
+        """
+        row_mask = self._row_mask
+        # the profile holds the (occupied, knights) cells two rows above and
+        # the (kings, knights) cells one row above, every profile maps the
+        # numbers of the kings and knights left to place to their ways
+        profiles = {(0, 0, 0, 0): {(self.kings, self.knights): 1}}
+        for row in xrange(self.rows):
+            capacity = (self.rows - row) * self.width
+            patterns = self._get_patterns(*self._available[row])
+            next_profiles = defaultdict(lambda: defaultdict(int))
+            for profile, remaining in profiles.iteritems():
+                occupied2, knights2, kings1, knights1 = profile
+                occupied1 = kings1 | knights1
+                attacked = (kings1 | kings1 << 1 | kings1 >> 1 |
+                            knights1 << 2 | knights1 >> 2 |
+                            knights2 << 1 | knights2 >> 1) & row_mask
+                no_king = attacked |\
+                    (occupied1 | occupied1 << 1 | occupied1 >> 1)
+                no_knight = attacked | occupied1 << 2 | occupied1 >> 2 |\
+                    occupied2 << 1 | occupied2 >> 1
+                fitting = [pattern for pattern in patterns
+                           if not (pattern[0] & no_king or
+                                   pattern[1] & no_knight)]
+                for (kings, knights), ways in remaining.iteritems():
+                    if kings + knights > capacity:
+                        continue
+                    for row_kings, row_knights, king_count, knight_count\
+                            in fitting:
+                        if king_count <= kings and knight_count <= knights:
+                            next_profiles[
+                                occupied1, knights1, row_kings, row_knights][
+                                kings - king_count,
+                                knights - knight_count] += ways
+            profiles = next_profiles
+            self.max_states = max(self.max_states, sum(
+                len(remaining) for remaining in profiles.itervalues()))
+        return sum(remaining.get((0, 0), 0)
+                   for remaining in profiles.itervalues())
+
+    def _get_patterns(self, king_mask, knight_mask):
+        """
+        Returns the placements of kings and knights on a single row
+        where no king stands next to another piece.
+        :param king_mask: An integer, the cells of the row kings can take.
+        :param knight_mask: An integer, the cells of the
+        row knights can take.
+        :return: A list of (kings, knights, king count, knight count) tuples.
+        """
+        key = (king_mask, knight_mask)
+        patterns = self._patterns.get(key)
+        if patterns is None:
+            patterns = []
+            self._add_patterns(patterns, 0, 0, 0, king_mask, knight_mask)
+            self._patterns[key] = patterns
+        return patterns
+
+    def _add_patterns(self, patterns, column, kings, knights,
+                      king_mask, knight_mask):
+        """
+        Adds the row placements that extend a partial one column by column.
+        :param patterns: A list the placements are added to.
+        :param column: An integer, the next column to fill.
+        :param kings: An integer, the kings placed so far.
+        :param knights: An integer, the knights placed so far.
+        :param king_mask: An integer, the cells of the row kings can take.
+        :param knight_mask: An integer, the cells of the
+        row knights can take.
+        :return: None.
+        """
+        if column == self.width:
+            patterns.append((kings, knights, bin(kings).count('1'),
+                             bin(knights).count('1')))
+            return
+        bit = 1 << column
+        previous = bit >> 1
+        self._add_patterns(patterns, column + 1, kings, knights,
+                           king_mask, knight_mask)
+        if king_mask & bit and not (kings | knights) & previous:
+            self._add_patterns(patterns, column + 1, kings | bit, knights,
+                               king_mask, knight_mask)
+        if knight_mask & bit and not kings & previous:
+            self._add_patterns(patterns, column + 1, kings, knights | bit,
+                               king_mask, knight_mask)
+
+
+def transpose(mask, rows, columns):
+    """
+    Transposes a bitmask of the cells of a board.
+    :param mask: An integer, the cell (row, column) being
+    the bit row * columns + column.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :return: An integer, the cell (row, column) being
+    the bit column * rows + row.
+    """
+    result = 0
+    for row in xrange(rows):
+        for column in xrange(columns):
+            if mask >> (row * columns + column) & 1:
+                result |= 1 << (column * rows + row)
+    return result
@@ -0,0 +1,87 @@
+"""
+Includes the sampler that draws configurations uniformly at random
+without enumerating them. Every configuration is a single path of the
+counting engine's search, so walking down from the root and picking
+each branch with a probability proportional to its count (which the
+transposition table already holds after the first count) gives every
+configuration the same probability.
+"""
+import random
+from counting import ConfigurationCounter
+from chess_exceptions import InvalidSetupException
+
+
+class Sampler(object):
+    """
+    Draws uniformly random configurations of a problem.
+    """
+    def __init__(self, rows, columns, counts, seed=None, table_size=1000000):
+        """
+        Initializes a new instance of the Sampler class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :param counts: A dict that maps a piece symbol to the
+        number of pieces of that type.
+        :param seed: An integer that makes the samples reproducible.
+        :param table_size: An integer that represents the maximum
+        number of the entries of the transposition table.
+        :return: A new instance of the Sampler class.
+        """
+        self.counter = ConfigurationCounter(rows, columns, counts, table_size)
+        self.random = random.Random(seed)
+        self._total = None
+        super(Sampler, self).__init__()
+
+    @property
+    def total(self):
+        """
+        Returns the number of the configurations of the problem.
+        :return: An integer.
+        """
+        if self._total is None:
+            self._total = self.counter.count()
+        return self._total
+
+    def sample(self):
+        """
+        Draws a single configuration.
+        :return: A sorted tuple of (row, column, symbol) triples.
+        """
+        if not self.total:
+            raise InvalidSetupException("the problem has no configurations")
+        counter = self.counter
+        columns = counter.table.columns
+        remaining = counter.counts
+        masks = (counter.table.full_mask,) * len(counter.symbols)
+        placement = []
+        while any(remaining):
+            current = next(index for index, count in enumerate(remaining)
+                           if count)
+            choice = self.random.randrange(
+                counter.count_state(remaining, masks))
+            next_remaining = list(remaining)
+            next_remaining[current] -= 1
+            next_remaining = tuple(next_remaining)
+            available = masks[current]
+            while available:
+                bit = available & -available
+                available ^= bit
+                next_masks = counter.place(current, bit, next_remaining,
+                                           masks, available)
+                count = counter.count_state(next_remaining, next_masks)
+                if choice < count:
+                    cell = bit.bit_length() - 1
+                    placement.append((cell // columns, cell % columns,
+                                      counter.symbols[current]))
+                    remaining, masks = next_remaining, next_masks
+                    break
+                choice -= count
+        return tuple(sorted(placement))
+
+    def samples(self, number):
+        """
+        Draws several independent configurations.
+        :param number: An integer, the number of the configurations.
+        :return: A list of sorted tuples of (row, column, symbol) triples.
+        """
+        return [self.sample() for _ in xrange(number)]
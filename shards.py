@@ -0,0 +1,142 @@
+"""
+Includes the functions that split a problem into shards which can be
+solved independently (e.g. on different machines) and merge the
+results of the solved shards back into the final result.
+
+A shard is described by a set of laps of the board, the lap being the
+position from which the pieces start being placed, so the shards of a
+problem never depend on each other.
+"""
+import json
+from board import Board, count_laps
+from pieces import create_pieces
+from chess_exceptions import InvalidArgumentException
+
+
+def split_problem(rows, columns, counts, shards, seed=None):
+    """
+    Splits a problem into shard descriptors, the laps of the board
+    are dealt to the shards in a round-robin way so the descriptors
+    are always the same for the same problem.
+    :param rows: An integer that represents the number of rows of the board.
+    :param columns: An integer that represents the
+    number of columns of the board.
+    :param counts: A dict that maps a piece symbol to the
+    number of pieces of that type.
+    :param shards: An integer that represents the number of shards.
+    :param seed: An integer that seeds the order in which the pieces
+    are placed on each lap, it is random when not passed.
+    :return: A list of dicts, one descriptor for each shard.
+    """
+    if shards < 1:
+        raise InvalidArgumentException("shards number should be positive")
+    lap_count = count_laps(rows, columns, sum(counts.values()))
+    if lap_count < 1:
+        raise InvalidArgumentException(
+            "pieces number exceed the board capacity"
+        )
+    descriptors = []
+    for shard in xrange(shards):
+        descriptors.append({
+            "rows": rows,
+            "columns": columns,
+            "pieces": dict((symbol, count)
+                           for symbol, count in counts.items() if count),
+            "shard": shard,
+            "shards": shards,
+            "laps": range(shard, lap_count, shards),
+            "seed": seed,
+        })
+    return descriptors
+
+
+def run_shard(descriptor):
+    """
+    Solves the laps of a single shard.
+    :param descriptor: A dict that describes the shard.
+    :return: A dict that holds the descriptor fields alongside the
+    number of the solutions found and their placements.
+    """
+    board = Board(descriptor["rows"], descriptor["columns"],
+                  create_pieces(descriptor["pieces"]),
+                  descriptor.get("seed"))
+    solutions = [board.get_placement()
+                 for board_hash in board.explore(laps=descriptor["laps"])
+                 if board_hash is not None]
+    result = dict(descriptor)
+    result["count"] = len(solutions)
+    result["solutions"] = solutions
+    return result
+
+
+def merge_results(results):
+    """
+    Merges the results of all the shards of a problem after checking
+    that they belong to the same problem and that none of them is missing.
+    :param results: A list of dicts, the results of the solved shards.
+    :return: A sorted list of the placements of the unique solutions
+    of the problem, tuples of (row, column, symbol) triples.
+    """
+    if not results:
+        raise InvalidArgumentException("no shard results to merge")
+    problem = _get_problem(results[0])
+    seen = set()
+    for result in results:
+        if _get_problem(result) != problem:
+            raise InvalidArgumentException(
+                "shard %d belongs to a different problem" % result["shard"]
+            )
+        if result["shard"] in seen:
+            raise InvalidArgumentException(
+                "shard %d is passed more than once" % result["shard"]
+            )
+        seen.add(result["shard"])
+    missing = sorted(set(xrange(problem[-1])) - seen)
+    if missing:
+        raise InvalidArgumentException(
+            "missing shards: %s" % ', '.join(str(shard) for shard in missing)
+        )
+    solutions = set()
+    for result in results:
+        # the placements are read back from JSON as lists
+        solutions.update(tuple(tuple(piece) for piece in placement)
+                         for placement in result["solutions"])
+    return sorted(solutions)
+
+
+def save(data, path):
+    """
+    Saves a shard descriptor or result into a JSON file.
+    :param data: A dict, the descriptor or the result of a shard.
+    :param path: A string that represents the path of the file.
+    :return: None.
+    """
+    with open(path, 'w') as shard_file:
+        json.dump(data, shard_file, sort_keys=True)
+
+
+def load(path):
+    """
+    Loads a shard descriptor or result from a JSON file.
+    :param path: A string that represents the path of the file.
+    :return: A dict, the descriptor or the result of a shard.
+    """
+    try:
+        with open(path) as shard_file:
+            return json.load(shard_file)
+    except (IOError, ValueError), exp:
+        raise InvalidArgumentException(
+            "cannot load shard file %s: %s" % (path, exp)
+        )
+
+
+def _get_problem(data):
+    """
+    Returns the fields that identify the problem a shard belongs to,
+    the seed among them since it decides the solutions of the laps.
+    :param data: A dict, the descriptor or the result of a shard.
+    :return: A tuple.
+    """
+    return (data["rows"], data["columns"],
+            tuple(sorted(data["pieces"].items())), data.get("seed"),
+            data["shards"])
@@ -0,0 +1,179 @@
+"""
+Includes the solution store, it answers positional questions about a
+solution set without going through its records. Every solution gets an
+id, and for every piece type and cell the store keeps the bitmap of the
+ids of the solutions with a piece of the type on the cell, the solution
+id being the bit. A query is then a few ANDs and ORs of bitmaps.
+
+The bitmaps are filled as bytearrays, so adding a solution does not copy
+them, and are turned into integers when they are first queried.
+"""
+import binascii
+from output import read_jsonl
+from chess_exceptions import InvalidArgumentException
+
+
+def parse_term(text):
+    """
+    Parses a query term like "Q:3,4", a "*" stands for any piece
+    type, row or column, e.g. "R:1,*" or "*:0,0".
+    :param text: A string, SYMBOL:ROW,COLUMN.
+    :return: A (symbol, row, column) tuple, None standing for any.
+    """
+    try:
+        symbol, position = text.strip().split(':')
+        row, column = position.split(',')
+        row, column = [None if part.strip() == '*' else int(part)
+                       for part in (row, column)]
+    except ValueError:
+        raise InvalidArgumentException("malformed query term: %s" % text)
+    symbol = symbol.strip().upper()
+    return None if symbol == '*' else symbol, row, column
+
+
+class SolutionStore(object):
+    """
+    Represents a set of solutions indexed by the positions of their pieces.
+    """
+    def __init__(self, rows, columns, solutions=()):
+        """
+        Initializes a new instance of the SolutionStore class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :param solutions: An iterable of the solutions to store, sorted
+        tuples of (row, column, symbol) triples.
+        :return: A new instance of the SolutionStore class.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.solutions = []
+        self._bitmaps = {}
+        self._integers = {}
+        super(SolutionStore, self).__init__()
+        for placement in solutions:
+            self.add(placement)
+
+    def __len__(self):
+        """
+        :return: The number of the stored solutions.
+        """
+        return len(self.solutions)
+
+    @classmethod
+    def load(cls, path, rows, columns):
+        """
+        Loads the solutions written in the JSON lines format into a store.
+        :param path: A string that represents the path of the file.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :return: An instance of the SolutionStore class.
+        """
+        with open(path) as solutions_file:
+            return cls(rows, columns, read_jsonl(solutions_file))
+
+    @property
+    def all_ids(self):
+        """
+        Returns the bitmap of all the stored solutions.
+        :return: An integer.
+        """
+        return (1 << len(self.solutions)) - 1
+
+    def add(self, placement):
+        """
+        Stores a solution and indexes its pieces.
+        :param placement: An iterable of (row, column, symbol) triples.
+        :return: An integer, the id of the solution.
+        """
+        placement = tuple(placement)
+        solution_id = len(self.solutions)
+        byte, bit = divmod(solution_id, 8)
+        for row, column, symbol in placement:
+            if not (0 <= row < self.rows and 0 <= column < self.columns):
+                raise InvalidArgumentException(
+                    "piece %s:%d,%d is outside the board" %
+                    (symbol, row, column)
+                )
+            bitmap = self._bitmaps.setdefault((symbol, row, column),
+                                              bytearray())
+            if len(bitmap) <= byte:
+                bitmap.extend('\0' * (byte + 1 - len(bitmap)))
+            bitmap[byte] |= 1 << bit
+        self.solutions.append(placement)
+        self._integers = {}
+        return solution_id
+
+    def get_bitmap(self, symbol=None, row=None, column=None):
+        """
+        Returns the bitmap of the solutions with a piece of a type on a
+        cell, any type, row or column matches when it is None.
+        :param symbol: A string that represents the type of the piece.
+        :param row: An integer that represents the row of the cell.
+        :param column: An integer that represents the column of the cell.
+        :return: An integer.
+        """
+        if symbol is not None and row is not None and column is not None:
+            return self._get_integer((symbol, row, column))
+        bitmap = 0
+        for key in self._bitmaps:
+            key_symbol, key_row, key_column = key
+            if (symbol is None or symbol == key_symbol) and\
+                    (row is None or row == key_row) and\
+                    (column is None or column == key_column):
+                bitmap |= self._get_integer(key)
+        return bitmap
+
+    def _get_integer(self, key):
+        """
+        Returns the bitmap of a piece type and a cell as an integer.
+        :param key: A (symbol, row, column) tuple.
+        :return: An integer.
+        """
+        integer = self._integers.get(key)
+        if integer is None:
+            bitmap = self._bitmaps.get(key)
+            integer = 0
+            if bitmap:
+                # the first byte holds the lowest ids
+                integer = long(binascii.hexlify(str(bitmap[::-1])), 16)
+            self._integers[key] = integer
+        return integer
+
+    def query(self, include=(), exclude=()):
+        """
+        Finds the solutions that have a piece matching every
+        included term and no piece matching any excluded term.
+        :param include: An iterable of (symbol, row, column) terms.
+        :param exclude: An iterable of (symbol, row, column) terms.
+        :return: An integer, the bitmap of the matching solutions.
+        """
+        bitmap = self.all_ids
+        for term in include:
+            bitmap &= self.get_bitmap(*term)
+        for term in exclude:
+            bitmap &= ~self.get_bitmap(*term)
+        return bitmap
+
+    def count(self, include=(), exclude=()):
+        """
+        Counts the solutions that match a query, see query().
+        :param include: An iterable of (symbol, row, column) terms.
+        :param exclude: An iterable of (symbol, row, column) terms.
+        :return: An integer.
+        """
+        return bin(self.query(include, exclude)).count('1')
+
+    def select(self, include=(), exclude=()):
+        """
+        Returns the solutions that match a query, see query().
+        :param include: An iterable of (symbol, row, column) terms.
+        :param exclude: An iterable of (symbol, row, column) terms.
+        :return: A list of the solutions ordered by their id.
+        """
+        bitmap = self.query(include, exclude)
+        solutions = []
+        while bitmap:
+            bit = bitmap & -bitmap
+            bitmap ^= bit
+            solutions.append(self.solutions[bit.bit_length() - 1])
+        return solutions
@@ -0,0 +1,290 @@
+"""
+Includes the sweeps: the piece-count sweep counts the configurations of
+every combination of the numbers of pieces of each type in some ranges in
+a single pass, and the dimension sweep counts the configurations of the
+same pieces on a range of board sizes on a pool of processes.
+
+A configuration of a combination is a prefix of the configurations of
+the larger ones, so the search places the pieces as the counting engine
+does but may stop placing a type at any point, and counts the
+configurations of all the combinations below a residual problem at once:
+a vector of counts indexed by the number of pieces of each type placed
+from there on. The vectors of the residual problems are kept in the
+transposition table of the counter, shared by the whole sweep.
+
+An MxN board is the NxM board transposed, so the dimension sweep only
+counts the sizes with no more rows than columns.
+"""
+import itertools
+import multiprocessing
+import operator
+from counting import ConfigurationCounter
+from fast_paths import dispatch_count
+from pieces import PIECE_TYPES
+from chess_exceptions import InvalidArgumentException
+
+
+def parse_ranges(text):
+    """
+    Parses the ranges of the numbers of pieces of each type,
+    e.g. "K=0-3,Q=0-2,N=4".
+    :param text: A string of comma separated SYMBOL=LOW-HIGH
+    or SYMBOL=COUNT items.
+    :return: A dict that maps a piece symbol to a (low, high) tuple.
+    """
+    symbols = [symbol for symbol, _ in PIECE_TYPES]
+    ranges = {}
+    for item in text.split(','):
+        try:
+            symbol, bounds = item.strip().split('=')
+            symbol = symbol.strip().upper()
+            if '-' in bounds:
+                low, high = [int(bound) for bound in bounds.split('-')]
+            else:
+                low = high = int(bounds)
+        except ValueError:
+            raise InvalidArgumentException("malformed sweep range: %s" % item)
+        if symbol not in symbols:
+            raise InvalidArgumentException("unknown piece type: %s" % symbol)
+        if low < 0 or low > high:
+            raise InvalidArgumentException("invalid sweep range: %s" % item)
+        if symbol in ranges:
+            raise InvalidArgumentException(
+                "piece type %s is swept more than once" % symbol
+            )
+        ranges[symbol] = (low, high)
+    return ranges
+
+
+class SweepCounter(object):
+    """
+    Counts the configurations of all the combinations of up to
+    a number of pieces of each type.
+    """
+    def __init__(self, rows, columns, counts, table_size=1000000):
+        """
+        Initializes a new instance of the SweepCounter class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :param counts: A dict that maps a piece symbol to the
+        maximum number of pieces of that type.
+        :param table_size: An integer that represents the maximum
+        number of the entries of the transposition table.
+        :return: A new instance of the SweepCounter class.
+        """
+        self.counter = ConfigurationCounter(rows, columns, counts, table_size)
+        self.transpositions = self.counter.transpositions
+        # the vector of the types from an index on is indexed by the
+        # numbers of their pieces, the first type being the most
+        # significant digit, so it is as long as the product of
+        # their maximum numbers of pieces plus one
+        self._sizes = [1]
+        for count in reversed(self.counter.counts):
+            self._sizes.insert(0, self._sizes[0] * (count + 1))
+        super(SweepCounter, self).__init__()
+
+    def count_all(self):
+        """
+        Counts the configurations of all the combinations.
+        :return: A dict that maps a tuple of the numbers of pieces of each
+        type, in the order of the symbols of the counter, to an integer.
+        """
+        masks = (self.counter.table.full_mask,) * len(self.counter.symbols)
+        vector = self._count(0, self.counter.counts, masks)
+        bounds = [xrange(count + 1) for count in self.counter.counts]
+        return dict(zip(itertools.product(*bounds), vector))
+
+    def _count(self, current, remaining, masks):
+        """
+        Counts the completions of a residual problem for all the numbers
+        of the pieces placed from the current type on.
+        :param current: An integer, the index of the type being placed.
+        :param remaining: A tuple of the maximum number of the remaining
+        pieces of each type, in the order of the symbols of the counter.
+        :param masks: A tuple of the bitmasks of the cells each
+        piece type can take, in the same order.
+        :return: A list of integers.
+        """
+        if current == len(remaining):
+            return [1]
+        key = (current, remaining, masks)
+        vector = self.transpositions.get(key)
+        if vector is not None:
+            return vector
+
+        # no more pieces of the current type
+        step = self._sizes[current + 1]
+        rest = list(remaining)
+        rest[current] = 0
+        rest_masks = list(masks)
+        rest_masks[current] = 0
+        vector = self._count(current + 1, tuple(rest), tuple(rest_masks)) +\
+            [0] * (self._sizes[current] - step)
+        if remaining[current]:
+            # one more piece of the current type, its completions
+            # are shifted by one piece of the type
+            next_remaining = list(remaining)
+            next_remaining[current] -= 1
+            next_remaining = tuple(next_remaining)
+            shifted = [0] * (self._sizes[current] - step)
+            available = masks[current]
+            while available:
+                bit = available & -available
+                available ^= bit
+                completions = self._count(
+                    current, next_remaining,
+                    self.counter.place(current, bit, next_remaining, masks,
+                                       available))
+                shifted = map(operator.add, shifted,
+                              completions[:len(shifted)])
+            vector[step:] = map(operator.add, vector[step:], shifted)
+        self.transpositions.put(key, vector)
+        return vector
+
+
+def sweep_counts(rows, columns, ranges, table_size=1000000):
+    """
+    Counts the configurations of every combination of the numbers
+    of pieces in the ranges.
+    :param rows: An integer that represents the number of rows.
+    :param columns: An integer that represents the number of columns.
+    :param ranges: A dict that maps a piece symbol to a (low, high) tuple.
+    :param table_size: An integer that represents the maximum
+    number of the entries of the transposition table.
+    :return: A tuple of the results and the sweep counter, the results
+    being a list of (counts, total) tuples ordered by the number of
+    pieces, the counts being a dict that maps a piece symbol to a number.
+    """
+    sweep = SweepCounter(rows, columns,
+                         dict((symbol, high)
+                              for symbol, (_, high) in ranges.items()),
+                         table_size)
+    totals = sweep.count_all()
+    symbols = [symbol for symbol, _ in PIECE_TYPES if symbol in ranges]
+    combinations = sorted(
+        itertools.product(*[xrange(ranges[symbol][0], ranges[symbol][1] + 1)
+                            for symbol in symbols]),
+        key=lambda combination: (sum(combination), combination))
+    results = []
+    for combination in combinations:
+        counts = dict(zip(symbols, combination))
+        key = tuple(counts[symbol] for symbol in sweep.counter.symbols)
+        results.append((counts, totals.get(key, 0)))
+    return results, sweep
+
+
+def render_table(results):
+    """
+    Renders the results of a sweep as a text table.
+    :param results: A list of (counts, total) tuples, see sweep_counts().
+    :return: A string.
+    """
+    if not results:
+        return ''
+    symbols = [symbol for symbol, _ in PIECE_TYPES if symbol in results[0][0]]
+    lines = [symbols + ["count"]]
+    for counts, total in results:
+        lines.append([str(counts[symbol]) for symbol in symbols] +
+                     [str(total)])
+    return _render_lines(lines)
+
+
+def parse_sizes(text):
+    """
+    Parses a range of board sizes, e.g. "3x3-10x10".
+    :param text: A string of the smallest and the largest sizes
+    as ROWSxCOLUMNS separated by "-".
+    :return: A tuple of the smallest and the largest number of rows
+    and the smallest and the largest number of columns.
+    """
+    try:
+        smallest, largest = text.lower().split('-')
+        min_rows, min_columns = [int(part) for part in smallest.split('x')]
+        max_rows, max_columns = [int(part) for part in largest.split('x')]
+    except ValueError:
+        raise InvalidArgumentException("malformed board sizes: %s" % text)
+    if min_rows < 1 or min_columns < 1 or min_rows > max_rows or\
+            min_columns > max_columns:
+        raise InvalidArgumentException("invalid board sizes: %s" % text)
+    return min_rows, max_rows, min_columns, max_columns
+
+
+def count_size(task):
+    """
+    Counts the configurations of the pieces on a board size.
+    :param task: A tuple of the rows, columns, piece counts
+    and transposition table size.
+    :return: A tuple of the rows, the columns and the count.
+    """
+    rows, columns, counts, table_size = task
+    total, _ = dispatch_count(rows, columns, counts, table_size)
+    return rows, columns, total
+
+
+def sweep_sizes(rows, columns, counts, processes=None, table_size=1000000):
+    """
+    Counts the configurations of the same pieces on a range of board
+    sizes. Only one of the MxN and NxM sizes is counted, and the sizes
+    are handed to the processes from the largest one, so the longest
+    tasks do not end up running alone at the end.
+    :param rows: A (low, high) tuple of the numbers of rows.
+    :param columns: A (low, high) tuple of the numbers of columns.
+    :param counts: A dict that maps a piece symbol to the
+    number of pieces of that type.
+    :param processes: An integer that represents the number of
+    processes, the number of CPUs is used by default.
+    :param table_size: An integer that represents the maximum
+    number of the entries of the transposition tables.
+    :return: A dict that maps a (rows, columns) tuple to the count.
+    """
+    sizes = [(size_rows, size_columns)
+             for size_rows in xrange(rows[0], rows[1] + 1)
+             for size_columns in xrange(columns[0], columns[1] + 1)]
+    tasks = [(size_rows, size_columns, counts, table_size)
+             for size_rows, size_columns in sorted(
+                 set((min(size), max(size)) for size in sizes),
+                 key=lambda size: (size[0] * size[1], size), reverse=True)]
+    totals = {}
+    pool = multiprocessing.Pool(processes)
+    try:
+        for size_rows, size_columns, total in pool.imap_unordered(count_size,
+                                                                  tasks):
+            totals[size_rows, size_columns] = total
+    finally:
+        pool.terminate()
+        pool.join()
+    return dict((size, totals[min(size), max(size)]) for size in sizes)
+
+
+def render_size_table(totals):
+    """
+    Renders the results of a dimension sweep as a text table
+    with a row for every number of rows and a column for
+    every number of columns.
+    :param totals: A dict that maps a (rows, columns) tuple to the count.
+    :return: A string.
+    """
+    if not totals:
+        return ''
+    rows = sorted(set(size_rows for size_rows, _ in totals))
+    columns = sorted(set(size_columns for _, size_columns in totals))
+    lines = [["MxN"] + [str(size_columns) for size_columns in columns]]
+    for size_rows in rows:
+        lines.append([str(size_rows)] +
+                     [str(totals.get((size_rows, size_columns), ''))
+                      for size_columns in columns])
+    return _render_lines(lines)
+
+
+def _render_lines(lines):
+    """
+    Renders the lines of a table with every column right-aligned
+    to its widest cell.
+    :param lines: A list of lists of strings, the header line first.
+    :return: A string.
+    """
+    widths = [max(len(line[index]) for line in lines)
+              for index in xrange(len(lines[0]))]
+    return '\n'.join(' '.join(cell.rjust(width)
+                              for cell, width in zip(line, widths))
+                     for line in lines) + '\n'
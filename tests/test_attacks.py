@@ -0,0 +1,67 @@
+"""
+Includes test classes for the attack tables.
+"""
+
+import unittest
+from attacks import AttackTable, get_attack_table
+from chess_exceptions import InvalidArgumentException
+
+
+def to_mask(columns, cells):
+    """
+    Builds the bitmask of a list of cells.
+    :param columns: An integer that represents the number of columns.
+    :param cells: A list of (row, column) tuples.
+    :return: An integer bitmask.
+    """
+    mask = 0
+    for row, column in cells:
+        mask |= 1 << (row * columns + column)
+    return mask
+
+
+class TestAttackTable(unittest.TestCase):
+    """
+    Testing the attack table functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with the attack table of a 3x4 board.
+        :return: None.
+        """
+        self.table = AttackTable(3, 4)
+
+    def test_get_mask(self):
+        """
+        test getting the cells attacked by the different piece types.
+        :return: None.
+        """
+        self.assertEqual(self.table.get_mask("K", 0),
+                         to_mask(4, [(0, 1), (1, 0), (1, 1)]))
+        self.assertEqual(self.table.get_mask("N", 5),
+                         to_mask(4, [(0, 3), (2, 3)]))
+        self.assertEqual(self.table.get_mask("R", 5),
+                         to_mask(4, [(1, 0), (1, 2), (1, 3), (0, 1), (2, 1)]))
+        self.assertEqual(self.table.get_mask("B", 5),
+                         to_mask(4, [(0, 0), (2, 2), (0, 2), (2, 0)]))
+        self.assertEqual(self.table.get_mask("Q", 5),
+                         self.table.get_mask("R", 5) |
+                         self.table.get_mask("B", 5))
+
+        with self.assertRaises(InvalidArgumentException):
+            self.table.get_mask("X", 0)
+
+    def test_full_mask(self):
+        """
+        test getting the bitmask of all the cells.
+        :return: None.
+        """
+        self.assertEqual(self.table.full_mask, 4095)
+
+    def test_get_attack_table(self):
+        """
+        test that the tables are built once for each board size.
+        :return: None.
+        """
+        self.assertTrue(get_attack_table(3, 4) is get_attack_table(3, 4))
+        self.assertFalse(get_attack_table(3, 4) is get_attack_table(4, 3))
@@ -3,8 +3,11 @@ Includes test classes for the board type.
 """
 
 import unittest
-from pieces import Rook, King
-from board import Board
+from pieces import Rook, King, Queen, Knight, create_pieces
+from board import Board, SparseBoard, AttackIndex, STRATEGIES, MOVES,\
+    FREE, SAFE
+from chess_exceptions import InvalidArgumentException
+from export import SolutionBuffer
 
 
 class BoardCell(unittest.TestCase):
@@ -76,6 +79,18 @@ class BoardCell(unittest.TestCase):
         self.assertEqual(self.board.get_hash(), 3567L)
         self.assertEqual(self.board.get_hash(0, 0, 0), 1503L)
 
+    def test_get_placement(self):
+        """
+        test getting the positions of the pieces on the board.
+        :return: None.
+        """
+        self.setUp()
+        self.king1.move(2, 0)
+        self.rook.move(2, 1)
+        self.king2.move(0, 2)
+        self.assertEqual(self.board.get_placement(),
+                         ((0, 2, "K"), (2, 0, "K"), (2, 1, "R")))
+
     def test_get_next_available_pos(self):
         """
         test getting the next available position on the board.
@@ -127,6 +142,37 @@ class BoardCell(unittest.TestCase):
         self.board.calculate_attacks()
         self.assertEqual(self.board.has_attacked_piece(), False)
 
+    def test_is_attacked(self):
+        """
+        test checking if a cell is attacked by any piece on the board.
+        :return: None.
+        """
+        self.setUp()
+        self.king1.move(2, 0)
+        self.king2.move(2, 2)
+        self.rook.move(0, 2)
+        self.assertEqual(self.board.is_attacked(1, 1), True)
+        self.assertEqual(self.board.is_attacked(0, 0), True)
+        self.assertEqual(self.board.is_attacked(1, 0), True)
+        self.assertEqual(self.board.is_attacked(2, 2), True)
+        self.assertEqual(self.board.is_attacked(2, 0), False)
+
+    def test_attacks_any(self):
+        """
+        test checking if a piece placed on a cell would
+        attack any of the pieces on the board.
+        :return: None.
+        """
+        self.setUp()
+        self.king1.move(2, 0)
+        self.king2.move(2, 2)
+        self.rook.move(0, 2)
+        self.assertEqual(self.board.attacks_any(Queen, 1, 1), True)
+        self.assertEqual(self.board.attacks_any(Rook, 1, 1), False)
+        self.assertEqual(self.board.attacks_any(Knight, 0, 1), True)
+        self.assertEqual(self.board.attacks_any(King(), 0, 0), False)
+        self.assertEqual(self.board.attacks_any(Rook, 0, 2), True)
+
     def reset_position(self):
         """
         test resetting the board pieces.
@@ -152,3 +198,234 @@ class BoardCell(unittest.TestCase):
         self.setUp()
         solutions = self.board.find_independent_configurations()
         self.assertEqual(sorted(solutions), [1406L, 1469L, 1759L, 1951L])
+
+    def test_find_all_configurations(self):
+        """
+        test finding all the unique configurations exactly
+        through the conflict graph.
+        :return: None.
+        """
+        solutions = self.board.find_all_configurations()
+        self.assertEqual(sorted(solutions),
+                         [((0, 0, "K"), (0, 2, "K"), (2, 1, "R")),
+                          ((0, 0, "K"), (1, 2, "R"), (2, 0, "K")),
+                          ((0, 1, "R"), (2, 0, "K"), (2, 2, "K")),
+                          ((0, 2, "K"), (1, 0, "R"), (2, 2, "K"))])
+
+    def test_get_safe_postions(self):
+        """
+        test getting the free positions where a piece
+        is neither attacked nor attacks.
+        :return: None.
+        """
+        king1 = King()
+        king2 = King()
+        board = Board(4, 4, [king1, king2])
+        king1.move(2, 0)
+        king2.move(3, 3)
+        king1.move(0, 0)
+        self.assertEqual(board.get_safe_postions(king1),
+                         [(0, 1), (0, 2), (0, 3), (1, 0), (1, 1), (1, 2),
+                          (1, 3), (2, 0), (2, 1), (3, 0), (3, 1)])
+        self.assertEqual(board.get_available_postions(),
+                         [(0, 1), (0, 2), (0, 3), (1, 0), (1, 1), (1, 2),
+                          (1, 3), (2, 0), (2, 1), (2, 2), (2, 3), (3, 0),
+                          (3, 1), (3, 2)])
+
+    def test_choose_strategy(self):
+        """
+        test choosing the strategy for the size and the density.
+        :return: None.
+        """
+        self.assertEqual(self.board.choose_strategy(), FREE)
+        self.assertEqual(Board(8, 8, create_pieces({"K": 2}))
+                         .choose_strategy(), SAFE)
+        self.assertEqual(Board(8, 8, create_pieces({"K": 9}))
+                         .choose_strategy(), MOVES)
+
+    def test_find_independent_confs_strategies(self):
+        """
+        test that every strategy finds unique solutions of the pieces.
+        :return: None.
+        """
+        counts = {"K": 2, "R": 1}
+        exact = self.board.find_all_configurations()
+        for strategy in STRATEGIES:
+            board = Board(3, 3, create_pieces(counts), seed=1)
+            buffer_ = SolutionBuffer(3, 3, counts)
+            solutions = board.find_independent_configurations(
+                writer=buffer_, strategy=strategy)
+            self.assertEqual(len(set(solutions)), len(solutions))
+            self.assertEqual(buffer_.count, len(solutions))
+            for index in xrange(buffer_.count):
+                self.assertIn(buffer_.get_placement(index), exact)
+        with self.assertRaises(InvalidArgumentException):
+            self.board.find_independent_configurations(strategy="all")
+
+
+class TestAttackIndex(unittest.TestCase):
+    """
+    Testing the attack index functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with an index of a 4x5 board.
+        :return: None.
+        """
+        self.index = AttackIndex(4, 5)
+        self.index.add("Q", 1, 1)
+        self.index.add("N", 3, 4)
+
+    def test_count_attacks(self):
+        """
+        test counting the pieces that attack a cell.
+        :return: None.
+        """
+        self.assertEqual(self.index.count_attacks(1, 4), 1)
+        self.assertEqual(self.index.count_attacks(2, 2), 2)
+        self.assertEqual(self.index.count_attacks(1, 1), 0)
+        self.assertEqual(self.index.count_attacks(3, 4), 0)
+        self.assertEqual(self.index.count_attacks(0, 4), 0)
+
+    def test_count_attacked(self):
+        """
+        test counting the pieces a piece placed on a cell would attack.
+        :return: None.
+        """
+        self.assertEqual(self.index.count_attacked("Q", 3, 1), 2)
+        self.assertEqual(self.index.count_attacked("N", 2, 3), 1)
+        self.assertEqual(self.index.count_attacked("K", 2, 2), 1)
+        self.assertEqual(self.index.count_attacked("B", 0, 3), 0)
+        self.assertEqual(self.index.count_attacked("Q", 1, 1), 0)
+
+    def test_get_piece(self):
+        """
+        test getting the type of the piece standing on a cell.
+        :return: None.
+        """
+        self.assertEqual(self.index.get_piece(1, 1), "Q")
+        self.assertEqual(self.index.get_piece(3, 4), "N")
+        self.assertEqual(self.index.get_piece(0, 0), None)
+
+    def test_remove(self):
+        """
+        test removing a piece from the index.
+        :return: None.
+        """
+        self.index.remove("Q", 1, 1)
+        self.assertEqual(self.index.count_attacks(2, 2), 1)
+        self.assertEqual(self.index.is_attacked(1, 4), False)
+        self.assertEqual(self.index.attacks_any("R", 3, 0), True)
+        self.index.remove("N", 3, 4)
+        self.assertEqual(self.index.attacks_any("R", 3, 0), False)
+
+
+class TestSparseBoard(unittest.TestCase):
+    """
+    Testing the sparse board functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with a sparse 3x3 board with 2 kings and 1 rook.
+        :return: None.
+        """
+        self.rook = Rook()
+        self.king1 = King()
+        self.king2 = King()
+        self.board = SparseBoard(3, 3, [self.rook, self.king1, self.king2])
+
+    def test_setup(self):
+        """
+        test that the sparse board only stores its occupied cells.
+        :return: None.
+        """
+        self.king1.move(2, 0)
+        self.rook.move(2, 1)
+        self.king2.move(2, 2)
+        self.assertEqual(self.board.matrix, None)
+        self.assertEqual(sorted(self.board.occupied),
+                         [(2, 0), (2, 1), (2, 2)])
+        self.assertEqual([self.board[row, column].attacks
+                          for row in xrange(3) for column in xrange(3)],
+                         [0, 1, 0, 1, 3, 1, 1, 2, 1])
+        self.assertEqual(self.board[2, 1].piece, self.rook)
+        self.assertEqual(self.board[2, 1].taken, True)
+        self.assertEqual(self.board[0, 0].taken, False)
+        self.assertEqual(self.board.print_board(), "0 0 0\n0 0 0\nK R K\n")
+
+    def test_available_positions(self):
+        """
+        test getting the free positions lazily.
+        :return: None.
+        """
+        self.rook.move(1, 1)
+        self.king1.move(2, 2)
+        self.king2.move(2, 0)
+        positions = self.board.get_available_postions()
+        self.assertEqual(next(positions), (0, 0))
+        self.assertEqual(list(positions),
+                         [(0, 1), (0, 2), (1, 0), (1, 2), (2, 1)])
+        self.assertEqual(self.board.get_next_available_position(4), (1, 2))
+
+    def test_get_hash(self):
+        """
+        test that the sparse board has the same hashes as the board.
+        :return: None.
+        """
+        counts = {"K": 2, "R": 1}
+        sparse = SparseBoard(3, 3, create_pieces(counts), seed=2)
+        board = Board(3, 3, create_pieces(counts), seed=2)
+        for lap in xrange(board.lap_count):
+            sparse.reset_position(lap)
+            board.reset_position(lap)
+            self.assertEqual(sparse.get_hash(), board.get_hash())
+            self.assertEqual(sparse.get_hash(1, 2, 2),
+                             board.get_hash(1, 2, 2))
+
+    def test_find_independent_configurations(self):
+        """
+        test that the sparse board finds the same configurations.
+        :return: None.
+        """
+        counts = {"K": 2, "R": 1}
+        self.assertEqual(
+            SparseBoard(3, 3, create_pieces(counts),
+                        seed=1).find_independent_configurations(),
+            Board(3, 3, create_pieces(counts),
+                  seed=1).find_independent_configurations())
+        self.assertEqual(
+            SparseBoard(3, 3, create_pieces(counts),
+                        seed=1).find_independent_configurations(
+                            strategy=SAFE),
+            Board(3, 3, create_pieces(counts),
+                  seed=1).find_independent_configurations(strategy=SAFE))
+
+    def test_large_board(self):
+        """
+        test creating a huge sparse board.
+        :return: None.
+        """
+        board = SparseBoard(5000, 5000, create_pieces({"Q": 2, "N": 1}))
+        self.assertEqual(len(board.occupied), 3)
+        self.assertEqual(board.is_attacked(0, 4999), True)
+        self.assertEqual(board[4999, 4998].attacks, 0)
+
+    def test_taken_columns(self):
+        """
+        test that the columns of the column riders are taken without
+        storing their cells, while another rider stays on the column.
+        :return: None.
+        """
+        rook1 = Rook()
+        rook2 = Rook()
+        board = SparseBoard(5000, 5000, [rook1, rook2])
+        rook1.move(10, 7)
+        rook2.move(20, 7)
+        self.assertEqual(len(board.occupied), 2)
+        self.assertEqual(board[4999, 7].taken, True)
+        rook1.move(10, 8)
+        self.assertEqual(board[4999, 7].taken, True)
+        self.assertEqual(board[0, 8].taken, True)
+        rook2.move(20, 9)
+        self.assertEqual(board[4999, 7].taken, False)
+        self.assertFalse(hasattr(board, "taken"))
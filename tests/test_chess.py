@@ -0,0 +1,117 @@
+"""
+Includes test classes for the command line of the solver.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from StringIO import StringIO
+import chess
+from chess_exceptions import InvalidArgumentException
+
+
+class TestListSolutions(unittest.TestCase):
+    """
+    Testing the listing of the solutions from the command line.
+    """
+    def setUp(self):
+        """
+        Creates the directory the solutions are written in.
+        :return: None.
+        """
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Removes the directory the solutions are written in.
+        :return: None.
+        """
+        shutil.rmtree(self.directory)
+
+    def list_solutions(self, arguments):
+        """
+        Lists the solutions of the arguments of the command line.
+        :param arguments: A list of strings, the arguments.
+        :return: A tuple of the board and the solutions.
+        """
+        argv = sys.argv
+        stdout = sys.stdout
+        sys.argv = ["chess.py"] + arguments
+        sys.stdout = StringIO()
+        try:
+            options, _ = chess.parse_args()
+            return chess.list_solutions(options, chess.get_counts(options))
+        finally:
+            sys.argv = argv
+            sys.stdout = stdout
+
+    def read_lines(self, name):
+        """
+        Reads the sorted lines of a file of the directory.
+        :param name: A string, the name of the file.
+        :return: A list of strings.
+        """
+        with open(os.path.join(self.directory, name)) as lines_file:
+            return sorted(lines_file)
+
+    def test_parallel_output(self):
+        """
+        test that the solutions found on several processes
+        are written like the ones found on a single process.
+        :return: None.
+        """
+        arguments = ["-m", "3", "-n", "3", "-K", "2", "-R", "1",
+                     "--seed", "1", "-f", "jsonl", "-o"]
+        _, solutions = self.list_solutions(
+            arguments + [os.path.join(self.directory, "single.jsonl")])
+        _, parallel_solutions = self.list_solutions(
+            arguments + [os.path.join(self.directory, "parallel.jsonl"),
+                         "-p", "2"])
+        self.assertEqual(sorted(parallel_solutions), sorted(solutions))
+        self.assertEqual(len(self.read_lines("parallel.jsonl")),
+                         len(solutions))
+        self.assertEqual(self.read_lines("parallel.jsonl"),
+                         self.read_lines("single.jsonl"))
+
+        _, solutions = self.list_solutions(
+            arguments + [os.path.join(self.directory, "sorted.jsonl"),
+                         "-p", "2", "--sorted"])
+        self.assertEqual(solutions, None)
+        self.assertEqual(self.read_lines("sorted.jsonl"),
+                         self.read_lines("single.jsonl"))
+
+    def test_sorted_output(self):
+        """
+        test that the sorted solutions of a single process and of
+        several processes are the solutions of the plain search, on
+        a board where solutions of different pieces share the cells.
+        :return: None.
+        """
+        arguments = ["-m", "4", "-n", "4", "-K", "2", "-R", "1",
+                     "--seed", "1", "-f", "jsonl", "-o"]
+        _, solutions = self.list_solutions(
+            arguments + [os.path.join(self.directory, "single.jsonl")])
+        self.assertTrue(len(set(solutions)) < len(solutions))
+        self.list_solutions(
+            arguments + [os.path.join(self.directory, "sorted.jsonl"),
+                         "--sorted"])
+        self.list_solutions(
+            arguments + [os.path.join(self.directory, "parallel.jsonl"),
+                         "-p", "2", "--sorted"])
+        lines = self.read_lines("single.jsonl")
+        self.assertEqual(len(lines), len(solutions))
+        self.assertEqual(self.read_lines("sorted.jsonl"), lines)
+        self.assertEqual(self.read_lines("parallel.jsonl"), lines)
+
+    def test_parallel_single_process_options(self):
+        """
+        test that the options of a single process
+        are refused on several processes.
+        :return: None.
+        """
+        for option in ("--exact", "--sparse"):
+            with self.assertRaises(InvalidArgumentException):
+                self.list_solutions(["-m", "3", "-n", "3", "-K", "2",
+                                     "-p", "2", option])
@@ -0,0 +1,105 @@
+"""
+Includes test classes for the conflict graph.
+"""
+
+import unittest
+from conflict_graph import ConflictGraph, get_conflict_graph
+from counting import ConfigurationCounter
+from chess_exceptions import InvalidArgumentException
+
+
+class TestConflictGraph(unittest.TestCase):
+    """
+    Testing the conflict graph functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with the conflict graph of a 3x3 board.
+        :return: None.
+        """
+        self.graph = ConflictGraph(3, 3)
+
+    def test_adjacency(self):
+        """
+        test the neighbours of a vertex.
+        :return: None.
+        """
+        king = self.graph.get_vertex("K", 0, 0)
+        for symbol, row, column, adjacent in [("K", 1, 1, True),
+                                              ("K", 0, 2, False),
+                                              ("R", 0, 2, True),
+                                              ("B", 2, 2, True),
+                                              ("N", 1, 2, True),
+                                              ("N", 2, 2, False),
+                                              ("Q", 0, 0, True)]:
+            vertex = self.graph.get_vertex(symbol, row, column)
+            self.assertEqual(bool(self.graph.adjacency[king] >> vertex & 1),
+                             adjacent)
+            self.assertEqual(bool(self.graph.adjacency[vertex] >> king & 1),
+                             adjacent)
+
+    def test_get_vertex(self):
+        """
+        test the indexes of the vertices.
+        :return: None.
+        """
+        self.assertEqual(self.graph.get_vertex("Z", 0, 0), 0)
+        self.assertEqual(self.graph.get_vertex("Q", 0, 0), 3 * 9)
+        self.assertEqual(self.graph.get_vertex("K", 2, 1), 8 * 9 + 7)
+        self.assertEqual(self.graph.get_placement([8 * 9 + 7, 3 * 9 + 1]),
+                         ((0, 1, "Q"), (2, 1, "K")))
+        self.assertRaises(InvalidArgumentException, self.graph.get_vertex,
+                          "X", 0, 0)
+
+    def test_is_independent(self):
+        """
+        test checking the conflicts of a placement.
+        :return: None.
+        """
+        self.assertEqual(self.graph.is_independent(
+            ((0, 0, "K"), (0, 2, "K"), (2, 1, "R"))), True)
+        self.assertEqual(self.graph.is_independent(
+            ((0, 0, "K"), (0, 2, "K"), (1, 1, "R"))), False)
+        self.assertEqual(self.graph.is_independent(
+            ((0, 0, "K"), (0, 0, "R"))), False)
+
+    def test_iter_independent_sets(self):
+        """
+        test enumerating the configurations of known problems.
+        :return: None.
+        """
+        self.assertEqual(sorted(self.graph.iter_independent_sets(
+            {"K": 2, "R": 1})), [((0, 0, "K"), (0, 2, "K"), (2, 1, "R")),
+                                 ((0, 0, "K"), (1, 2, "R"), (2, 0, "K")),
+                                 ((0, 1, "R"), (2, 0, "K"), (2, 2, "K")),
+                                 ((0, 2, "K"), (1, 0, "R"), (2, 2, "K"))])
+        self.assertEqual(len(list(get_conflict_graph(8, 8)
+                                  .iter_independent_sets({"Q": 8}))), 92)
+        for rows, columns, counts in [(4, 4, {"R": 2, "N": 4}),
+                                      (5, 4, {"K": 2, "Q": 1, "B": 2}),
+                                      (4, 5, {"N": 3, "B": 2, "R": 1})]:
+            sets = list(get_conflict_graph(rows, columns)
+                        .iter_independent_sets(counts))
+            self.assertEqual(len(set(sets)), len(sets))
+            self.assertEqual(set(sets), set(ConfigurationCounter(
+                rows, columns, counts).iter_placements()))
+
+    def test_no_sets(self):
+        """
+        test enumerating problems without configurations.
+        :return: None.
+        """
+        self.assertEqual(list(self.graph.iter_independent_sets({"Q": 4})),
+                         [])
+        self.assertEqual(list(self.graph.iter_independent_sets({"K": 10})),
+                         [])
+        self.assertEqual(list(self.graph.iter_independent_sets({})), [()])
+        self.assertRaises(InvalidArgumentException, list,
+                          self.graph.iter_independent_sets({"X": 1}))
+
+    def test_get_conflict_graph(self):
+        """
+        test that the graphs are kept for the next calls.
+        :return: None.
+        """
+        self.assertIs(get_conflict_graph(3, 4), get_conflict_graph(3, 4))
@@ -0,0 +1,60 @@
+"""
+Includes test classes for the cooperative solver.
+"""
+
+import unittest
+from pieces import Rook, King
+from board import Board
+from cooperative import CooperativeSolver
+
+
+class TestCooperativeSolver(unittest.TestCase):
+    """
+    Testing the cooperative solver functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with a cooperative solver of a 3x3 board.
+        :return: None.
+        """
+        self.board = Board(3, 3, [Rook(), King(), King()])
+        self.solver = CooperativeSolver(self.board, nodes=2)
+
+    def test_step(self):
+        """
+        test exploring the search a slice at a time.
+        :return: None.
+        """
+        found = self.solver.step()
+        self.assertEqual(self.solver.explored, 2)
+        self.assertEqual(found, self.solver.solutions)
+
+        while not self.solver.done:
+            self.solver.step()
+        self.assertEqual(len(set(self.solver.solutions)),
+                         len(self.solver.solutions))
+        self.assertEqual(self.solver.step(), [])
+        self.assertEqual(self.solver.board, None)
+
+    def test_iter(self):
+        """
+        test iterating over the solutions.
+        :return: None.
+        """
+        solutions = list(self.solver)
+        self.assertEqual(solutions, self.solver.solutions)
+        self.assertTrue(self.solver.done)
+        self.assertFalse(self.solver.cancelled)
+
+    def test_cancel(self):
+        """
+        test cancelling the search in the middle.
+        :return: None.
+        """
+        self.solver.step()
+        self.solver.cancel()
+        self.assertTrue(self.solver.done)
+        self.assertTrue(self.solver.cancelled)
+        self.assertEqual(self.solver.board, None)
+        self.assertEqual(self.board.cache, {})
+        self.assertEqual(self.solver.step(), [])
@@ -0,0 +1,94 @@
+"""
+Includes test classes for the counting engine.
+"""
+
+import unittest
+from counting import TranspositionTable, ConfigurationCounter,\
+    count_configurations
+from chess_exceptions import InvalidArgumentException
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """
+    Testing the transposition table functionality.
+    """
+    def test_lookups(self):
+        """
+        test storing, evicting and looking up entries.
+        :return: None.
+        """
+        table = TranspositionTable(2)
+        table.put("a", 1)
+        table.put("b", 2)
+        self.assertEqual(table.get("a"), 1)
+        table.put("c", 3)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.get("b"), None)
+        self.assertEqual(table.get("c"), 3)
+        self.assertEqual((table.hits, table.misses), (2, 1))
+        self.assertAlmostEqual(table.hit_rate, 2.0 / 3)
+
+        with self.assertRaises(InvalidArgumentException):
+            TranspositionTable(0)
+
+
+class TestConfigurationCounter(unittest.TestCase):
+    """
+    Testing the counting engine functionality.
+    """
+    def test_count(self):
+        """
+        test counting the configurations of known problems.
+        :return: None.
+        """
+        self.assertEqual(count_configurations(3, 3, {"K": 2, "R": 1})[0], 4)
+        self.assertEqual(count_configurations(4, 4, {"R": 2, "N": 4})[0], 8)
+        self.assertEqual(count_configurations(6, 6, {"Q": 6})[0], 4)
+        self.assertEqual(count_configurations(8, 8, {"Q": 8})[0], 92)
+        self.assertEqual(count_configurations(2, 2, {})[0], 1)
+        self.assertEqual(count_configurations(2, 2, {"R": 3})[0], 0)
+
+        with self.assertRaises(InvalidArgumentException):
+            ConfigurationCounter(2, 2, {"X": 1})
+
+    def test_small_table(self):
+        """
+        test that evicting entries does not change the count.
+        :return: None.
+        """
+        total, counter = count_configurations(5, 5, {"K": 2, "R": 2}, 1)
+        self.assertEqual(total, 2136)
+        self.assertEqual(len(counter.transpositions), 1)
+
+    def test_masks(self):
+        """
+        test counting with restricted cells.
+        :return: None.
+        """
+        counter = ConfigurationCounter(3, 3, {"R": 1, "K": 2})
+        self.assertEqual(counter.count([0b111000111, 0b111000111]), 2)
+
+    def test_iter_placements(self):
+        """
+        test enumerating the configurations.
+        :return: None.
+        """
+        counter = ConfigurationCounter(3, 3, {"R": 1, "K": 2})
+        self.assertEqual(sorted(counter.iter_placements()), [
+            ((0, 0, "K"), (0, 2, "K"), (2, 1, "R")),
+            ((0, 0, "K"), (1, 2, "R"), (2, 0, "K")),
+            ((0, 1, "R"), (2, 0, "K"), (2, 2, "K")),
+            ((0, 2, "K"), (1, 0, "R"), (2, 2, "K"))])
+
+    def test_iter_states(self):
+        """
+        test enumerating the placements of the first types.
+        :return: None.
+        """
+        counter = ConfigurationCounter(3, 3, {"R": 1, "K": 2})
+        states = list(counter.iter_states(1))
+        self.assertEqual(len(states), 9)
+        placement, masks = states[0]
+        self.assertEqual(placement, ((0, 0, "R"),))
+        self.assertEqual(masks[1], counter.get_masks(placement)[1])
+        self.assertEqual(masks, (0, 0b110100000))
@@ -0,0 +1,106 @@
+"""
+Includes test classes for the solver daemon.
+"""
+
+import json
+import socket
+import threading
+import unittest
+import daemon
+from board import Board
+from pieces import create_pieces
+from output import read_jsonl
+from chess_exceptions import InvalidArgumentException, InvalidSetupException
+
+
+class TestSolverService(unittest.TestCase):
+    """
+    Testing the solver service and its server.
+    """
+    def setUp(self):
+        """
+        setup the test with a solver service of 2 workers.
+        :return: None.
+        """
+        self.service = daemon.SolverService(2, cache_size=1)
+        self.problem = {"rows": 3, "columns": 3, "pieces": {"K": 2, "R": 1}}
+
+    def tearDown(self):
+        """
+        stop the workers of the solver service.
+        :return: None.
+        """
+        self.service.close()
+
+    def test_get_key(self):
+        """
+        test getting the key of a problem.
+        :return: None.
+        """
+        self.assertEqual(daemon.get_key(self.problem),
+                         (3, 3, (("K", 2), ("R", 1))))
+
+        with self.assertRaises(InvalidArgumentException):
+            daemon.get_key({"rows": 3})
+
+        with self.assertRaises(InvalidArgumentException):
+            daemon.get_key({"rows": 3, "columns": 3, "pieces": {"X": 1}})
+
+    def test_solve(self):
+        """
+        test solving problems with cached and coalesced results.
+        :return: None.
+        """
+        results = [self.service.solve(self.problem) for _ in xrange(3)]
+        self.assertEqual([cached for _, cached in results], [False] * 3)
+        solutions = [[] for _ in results]
+        threads = [threading.Thread(target=placements.extend,
+                                    args=(iterable,))
+                   for placements, (iterable, _) in zip(solutions, results)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(solutions[1], solutions[0])
+        self.assertEqual(solutions[2], solutions[0])
+        self.assertEqual(len(set(solutions[0])), len(solutions[0]))
+        self.assertTrue(set(solutions[0]) <= set(
+            Board(3, 3, create_pieces({"K": 2, "R": 1}))
+            .find_all_configurations()))
+
+        cached_solutions, cached = self.service.solve(self.problem)
+        self.assertTrue(cached)
+        self.assertEqual(list(cached_solutions), solutions[0])
+
+        with self.assertRaises(InvalidSetupException):
+            self.service.solve({"rows": 1, "columns": 1, "pieces": {"K": 2}})
+
+    def test_server(self):
+        """
+        test streaming the solutions over a TCP connection.
+        :return: None.
+        """
+        server = daemon.create_server(self.service)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            connection = socket.create_connection(server.server_address)
+            connection.sendall(json.dumps(self.problem) + "\ngarbage\n")
+            connection.shutdown(socket.SHUT_WR)
+            lines = [json.loads(line)
+                     for line in connection.makefile().read().splitlines()]
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        solutions = list(read_jsonl(json.dumps(line) for line in lines
+                                    if "pieces" in line))
+        self.assertTrue(solutions)
+        self.assertEqual(lines[-2], {"count": len(solutions), "cached": False})
+        self.assertTrue("error" in lines[-1])
+        self.assertEqual(len(set(solutions)), len(solutions))
+        self.assertTrue(set(solutions) <= set(
+            Board(3, 3, create_pieces({"K": 2, "R": 1}))
+            .find_all_configurations()))
@@ -0,0 +1,98 @@
+"""
+Includes test classes for the flat solution buffer.
+"""
+
+import os
+import tempfile
+import unittest
+from export import SolutionBuffer, read_header, open_memmap, numpy
+from board import Board
+from pieces import create_pieces
+from chess_exceptions import InvalidArgumentException
+
+
+class TestSolutionBuffer(unittest.TestCase):
+    """
+    Testing the solution buffer functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with a buffer of the solutions
+        of a 3x3 board with 2 kings and 1 rook.
+        :return: None.
+        """
+        counts = {"K": 2, "R": 1}
+        self.buffer = SolutionBuffer(3, 3, counts)
+        self.solutions = Board(3, 3, create_pieces(counts))\
+            .find_all_configurations(self.buffer)
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        """
+        remove the solution file of the test.
+        :return: None.
+        """
+        os.remove(self.path)
+
+    def test_write(self):
+        """
+        test writing the solutions into the buffer.
+        :return: None.
+        """
+        self.assertEqual(self.buffer.symbols, "KKR")
+        self.assertEqual(self.buffer.count, 4)
+        self.assertEqual(list(self.buffer.cells[:3]), [0, 6, 5])
+        for index, placement in enumerate(self.solutions):
+            self.assertEqual(self.buffer.get_placement(index), placement)
+        self.assertRaises(InvalidArgumentException, self.buffer.write,
+                          ((0, 0, "K"), (2, 2, "Q")))
+        self.assertRaises(InvalidArgumentException, self.buffer.write,
+                          ((0, 0, "K"), (0, 2, "K"), (0, 5, "R")))
+        self.assertEqual(self.buffer.count, 4)
+
+    def test_save_load(self):
+        """
+        test writing the solutions to a file and reading them back.
+        :return: None.
+        """
+        self.buffer.save(self.path)
+        self.assertEqual(read_header(self.path), (3, 3, "KKR", 20))
+        loaded = SolutionBuffer.load(self.path)
+        self.assertEqual(loaded.symbols, "KKR")
+        self.assertEqual(loaded.cells, self.buffer.cells)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_to_array(self):
+        """
+        test viewing the solutions as a NumPy array.
+        :return: None.
+        """
+        cells = self.buffer.to_array()
+        self.assertEqual(cells.shape, (4, 3))
+        self.assertEqual(cells[0].tolist(), [0, 6, 5])
+        self.assertEqual(self.buffer.get_types().tolist(), ["K", "K", "R"])
+        cells[0, 2] = 5
+        self.assertEqual(self.buffer.cells[2], 5)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_open_memmap(self):
+        """
+        test mapping a solution file to a NumPy array.
+        :return: None.
+        """
+        self.buffer.save(self.path)
+        cells, types = open_memmap(self.path)
+        self.assertEqual(cells.tolist(), self.buffer.to_array().tolist())
+        self.assertEqual(types.tolist(), ["K", "K", "R"])
+        SolutionBuffer(3, 3, {"Q": 1}).save(self.path)
+        self.assertEqual(open_memmap(self.path)[0].shape, (0, 1))
+
+    def test_not_a_solution_file(self):
+        """
+        test reading a file that is not a solution file.
+        :return: None.
+        """
+        with open(self.path, 'w') as solutions_file:
+            solutions_file.write("not a solution file")
+        self.assertRaises(InvalidArgumentException, read_header, self.path)
@@ -0,0 +1,61 @@
+"""
+Includes test classes for the extension of solutions.
+"""
+
+import unittest
+from extension import get_safe_cells, iter_extensions, extend_solutions
+from conflict_graph import get_conflict_graph
+
+
+class TestExtension(unittest.TestCase):
+    """
+    Testing the extension functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with the conflict graph of a 3x3 board.
+        :return: None.
+        """
+        self.graph = get_conflict_graph(3, 3)
+
+    def test_get_safe_cells(self):
+        """
+        test finding the cells a new piece can be added on.
+        :return: None.
+        """
+        placement = ((0, 0, "K"), (1, 2, "R"))
+        self.assertEqual(get_safe_cells(self.graph, placement, "K"), 1 << 6)
+        self.assertEqual(get_safe_cells(self.graph, placement, "B"), 1 << 6)
+        self.assertEqual(get_safe_cells(self.graph, placement, "Q"), 0)
+        self.assertEqual(get_safe_cells(self.graph, (), "N"), (1 << 9) - 1)
+
+    def test_iter_extensions(self):
+        """
+        test enumerating the extensions of a placement.
+        :return: None.
+        """
+        self.assertEqual(list(iter_extensions(self.graph,
+                                              ((0, 0, "K"), (2, 1, "R")),
+                                              "K")),
+                         [((0, 0, "K"), (0, 2, "K"), (2, 1, "R"))])
+        self.assertEqual(list(iter_extensions(self.graph, (), "R")),
+                         [((row, column, "R"),) for row in xrange(3)
+                          for column in xrange(3)])
+
+    def test_extend_solutions(self):
+        """
+        test that extending all the solutions of a problem
+        gives all the solutions of the larger problem.
+        :return: None.
+        """
+        for rows, columns, counts, symbol in [(3, 3, {"K": 1, "R": 1}, "K"),
+                                              (8, 8, {"Q": 7}, "Q"),
+                                              (4, 5, {"B": 2, "N": 1}, "R"),
+                                              (4, 4, {}, "N")]:
+            graph = get_conflict_graph(rows, columns)
+            extended = dict(counts)
+            extended[symbol] = extended.get(symbol, 0) + 1
+            self.assertEqual(
+                extend_solutions(rows, columns,
+                                 graph.iter_independent_sets(counts), symbol),
+                sorted(graph.iter_independent_sets(extended)))
@@ -0,0 +1,117 @@
+"""
+Includes test classes for the external sorter of the solutions.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from external_sort import ExternalSorter, encode, decode
+from chess_exceptions import InvalidArgumentException
+from board import Board
+from pieces import create_pieces
+
+
+class TestExternalSorter(unittest.TestCase):
+    """
+    Testing the external sorter functionality.
+    """
+    def setUp(self):
+        """
+        Creates the directory the runs are written in.
+        :return: None.
+        """
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Removes the directory the runs are written in.
+        :return: None.
+        """
+        shutil.rmtree(self.directory)
+
+    def test_encode(self):
+        """
+        test encoding a placement as a line of a run and back.
+        :return: None.
+        """
+        placement = ((0, 1, 'Q'), (10, 2, 'K'))
+        self.assertEqual(encode(placement), "0,1,Q 10,2,K\n")
+        self.assertEqual(decode(encode(placement)), placement)
+
+    def test_invalid_arguments(self):
+        """
+        test creating a sorter with invalid sizes.
+        :return: None.
+        """
+        self.assertRaises(InvalidArgumentException, ExternalSorter, 0)
+        self.assertRaises(InvalidArgumentException, ExternalSorter, 10, 1)
+
+    def test_merge_runs(self):
+        """
+        test sorting and removing the repetitions over several runs,
+        with more runs than are merged at once.
+        :return: None.
+        """
+        placements = [((row % 7, row % 3, 'K'), (5, row % 5, 'R'))
+                      for row in xrange(50)]
+        sorter = ExternalSorter(4, fan_in=3, directory=self.directory)
+        with sorter:
+            for placement in placements:
+                sorter.write(placement)
+        self.assertEqual(sorter.count, 50)
+        self.assertTrue(len(sorter.runs) > 3)
+        self.assertEqual(list(sorter.merge()), sorted(set(placements)))
+        sorter.close()
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_memory_only(self):
+        """
+        test sorting the solutions that fit in a run,
+        no file is written.
+        :return: None.
+        """
+        sorter = ExternalSorter(directory=self.directory)
+        sorter.write(((1, 1, 'K'),))
+        sorter.write(((0, 1, 'K'),))
+        sorter.write(((1, 1, 'K'),))
+        self.assertEqual(list(sorter.merge()), [((0, 1, 'K'),),
+                                                ((1, 1, 'K'),)])
+        self.assertEqual(sorter.runs, [])
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_sorted_solutions(self):
+        """
+        test sorting the solutions of a board.
+        :return: None.
+        """
+        board = Board(4, 4, create_pieces({"Q": 2, "K": 1}), seed=1)
+        expected = sorted(board.find_all_configurations())
+        sorter = ExternalSorter(5, directory=self.directory)
+        for _ in board.iter_all_configurations(sorter):
+            pass
+        self.assertEqual(list(sorter.merge()), expected)
+        sorter.close()
+
+    def test_explored_solutions(self):
+        """
+        test sorting the solutions of a search that does not keep
+        them, the solutions found again are dropped by the sorter.
+        :return: None.
+        """
+        counts = {"K": 2, "R": 1}
+        board = Board(4, 4, create_pieces(counts), seed=1)
+        expected = ExternalSorter(directory=self.directory)
+        board.find_independent_configurations(writer=expected)
+        board = Board(4, 4, create_pieces(counts), seed=1)
+        sorter = ExternalSorter(7, directory=self.directory)
+        for _ in board.explore(writer=sorter, deduplicate=False):
+            pass
+        self.assertTrue(sorter.count > expected.count)
+        placements = list(sorter.merge())
+        self.assertEqual(placements, sorted(set(placements)))
+        self.assertEqual(list(expected.merge()), placements)
+        self.assertTrue(set(placements) <=
+                        set(board.find_all_configurations()))
+        sorter.close()
+        expected.close()
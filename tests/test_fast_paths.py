@@ -0,0 +1,67 @@
+"""
+Includes test classes for the counting fast paths.
+"""
+
+import unittest
+from fast_paths import binomial, count_rooks, count_bishops, dispatch_count
+from counting import count_configurations
+
+
+class TestFastPaths(unittest.TestCase):
+    """
+    Testing the counting fast paths.
+    """
+    def test_binomial(self):
+        """
+        test the binomial coefficients.
+        :return: None.
+        """
+        self.assertEqual(binomial(5, 2), 10)
+        self.assertEqual(binomial(5, 0), 1)
+        self.assertEqual(binomial(5, 6), 0)
+
+    def test_count_rooks(self):
+        """
+        test counting the placements of rooks.
+        :return: None.
+        """
+        self.assertEqual(count_rooks(4, 5, 3), 240)
+        self.assertEqual(count_rooks(8, 8, 8), 40320)
+        self.assertEqual(count_rooks(3, 8, 4), 0)
+
+    def test_count_bishops(self):
+        """
+        test counting the placements of bishops colour by colour.
+        :return: None.
+        """
+        for rows, columns, bishops in [(5, 5, 5), (4, 6, 6), (3, 3, 0)]:
+            self.assertEqual(
+                count_bishops(rows, columns, bishops),
+                count_configurations(rows, columns, {"B": bishops})[0])
+
+    def test_dispatch_count(self):
+        """
+        test the way the problems are dispatched.
+        :return: None.
+        """
+        self.assertEqual(dispatch_count(3, 3, {"R": 0}), (1, "empty"))
+        self.assertEqual(dispatch_count(3, 4, {"N": 1}), (12, "single piece"))
+        self.assertEqual(dispatch_count(2, 2, {"R": 5}), (0, "capacity"))
+        self.assertEqual(dispatch_count(4, 5, {"R": 3}), (240, "rooks"))
+        self.assertEqual(dispatch_count(5, 5, {"B": 5}),
+                         (3368, "bishops by colour"))
+        self.assertEqual(dispatch_count(4, 4, {"K": 4}), (79, "row profile"))
+        self.assertEqual(dispatch_count(3, 3, {"K": 2, "R": 1}),
+                         (4, "transposition table"))
+
+    def test_dispatch_wide_board(self):
+        """
+        test that the kings and the knights of the boards wider than
+        the row profile allows are counted with the transposition table.
+        :return: None.
+        """
+        for counts in ({"K": 1, "N": 1}, {"N": 2}, {"K": 2}):
+            count, method = dispatch_count(13, 14, counts)
+            self.assertEqual(method, "transposition table")
+            self.assertEqual(count,
+                             count_configurations(13, 14, counts)[0])
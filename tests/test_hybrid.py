@@ -0,0 +1,57 @@
+"""
+Includes test classes for the hybrid solver.
+"""
+
+import unittest
+from hybrid import HybridSolver
+from counting import count_configurations
+
+
+class TestHybridSolver(unittest.TestCase):
+    """
+    Testing the hybrid solver functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with a hybrid solver of a 4x4 board.
+        :return: None.
+        """
+        self.solver = HybridSolver(4, 4, {"R": 2, "N": 4})
+
+    def test_count(self):
+        """
+        test counting the configurations of known problems.
+        :return: None.
+        """
+        self.assertEqual(self.solver.count(), 8)
+        for rows, columns, counts in [(3, 3, {"K": 2, "R": 1}),
+                                      (5, 5, {"K": 2, "R": 2}),
+                                      (5, 4, {"Q": 1, "B": 1, "N": 2}),
+                                      (4, 4, {"Q": 4})]:
+            self.assertEqual(HybridSolver(rows, columns, counts).count(),
+                             count_configurations(rows, columns, counts)[0])
+
+    def test_completions(self):
+        """
+        test counting and enumerating the completions
+        of a placement of the long-range pieces.
+        :return: None.
+        """
+        long_placement = ((0, 0, "R"), (2, 2, "R"))
+        self.assertTrue(long_placement in
+                        list(self.solver.iter_long_placements()))
+        completions = list(self.solver.iter_completions(long_placement))
+        self.assertEqual(len(completions),
+                         self.solver.count_completions(long_placement))
+        self.assertTrue(((0, 0, "R"), (1, 1, "N"), (1, 3, "N"),
+                         (2, 2, "R"), (3, 1, "N"), (3, 3, "N"))
+                        in completions)
+
+    def test_iter_solutions(self):
+        """
+        test enumerating all the configurations.
+        :return: None.
+        """
+        solutions = list(self.solver.iter_solutions())
+        self.assertEqual(len(solutions), 8)
+        self.assertEqual(len(set(solutions)), 8)
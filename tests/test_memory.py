@@ -0,0 +1,86 @@
+"""
+Includes test classes for the memory report.
+"""
+
+import sys
+import unittest
+from memory import MemoryReport, get_deep_size, format_size
+from benchmark import run_problem, render_row
+from board import Board, SparseBoard
+from pieces import create_pieces
+
+
+class TestMemoryReport(unittest.TestCase):
+    """
+    Testing the memory report functionality.
+    """
+    def test_get_deep_size(self):
+        """
+        test measuring an object and the objects it holds.
+        :return: None.
+        """
+        item = (1, 2)
+        seen = set()
+        size = get_deep_size([item, item], seen)
+        self.assertEqual(size, sys.getsizeof([item, item]) +
+                         sys.getsizeof(item) + sys.getsizeof(1) +
+                         sys.getsizeof(2))
+        self.assertEqual(get_deep_size(item, seen), 0)
+
+    def test_format_size(self):
+        """
+        test formatting the sizes.
+        :return: None.
+        """
+        self.assertEqual(format_size(100), "100 B")
+        self.assertEqual(format_size(1536), "1.5 KB")
+        self.assertEqual(format_size(3 * 1024 ** 2), "3.0 MB")
+        self.assertEqual(format_size(2048 * 1024 ** 3), "2048.0 GB")
+
+    def test_measure_board(self):
+        """
+        test breaking down the memory held by a board.
+        :return: None.
+        """
+        board = Board(3, 3, create_pieces({"K": 2, "R": 1}), seed=1)
+        solutions = board.find_all_configurations()
+        report = MemoryReport()
+        report.start()
+        report.stop()
+        report.measure_board(board, solutions)
+        self.assertTrue(report.peak_rss > 0)
+        self.assertEqual([name for name, _ in report.structures],
+                         ["pieces", "cells", "cache", "solutions"])
+        for _, size in report.structures:
+            self.assertTrue(size > 0)
+        rendered = report.render()
+        self.assertTrue(rendered.startswith("Peak RSS: "))
+        self.assertIn("  solutions: ", rendered)
+
+    def test_measure_sparse_board(self):
+        """
+        test breaking down the memory held by a sparse board,
+        its cells take less than those of a board.
+        :return: None.
+        """
+        sizes = []
+        for board_type in (Board, SparseBoard):
+            board = board_type(100, 100, create_pieces({"Q": 2}), seed=1)
+            report = MemoryReport()
+            report.measure_board(board, [])
+            sizes.append(dict(report.structures)["cells"])
+        self.assertTrue(0 < sizes[1] < sizes[0] / 10)
+
+    def test_run_problem(self):
+        """
+        test measuring a problem of the benchmark.
+        :return: None.
+        """
+        result = run_problem(("3x3", 3, 3, {"K": 2, "R": 1}, "exact", 0))
+        self.assertEqual(result["solutions"], 4)
+        self.assertEqual(sorted(result["structures"]),
+                         ["cache", "cells", "pieces", "solutions"])
+        row = render_row("3x3", "exact", result)
+        self.assertTrue(row.startswith("3x3 | exact | 4 | "))
+        result = run_problem(("3x3", 3, 3, {"K": 2, "R": 1}, "free", 1))
+        self.assertTrue(0 < result["solutions"] <= 4)
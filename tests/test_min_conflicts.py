@@ -0,0 +1,102 @@
+"""
+Includes test classes for the min-conflicts solver.
+"""
+
+import unittest
+from min_conflicts import MinConflictsSolver
+from counting import ConfigurationCounter
+from chess_exceptions import InvalidSetupException, InvalidArgumentException
+
+
+class TestMinConflictsSolver(unittest.TestCase):
+    """
+    Testing the min-conflicts solver functionality.
+    """
+    def test_solve(self):
+        """
+        test that the solver finds configurations of known problems.
+        :return: None.
+        """
+        for rows, columns, counts in [(8, 8, {"Q": 8}),
+                                      (5, 5, {"K": 2, "Q": 1, "N": 3}),
+                                      (6, 4, {"R": 2, "B": 3})]:
+            placement = MinConflictsSolver(rows, columns, counts,
+                                           seed=1).solve()
+            self.assertIn(placement, set(ConfigurationCounter(
+                rows, columns, counts).iter_placements()))
+
+    def test_large_board(self):
+        """
+        test finding a configuration with many pieces on a large board.
+        :return: None.
+        """
+        counts = {"K": 10, "Q": 10, "B": 10, "R": 10, "N": 10}
+        solver = MinConflictsSolver(100, 100, counts, seed=2)
+        placement = solver.solve()
+        self.assertEqual(len(placement), 50)
+        self.assertEqual(max(solver.get_conflicts(piece)
+                             for piece in xrange(50)), 0)
+
+    def test_repair(self):
+        """
+        test a problem the greedy placement does not solve,
+        the pieces have to be moved to reach a configuration.
+        :return: None.
+        """
+        solver = MinConflictsSolver(8, 8, {"Q": 8}, seed=0)
+        placement = solver.solve()
+        self.assertTrue(solver.steps > 0)
+        self.assertIn(placement, set(ConfigurationCounter(
+            8, 8, {"Q": 8}).iter_placements()))
+
+    def test_incremental_conflicts(self):
+        """
+        test that the conflicts kept as the pieces move are the
+        ones counted from the attack index.
+        :return: None.
+        """
+        for rows, columns, counts in [(3, 3, {"Q": 3}),
+                                      (4, 4, {"K": 2, "N": 3, "Z": 1}),
+                                      (5, 5, {"A": 2, "C": 2, "L": 3})]:
+            solver = MinConflictsSolver(rows, columns, counts, seed=5,
+                                        max_steps=40, restarts=0)
+            solver.solve()
+            self.assertTrue(solver.steps > 0)
+            conflicted = []
+            for piece, symbol in enumerate(solver.symbols):
+                row, column = solver._positions[piece]
+                conflicts = solver._index.count_attacks(row, column) +\
+                    solver._index.count_attacked(symbol, row, column)
+                self.assertEqual(solver.get_conflicts(piece), conflicts)
+                if conflicts:
+                    conflicted.append(piece)
+            self.assertEqual(sorted(solver._conflicted), conflicted)
+
+    def test_no_configuration(self):
+        """
+        test giving up on a problem without configurations.
+        :return: None.
+        """
+        solver = MinConflictsSolver(3, 3, {"Q": 3}, seed=3, max_steps=50,
+                                    restarts=2)
+        self.assertEqual(solver.solve(), None)
+        self.assertEqual(solver.attempts, 3)
+        self.assertEqual(solver.steps, 150)
+
+    def test_seed(self):
+        """
+        test that the same seed finds the same configuration.
+        :return: None.
+        """
+        self.assertEqual(MinConflictsSolver(10, 10, {"Q": 10}, 4).solve(),
+                         MinConflictsSolver(10, 10, {"Q": 10}, 4).solve())
+
+    def test_invalid_problem(self):
+        """
+        test creating a solver of an invalid problem.
+        :return: None.
+        """
+        self.assertRaises(InvalidSetupException, MinConflictsSolver,
+                          2, 2, {"K": 5})
+        self.assertRaises(InvalidArgumentException, MinConflictsSolver,
+                          2, 2, {"X": 1})
@@ -0,0 +1,108 @@
+"""
+Includes test classes for the output of the solutions.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from StringIO import StringIO
+from output import SolutionWriter, render_grid, render_compact,\
+    render_fen, render_jsonl, read_jsonl, open_writer
+from chess_exceptions import InvalidArgumentException
+
+
+class TestOutput(unittest.TestCase):
+    """
+    Testing rendering and writing the solutions.
+    """
+    def setUp(self):
+        """
+        setup the test with a placement of a 3x3 board.
+        :return: None.
+        """
+        self.placement = ((0, 0, "K"), (0, 2, "K"), (2, 1, "R"))
+
+    def test_render_grid(self):
+        """
+        test rendering a placement as a grid.
+        :return: None.
+        """
+        self.assertEqual(render_grid(self.placement, 3, 3),
+                         "K 0 K\n0 0 0\n0 R 0\n\n")
+
+    def test_render_compact(self):
+        """
+        test rendering a placement as a single line list.
+        :return: None.
+        """
+        self.assertEqual(render_compact(self.placement, 3, 3),
+                         "K:0,0 K:0,2 R:2,1\n")
+
+    def test_render_fen(self):
+        """
+        test rendering a placement as FEN-like rows.
+        :return: None.
+        """
+        self.assertEqual(render_fen(self.placement, 3, 3), "K1K/3/1R1\n")
+        self.assertEqual(render_fen((), 2, 12), "12/12\n")
+
+    def test_render_jsonl(self):
+        """
+        test rendering a placement as a JSON line.
+        :return: None.
+        """
+        self.assertEqual(render_jsonl(self.placement, 3, 3),
+                         '{"pieces": [["K", 0, 0], ["K", 0, 2], '
+                         '["R", 2, 1]]}\n')
+
+    def test_read_jsonl(self):
+        """
+        test reading placements written as JSON lines.
+        :return: None.
+        """
+        stream = StringIO(render_jsonl(self.placement, 3, 3) + '\n' +
+                          '{"pieces": [["Q", 1, 1], ["N", 0, 0]]}\n')
+        self.assertEqual(list(read_jsonl(stream)),
+                         [self.placement, ((0, 0, "N"), (1, 1, "Q"))])
+        self.assertRaises(InvalidArgumentException, list,
+                          read_jsonl(StringIO('{"queens": []}\n')))
+
+    def test_writer(self):
+        """
+        test writing the solutions in batches.
+        :return: None.
+        """
+        stream = StringIO()
+        with SolutionWriter(stream, 3, 3, "fen", buffer_size=2) as writer:
+            writer.write(self.placement)
+            self.assertEqual(stream.getvalue(), "")
+            writer.write(self.placement)
+            self.assertEqual(stream.getvalue(), "K1K/3/1R1\n" * 2)
+            writer.write(self.placement)
+        self.assertEqual(stream.getvalue(), "K1K/3/1R1\n" * 3)
+        self.assertEqual(writer.count, 3)
+
+        with self.assertRaises(InvalidArgumentException):
+            SolutionWriter(stream, 3, 3, "xml")
+
+    def test_open_writer(self):
+        """
+        test that the writer of a file closes it once it exits.
+        :return: None.
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "solutions.fen")
+            with open_writer(path, 3, 3, "fen") as writer:
+                writer.write(self.placement)
+            self.assertTrue(writer.stream.closed)
+            with open(path) as solutions_file:
+                self.assertEqual(solutions_file.read(), "K1K/3/1R1\n")
+
+            with self.assertRaises(InvalidArgumentException):
+                open_writer(os.path.join(directory, "other"), 3, 3, "xml")
+            self.assertFalse(os.path.exists(os.path.join(directory,
+                                                         "other")))
+        finally:
+            shutil.rmtree(directory)
@@ -0,0 +1,40 @@
+"""
+Includes test classes for exploring the laps in parallel.
+"""
+
+import unittest
+import parallel
+from board import Board
+from pieces import create_pieces
+from chess_exceptions import InvalidSetupException
+
+
+class TestParallel(unittest.TestCase):
+    """
+    Testing the parallel exploration of the laps.
+    """
+    def test_solve_lap(self):
+        """
+        test exploring a single lap with a seed.
+        :return: None.
+        """
+        task = (3, 3, {"R": 1, "K": 2}, 7, 2, "moves")
+        self.assertEqual(parallel.solve_lap(task), parallel.solve_lap(task))
+
+    def test_find_independent_confs(self):
+        """
+        test that the parallel search does not depend
+        on the number of processes.
+        :return: None.
+        """
+        counts = {"R": 1, "K": 2}
+        solutions = parallel.find_independent_configurations(
+            4, 4, counts, 1, seed=3)
+        self.assertEqual(sorted(solutions),
+                         sorted(Board(4, 4, create_pieces(counts), seed=3)
+                                .find_independent_configurations()))
+        self.assertEqual(parallel.find_independent_configurations(
+            4, 4, counts, 3, seed=3), solutions)
+
+        with self.assertRaises(InvalidSetupException):
+            parallel.find_independent_configurations(1, 1, counts)
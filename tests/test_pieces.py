@@ -4,7 +4,9 @@ of pieces.
 """
 
 import unittest
-from pieces import Piece, King, Queen, Bishop, Rook, Knight
+from pieces import Piece, King, Queen, Bishop, Rook, Knight, Amazon,\
+    Archbishop, Chancellor, Camel, get_targets, get_move_table,\
+    create_pieces, count_pieces, MAX_TABLE_CELLS
 from board import Board
 from chess_exceptions import InvalidSetupException,\
     InvalidMoveException
@@ -69,13 +71,6 @@ class TestPieceNoBoard(unittest.TestCase):
         with self.assertRaises(InvalidSetupException):
             self.piece.get_moves()
 
-    def test_update_column_status(self):
-        """
-        test updating the column `taken` value.
-        :return: None.
-        """
-        self.assertEqual(self.piece.update_column_status(), None)
-
     def test_can_move(self):
         """
         test the can_move functionality of a piece.
@@ -185,13 +180,13 @@ class TestPiece(unittest.TestCase):
         """
         self.assertEqual(self.piece.get_moves(), [])
 
-    def test_update_column_status(self):
+    def test_taken(self):
         """
-        test updating the column `taken` value.
+        test that a piece which does not attack its
+        whole column does not take it.
         :return: None.
         """
         self.setUp()
-        self.piece.update_column_status()
 
         self.assertEqual(self.piece.board[0, 1].taken, False)
 
@@ -280,9 +275,9 @@ class TestQueen(TestPiece):
 
         self.assertEqual(moves, moves_should_be)
 
-    def test_update_column_status(self):
+    def test_taken(self):
         """
-        test updating the column `taken` value of a Queen piece.
+        test that a Queen piece takes the cells of its column.
         :return: None.
         """
         self.setUp()
@@ -418,3 +413,180 @@ class TestKnight(TestPiece):
         moves_should_be = [(0, 1), (1, 0), (3, 0), (0, 3)]
 
         self.assertEqual(moves, moves_should_be)
+
+
+class TestAmazon(TestPiece):
+    """
+    Testing an Amazon piece functionality with a board set to it.
+    """
+    def setUp(self):
+        """
+        setup the test with 1 Amazon on a board.
+        :return: None.
+        """
+        self.piece = Amazon()
+        self.piece.board = Board(4, 4, [self.piece])
+
+    def test_get_moves(self):
+        """
+        test getting the available moves of an Amazon piece,
+        the moves of a Queen followed by those of a Knight.
+        :return: None.
+        """
+        self.setUp()
+        self.piece.move(2, 2)
+
+        moves = self.piece.get_moves()
+        moves_should_be = [(0, 2), (1, 2), (3, 2), (2, 0), (2, 1),
+                           (2, 3), (3, 1), (1, 3), (0, 0), (1, 1),
+                           (3, 3), (0, 1), (1, 0), (3, 0), (0, 3)]
+
+        self.assertEqual(moves, moves_should_be)
+
+
+class TestArchbishop(TestPiece):
+    """
+    Testing an Archbishop piece functionality with a board set to it.
+    """
+    def setUp(self):
+        """
+        setup the test with 1 Archbishop on a board.
+        :return: None.
+        """
+        self.piece = Archbishop()
+        self.piece.board = Board(4, 4, [self.piece])
+
+    def test_get_moves(self):
+        """
+        test getting the available moves of an Archbishop piece.
+        :return: None.
+        """
+        self.setUp()
+
+        moves = self.piece.get_moves()
+        moves_should_be = [(1, 1), (2, 2), (3, 3), (2, 1), (1, 2)]
+        self.assertEqual(moves, moves_should_be)
+
+
+class TestChancellor(TestPiece):
+    """
+    Testing a Chancellor piece functionality with a board set to it.
+    """
+    def setUp(self):
+        """
+        setup the test with 1 Chancellor on a board.
+        :return: None.
+        """
+        self.piece = Chancellor()
+        self.piece.board = Board(4, 4, [self.piece])
+
+    def test_get_moves(self):
+        """
+        test getting the available moves of a Chancellor piece.
+        :return: None.
+        """
+        self.setUp()
+
+        moves = self.piece.get_moves()
+        moves_should_be = [(1, 0), (2, 0), (3, 0), (0, 1), (0, 2), (0, 3),
+                           (2, 1), (1, 2)]
+        self.assertEqual(moves, moves_should_be)
+
+    def test_can_move(self):
+        """
+        test the can_move functionality of a Chancellor piece, it
+        takes the cells of its column like a Rook.
+        :return: None.
+        """
+        self.piece = Chancellor()
+        second_piece = Chancellor()
+        self.piece.board = Board(4, 4, [self.piece, second_piece])
+
+        self.piece.move(2, 2)
+        second_piece.move(0, 1)
+
+        self.assertEqual(self.piece.can_move(0, 3, 1), False)
+        self.assertEqual(self.piece.can_move(0, 3, 2), True)
+
+
+class TestCamel(TestPiece):
+    """
+    Testing a Camel piece functionality with a board set to it.
+    """
+    def setUp(self):
+        """
+        setup the test with 1 Camel on a board.
+        :return: None.
+        """
+        self.piece = Camel()
+        self.piece.board = Board(4, 4, [self.piece])
+
+    def test_get_moves(self):
+        """
+        test getting the available moves of a Camel piece.
+        :return: None.
+        """
+        self.setUp()
+
+        moves = self.piece.get_moves()
+        moves_should_be = [(3, 1), (1, 3)]
+        self.assertEqual(moves, moves_should_be)
+
+        self.piece.move(3, 3)
+
+        moves = self.piece.get_moves()
+        moves_should_be = [(0, 2), (2, 0)]
+        self.assertEqual(moves, moves_should_be)
+
+
+class TestMoveTables(unittest.TestCase):
+    """
+    Testing the moves compiled from the piece definitions.
+    """
+    def test_get_targets(self):
+        """
+        test finding the cells a piece attacks from a position.
+        :return: None.
+        """
+        self.assertEqual(get_targets(Rook.riders, (), 0, 0, 2, 3),
+                         [(1, 0), (0, 1), (0, 2)])
+        self.assertEqual(get_targets((), Knight.leaps, 0, 0, 2, 3),
+                         [(1, 2)])
+        # a cell reached both ways is listed once
+        self.assertEqual(get_targets(Rook.riders, King.leaps, 0, 0, 2, 2),
+                         [(1, 0), (0, 1), (1, 1)])
+
+    def test_get_move_table(self):
+        """
+        test the moves of a piece type from every cell of a board.
+        :return: None.
+        """
+        table = get_move_table(Knight, 3, 3)
+        self.assertEqual(len(table), 9)
+        self.assertEqual(table[0], ((2, 1), (1, 2)))
+        self.assertEqual(table[4], ())
+        self.assertIs(get_move_table(Knight, 3, 3), table)
+
+    def test_count_pieces(self):
+        """
+        test counting the pieces of each type.
+        :return: None.
+        """
+        counts = {"K": 2, "R": 1, "N": 3}
+        self.assertEqual(count_pieces(create_pieces(counts)), counts)
+        self.assertEqual(count_pieces([]), {})
+
+    def test_large_board(self):
+        """
+        test that the moves on the boards too large for
+        the tables are the same.
+        :return: None.
+        """
+        rows = MAX_TABLE_CELLS // 64 + 1
+        piece = Amazon()
+        piece.board = Board(rows, 64, [piece])
+        piece.move(5, 7)
+        self.assertEqual(sorted(piece.get_moves()), sorted(get_targets(
+            Amazon.riders, Amazon.leaps, 5, 7, rows, 64)))
+        self.assertEqual(len(piece.get_moves()),
+                         rows - 1 + 63 + 61 + 12 + 8)
@@ -0,0 +1,88 @@
+"""
+Includes test classes for the profiling hook.
+"""
+
+import os
+import tempfile
+import unittest
+from profiling import get_subsystem, profile_call, summarize,\
+    get_hot_functions, render_summary, OTHER
+from board import Board
+from pieces import create_pieces
+
+
+class TestProfiling(unittest.TestCase):
+    """
+    Testing the profiling functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with the profile of a solve of a 3x3
+        board with 2 kings and 1 rook.
+        :return: None.
+        """
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        board = Board(3, 3, create_pieces({"K": 2, "R": 1}), seed=1)
+        self.stats = profile_call(board.find_independent_configurations, (),
+                                  self.path)
+
+    def tearDown(self):
+        """
+        remove the profile file of the test.
+        :return: None.
+        """
+        os.remove(self.path)
+
+    def test_get_subsystem(self):
+        """
+        test finding the subsystem of the functions.
+        :return: None.
+        """
+        self.assertEqual(get_subsystem("/src/pieces.py", "get_moves"),
+                         "move generation")
+        self.assertEqual(get_subsystem("/src/board.py", "get_hash"),
+                         "hashing")
+        self.assertEqual(get_subsystem("board.py", "__getitem__"),
+                         "board access")
+        self.assertEqual(get_subsystem("attacks.py", "get_mask"),
+                         "attack calculation")
+        self.assertEqual(get_subsystem("counting.py", "get"),
+                         "cache lookup")
+        self.assertEqual(get_subsystem("counting.py", "count_state"),
+                         "search")
+        self.assertEqual(get_subsystem("output.py", "render_grid"), "output")
+        self.assertEqual(get_subsystem("json/decoder.py", "decode"), OTHER)
+
+    def test_profile_call(self):
+        """
+        test writing the raw profile.
+        :return: None.
+        """
+        self.assertTrue(os.path.getsize(self.path) > 0)
+        self.assertTrue(self.stats.total_calls > 0)
+
+    def test_summarize(self):
+        """
+        test summing the time of the subsystems.
+        :return: None.
+        """
+        totals = summarize(self.stats)
+        subsystems = [subsystem for subsystem, _, _ in totals]
+        for subsystem in ("move generation", "attack calculation",
+                          "hashing", "board access", "search"):
+            self.assertIn(subsystem, subsystems)
+        seconds = [total for _, total, _ in totals]
+        self.assertEqual(seconds, sorted(seconds, reverse=True))
+        self.assertAlmostEqual(sum(seconds), self.stats.total_tt, places=3)
+
+    def test_render_summary(self):
+        """
+        test rendering the summary of the profile.
+        :return: None.
+        """
+        functions = get_hot_functions(self.stats, 3)
+        self.assertEqual(len(functions), 3)
+        summary = render_summary(self.stats, 3).split('\n')
+        self.assertTrue(summary[0].startswith("subsystem"))
+        self.assertEqual(len(summary), len(summarize(self.stats)) + 6)
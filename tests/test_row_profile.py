@@ -0,0 +1,50 @@
+"""
+Includes test classes for counting kings and knights row by row.
+"""
+
+import unittest
+from row_profile import RowProfileCounter, transpose
+from counting import count_configurations
+from chess_exceptions import InvalidArgumentException
+
+
+class TestRowProfileCounter(unittest.TestCase):
+    """
+    Testing the row profile counter functionality.
+    """
+    def test_count(self):
+        """
+        test counting the configurations of kings and knights.
+        :return: None.
+        """
+        for rows, columns, counts in [(3, 3, {"K": 2}), (4, 4, {"K": 4}),
+                                      (4, 5, {"K": 2, "N": 3}),
+                                      (5, 4, {"K": 3, "N": 2}),
+                                      (2, 7, {"K": 1, "N": 3}),
+                                      (6, 3, {"N": 5})]:
+            self.assertEqual(
+                RowProfileCounter(rows, columns, counts).count(),
+                count_configurations(rows, columns, counts)[0])
+        self.assertEqual(RowProfileCounter(2, 2, {}).count(), 1)
+        self.assertEqual(RowProfileCounter(2, 2, {"K": 2}).count(), 0)
+
+        with self.assertRaises(InvalidArgumentException):
+            RowProfileCounter(3, 3, {"K": 1, "Q": 1})
+
+    def test_masks(self):
+        """
+        test counting with restricted cells.
+        :return: None.
+        """
+        # the kings can only take the corners of the first row
+        counter = RowProfileCounter(3, 4, {"K": 2, "N": 1},
+                                    {"K": 0b1001, "N": 0b111111111111})
+        self.assertEqual(counter.count(), 2)
+
+    def test_transpose(self):
+        """
+        test transposing the bitmask of the cells of a board.
+        :return: None.
+        """
+        self.assertEqual(transpose(0b000011, 2, 3), 0b000101)
+        self.assertEqual(transpose(0b100000, 2, 3), 0b100000)
@@ -0,0 +1,66 @@
+"""
+Includes test classes for the uniform sampler.
+"""
+
+import unittest
+from collections import Counter
+from sampling import Sampler
+from counting import ConfigurationCounter
+from chess_exceptions import InvalidSetupException
+
+
+class TestSampler(unittest.TestCase):
+    """
+    Testing the sampler functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with a sampler of a 3x3 board with 2 kings and 1 rook.
+        :return: None.
+        """
+        self.sampler = Sampler(3, 3, {"K": 2, "R": 1}, seed=1)
+
+    def test_total(self):
+        """
+        test the number of the configurations the samples are drawn from.
+        :return: None.
+        """
+        self.assertEqual(self.sampler.total, 4)
+
+    def test_sample(self):
+        """
+        test that the samples are configurations of the problem.
+        :return: None.
+        """
+        solutions = set(ConfigurationCounter(3, 3, {"K": 2, "R": 1})
+                        .iter_placements())
+        for placement in self.sampler.samples(50):
+            self.assertIn(placement, solutions)
+
+    def test_uniform(self):
+        """
+        test that every configuration is drawn about as often.
+        :return: None.
+        """
+        sampler = Sampler(4, 4, {"R": 2, "N": 4}, seed=2)
+        drawn = Counter(sampler.samples(4000))
+        self.assertEqual(len(drawn), 8)
+        for count in drawn.values():
+            self.assertTrue(400 < count < 600)
+
+    def test_seed(self):
+        """
+        test that the same seed draws the same samples.
+        :return: None.
+        """
+        self.assertEqual(Sampler(5, 5, {"Q": 3}, seed=7).samples(10),
+                         Sampler(5, 5, {"Q": 3}, seed=7).samples(10))
+
+    def test_no_configurations(self):
+        """
+        test sampling a problem without configurations.
+        :return: None.
+        """
+        sampler = Sampler(2, 2, {"Q": 2})
+        self.assertEqual(sampler.total, 0)
+        self.assertRaises(InvalidSetupException, sampler.sample)
@@ -0,0 +1,93 @@
+"""
+Includes test classes for splitting a problem into shards
+and merging their results.
+"""
+
+import unittest
+import shards
+from board import Board
+from external_sort import ExternalSorter
+from pieces import create_pieces
+from chess_exceptions import InvalidArgumentException
+
+
+class TestShards(unittest.TestCase):
+    """
+    Testing the shards functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with the shards of a 3x3 board problem.
+        :return: None.
+        """
+        self.descriptors = shards.split_problem(3, 3, {"R": 1, "K": 2,
+                                                       "Q": 0}, 2)
+
+    def test_split_problem(self):
+        """
+        test splitting a problem into shard descriptors.
+        :return: None.
+        """
+        self.assertEqual(len(self.descriptors), 2)
+        self.assertEqual(self.descriptors[0]["laps"], [0, 2, 4, 6])
+        self.assertEqual(self.descriptors[1]["laps"], [1, 3, 5])
+        self.assertEqual(self.descriptors[0]["pieces"], {"R": 1, "K": 2})
+
+        with self.assertRaises(InvalidArgumentException):
+            shards.split_problem(3, 3, {"R": 1}, 0)
+
+        with self.assertRaises(InvalidArgumentException):
+            shards.split_problem(1, 1, {"R": 2}, 1)
+
+    def test_run_shard(self):
+        """
+        test solving a single shard.
+        :return: None.
+        """
+        result = shards.run_shard(self.descriptors[1])
+        self.assertEqual(result["shard"], 1)
+        self.assertEqual(result["count"], len(result["solutions"]))
+
+    def test_shards_union(self):
+        """
+        test that the shards of a seeded problem find together
+        the solutions of the whole problem.
+        :return: None.
+        """
+        counts = {"R": 1, "K": 2}
+        sorter = ExternalSorter()
+        Board(4, 4, create_pieces(counts),
+              seed=3).find_independent_configurations(writer=sorter)
+        expected = list(sorter.merge())
+        sorter.close()
+        for count in (1, 2, 3):
+            results = [shards.run_shard(descriptor) for descriptor in
+                       shards.split_problem(4, 4, counts, count, seed=3)]
+            self.assertEqual(shards.merge_results(results), expected)
+
+    def test_merge_results(self):
+        """
+        test merging the results of all the shards of a problem.
+        :return: None.
+        """
+        first = [[0, 0, "K"], [0, 2, "K"], [2, 1, "R"]]
+        second = [[0, 0, "K"], [2, 0, "K"], [1, 2, "R"]]
+        third = [[0, 0, "R"], [0, 2, "K"], [2, 1, "K"]]
+        results = [dict(descriptor, solutions=[second, first])
+                   for descriptor in self.descriptors]
+        results[1]["solutions"].append(third)
+        self.assertEqual(shards.merge_results(results),
+                         [tuple(tuple(piece) for piece in placement)
+                          for placement in (first, second, third)])
+
+        with self.assertRaises(InvalidArgumentException):
+            shards.merge_results(results[:1])
+
+        with self.assertRaises(InvalidArgumentException):
+            shards.merge_results([results[0], results[0]])
+
+        with self.assertRaises(InvalidArgumentException):
+            shards.merge_results([results[0], dict(results[1], rows=4)])
+
+        with self.assertRaises(InvalidArgumentException):
+            shards.merge_results([results[0], dict(results[1], seed=1)])
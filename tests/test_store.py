@@ -0,0 +1,94 @@
+"""
+Includes test classes for the solution store.
+"""
+
+import os
+import tempfile
+import unittest
+from store import SolutionStore, parse_term
+from output import render_jsonl
+from chess_exceptions import InvalidArgumentException
+
+
+class TestSolutionStore(unittest.TestCase):
+    """
+    Testing the solution store functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with a store of the solutions
+        of a 3x3 board with 2 kings and 1 rook.
+        :return: None.
+        """
+        self.solutions = [((0, 0, "K"), (0, 2, "K"), (2, 1, "R")),
+                          ((0, 0, "K"), (1, 2, "R"), (2, 0, "K")),
+                          ((0, 1, "R"), (2, 0, "K"), (2, 2, "K")),
+                          ((0, 2, "K"), (1, 0, "R"), (2, 2, "K"))]
+        self.store = SolutionStore(3, 3, self.solutions)
+
+    def test_parse_term(self):
+        """
+        test parsing the query terms.
+        :return: None.
+        """
+        self.assertEqual(parse_term("Q:3,4"), ("Q", 3, 4))
+        self.assertEqual(parse_term(" r:1,* "), ("R", 1, None))
+        self.assertEqual(parse_term("*:*,0"), (None, None, 0))
+        for text in ["Q", "Q:3", "Q:a,b", "Q:1,2,3"]:
+            self.assertRaises(InvalidArgumentException, parse_term, text)
+
+    def test_get_bitmap(self):
+        """
+        test the bitmaps of the solutions with a piece on a cell.
+        :return: None.
+        """
+        self.assertEqual(len(self.store), 4)
+        self.assertEqual(self.store.get_bitmap("K", 0, 0), 0b0011)
+        self.assertEqual(self.store.get_bitmap("R", 1, 1), 0)
+        self.assertEqual(self.store.get_bitmap("R", None, None), 0b1111)
+        self.assertEqual(self.store.get_bitmap("K", 2, None), 0b1110)
+        self.assertEqual(self.store.get_bitmap(None, None, 0), 0b1111)
+
+    def test_query(self):
+        """
+        test the conjunctive queries.
+        :return: None.
+        """
+        self.assertEqual(self.store.count(), 4)
+        self.assertEqual(self.store.count([("K", 0, 0)]), 2)
+        self.assertEqual(self.store.count([("K", 0, 0), ("K", 2, 0)]), 1)
+        self.assertEqual(self.store.count(exclude=[("R", 1, None),
+                                                   ("R", 2, None)]), 1)
+        self.assertEqual(self.store.select([("K", 2, None)],
+                                           [("R", None, 0)]),
+                         self.solutions[1:3])
+        self.assertEqual(self.store.select([("Q", None, None)]), [])
+
+    def test_add(self):
+        """
+        test adding solutions to the store.
+        :return: None.
+        """
+        store = SolutionStore(3, 3)
+        for index in xrange(20):
+            self.assertEqual(store.add(((index % 3, 0, "Q"),)), index)
+        self.assertEqual(store.count([("Q", 1, 0)]), 7)
+        self.assertEqual(store.get_bitmap("Q", 2, 0), int("100" * 6, 2))
+        self.assertRaises(InvalidArgumentException, store.add,
+                          ((3, 0, "Q"),))
+
+    def test_load(self):
+        """
+        test loading the solutions written as JSON lines.
+        :return: None.
+        """
+        handle, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(handle, 'w') as solutions_file:
+                for placement in self.solutions:
+                    solutions_file.write(render_jsonl(placement, 3, 3))
+            store = SolutionStore.load(path, 3, 3)
+        finally:
+            os.remove(path)
+        self.assertEqual(store.solutions, self.solutions)
+        self.assertEqual(store.count([("R", 0, 1)]), 1)
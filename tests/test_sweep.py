@@ -0,0 +1,110 @@
+"""
+Includes test classes for the piece-count sweep.
+"""
+
+import unittest
+from sweep import parse_ranges, sweep_counts, render_table, SweepCounter,\
+    parse_sizes, count_size, sweep_sizes, render_size_table
+from counting import count_configurations
+from chess_exceptions import InvalidArgumentException
+
+
+class TestSweep(unittest.TestCase):
+    """
+    Testing the sweep functionality.
+    """
+    def test_parse_ranges(self):
+        """
+        test parsing the ranges of the numbers of pieces.
+        :return: None.
+        """
+        self.assertEqual(parse_ranges("K=0-3, q=0-2,N=4"),
+                         {"K": (0, 3), "Q": (0, 2), "N": (4, 4)})
+        for text in ["K=3-1", "X=1", "K", "K=a-b", "K=1,K=2", "K=-1"]:
+            self.assertRaises(InvalidArgumentException, parse_ranges, text)
+
+    def test_count_all(self):
+        """
+        test counting all the combinations up to some numbers of pieces.
+        :return: None.
+        """
+        sweep = SweepCounter(3, 3, {"K": 2, "R": 1})
+        self.assertEqual(sweep.counter.symbols, ["R", "K"])
+        self.assertEqual(sweep.count_all(), {(0, 0): 1, (0, 1): 9,
+                                             (0, 2): 16, (1, 0): 9,
+                                             (1, 1): 20, (1, 2): 4})
+
+    def test_sweep_counts(self):
+        """
+        test that the sweep counts every combination like
+        the counting engine.
+        :return: None.
+        """
+        ranges = {"Q": (1, 2), "B": (0, 2), "N": (1, 3)}
+        results, _ = sweep_counts(4, 5, ranges)
+        self.assertEqual(len(results), 18)
+        self.assertEqual(results[0], ({"Q": 1, "B": 0, "N": 1}, 92))
+        for counts, total in results:
+            self.assertEqual(total, count_configurations(4, 5, counts)[0])
+        self.assertEqual(sweep_counts(2, 2, {"K": (4, 5)})[0],
+                         [({"K": 4}, 0), ({"K": 5}, 0)])
+
+    def test_render_table(self):
+        """
+        test rendering the results of a sweep as a table.
+        :return: None.
+        """
+        results, _ = sweep_counts(3, 3, {"K": (1, 2), "R": (0, 1)})
+        self.assertEqual(render_table(results), "K R count\n"
+                                                "1 0     9\n"
+                                                "1 1    20\n"
+                                                "2 0    16\n"
+                                                "2 1     4\n")
+        self.assertEqual(render_table([]), "")
+
+
+class TestDimensionSweep(unittest.TestCase):
+    """
+    Testing the dimension sweep functionality.
+    """
+    def test_parse_sizes(self):
+        """
+        test parsing a range of board sizes.
+        :return: None.
+        """
+        self.assertEqual(parse_sizes("3x4-10X12"), (3, 10, 4, 12))
+        for text in ["3x3", "3x3-2x2", "0x1-2x2", "axb-3x3", "3-4"]:
+            self.assertRaises(InvalidArgumentException, parse_sizes, text)
+
+    def test_count_size(self):
+        """
+        test counting a single board size.
+        :return: None.
+        """
+        self.assertEqual(count_size((3, 3, {"K": 2, "R": 1}, 1000)),
+                         (3, 3, 4))
+
+    def test_sweep_sizes(self):
+        """
+        test counting the pieces on a range of board sizes.
+        :return: None.
+        """
+        counts = {"K": 2, "R": 1}
+        totals = sweep_sizes((2, 4), (3, 5), counts, 2)
+        self.assertEqual(len(totals), 9)
+        for (rows, columns), total in totals.items():
+            self.assertEqual(total,
+                             count_configurations(rows, columns, counts)[0])
+        self.assertEqual(totals[3, 4], totals[4, 3])
+
+    def test_render_size_table(self):
+        """
+        test rendering the results of a dimension sweep as a table.
+        :return: None.
+        """
+        self.assertEqual(render_size_table({(2, 4): 12, (2, 5): 20,
+                                            (3, 4): 36, (3, 5): 60}),
+                         "MxN  4  5\n"
+                         "  2 12 20\n"
+                         "  3 36 60\n")
+        self.assertEqual(render_size_table({}), "")
@@ -0,0 +1,144 @@
+"""
+Includes test classes for the batch validator of solution sets.
+"""
+
+import os
+import tempfile
+import unittest
+from validate import BatchValidator, verify_file
+from export import SolutionBuffer, numpy
+from output import render_jsonl
+from board import Board
+from pieces import create_pieces
+from chess_exceptions import InvalidArgumentException
+
+
+class TestBatchValidator(unittest.TestCase):
+    """
+    Testing the batch validator functionality.
+    """
+    def setUp(self):
+        """
+        setup the test with the solutions of a 4x4 board with
+        2 kings and 2 knights, followed by a repeated solution,
+        a solution with two pieces attacking each other, a solution
+        with two pieces on the same cell and one outside the board.
+        :return: None.
+        """
+        counts = {"K": 2, "N": 2}
+        self.buffer = SolutionBuffer(4, 4, counts)
+        Board(4, 4, create_pieces(counts)).find_all_configurations(
+            self.buffer)
+        self.count = self.buffer.count
+        first = list(self.buffer.cells[:4])
+        self.buffer.cells.extend([first[1], first[0]] + first[2:])
+        self.buffer.cells.extend([0, 1, 10, 15])
+        self.buffer.cells.extend([0, 2, 15, 15])
+        self.buffer.cells.extend([0, 2, 15, 16])
+        self.validator = BatchValidator(4, 4)
+
+    def test_validate(self):
+        """
+        test checking the solutions in bulk.
+        :return: None.
+        """
+        report = self.validator.validate(self.buffer.symbols,
+                                         self.buffer.cells)
+        self.assertEqual(report, {
+            "count": self.count + 4,
+            "invalid": [self.count + 1, self.count + 2, self.count + 3],
+            "duplicates": [self.count],
+        })
+
+    def test_check_rows(self):
+        """
+        test checking the solutions one by one with the attack bitmasks.
+        :return: None.
+        """
+        rows = self.validator._iter_rows(self.buffer.symbols,
+                                         self.buffer.cells)
+        invalid, duplicates, count = self.validator._check_rows(
+            self.buffer.symbols, rows)
+        self.assertEqual(count, self.count + 4)
+        self.assertEqual(invalid, [self.count + 1, self.count + 2,
+                                   self.count + 3])
+        self.assertEqual(duplicates, [self.count])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_get_matrix(self):
+        """
+        test the attack matrix of a piece type.
+        :return: None.
+        """
+        matrix = self.validator.get_matrix("N")
+        self.assertEqual(matrix.shape, (16, 16))
+        self.assertEqual(sorted(numpy.flatnonzero(matrix[0]).tolist()),
+                         [6, 9])
+        self.assertTrue((matrix == matrix.T).all())
+
+
+class TestVerifyFile(unittest.TestCase):
+    """
+    Testing the verification of the solution files.
+    """
+    def setUp(self):
+        """
+        setup the test with the solutions of a 3x3 board
+        with 2 kings and 1 rook.
+        :return: None.
+        """
+        counts = {"K": 2, "R": 1}
+        self.buffer = SolutionBuffer(3, 3, counts)
+        self.solutions = Board(3, 3, create_pieces(counts))\
+            .find_all_configurations(self.buffer)
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        """
+        remove the solution file of the test.
+        :return: None.
+        """
+        os.remove(self.path)
+
+    def test_binary_file(self):
+        """
+        test verifying a binary solution file.
+        :return: None.
+        """
+        self.buffer.save(self.path)
+        self.assertEqual(verify_file(self.path),
+                         {"count": 4, "invalid": [], "duplicates": []})
+
+    def test_jsonl_file(self):
+        """
+        test verifying a JSON lines file with a repeated solution
+        and solutions of other pieces.
+        :return: None.
+        """
+        placements = list(self.solutions) + [
+            self.solutions[0],
+            ((0, 0, "K"), (2, 2, "K")),
+            ((0, 0, "K"), (0, 1, "K"), (2, 2, "R")),
+        ]
+        with open(self.path, 'w') as solutions_file:
+            for placement in placements:
+                solutions_file.write(render_jsonl(placement, 3, 3))
+        self.assertEqual(verify_file(self.path, 3, 3),
+                         {"count": 7, "invalid": [5, 6], "duplicates": [4]})
+        self.assertRaises(InvalidArgumentException, verify_file, self.path)
+
+    def test_jsonl_off_board(self):
+        """
+        test verifying a JSON lines file with pieces outside the board,
+        whose cell indexes wrap onto cells of the board.
+        :return: None.
+        """
+        lines = ['{"pieces": [["K", 0, 0], ["K", 2, 0], ["R", 1, 2]]}\n',
+                 '{"pieces": [["K", 0, 0], ["K", 2, 0], ["R", 0, 5]]}\n',
+                 '{"pieces": [["K", 0, 0], ["K", 2, 0], ["R", 3, -1]]}\n']
+        with open(self.path, 'w') as solutions_file:
+            solutions_file.writelines(lines)
+        self.assertEqual(verify_file(self.path, 3, 3),
+                         {"count": 3, "invalid": [1, 2],
+                          "duplicates": []})
@@ -0,0 +1,228 @@
+"""
+Includes the batch validator of solution sets, it checks that none of
+the pieces of every solution attacks another one and finds the solutions
+that are repeated, without building a board for each of them.
+
+The solutions are checked as rows of cell indexes, see SolutionBuffer.
+With NumPy, the attacks are looked up for every pair of pieces in all
+the rows at once, from a boolean matrix of the cells each type attacks
+from each cell. Without it, or on boards too large for such matrices,
+every row is checked with the bitmasks of the attack table.
+"""
+from attacks import get_attack_table
+from export import SolutionBuffer, read_header, open_memmap, numpy
+from output import read_jsonl
+from chess_exceptions import InvalidArgumentException
+
+# the largest board the attack matrices are built for, a matrix
+# takes a byte for every pair of cells
+MAX_MATRIX_CELLS = 1024
+
+
+class BatchValidator(object):
+    """
+    Checks the solutions of a board size in bulk.
+    """
+    def __init__(self, rows, columns):
+        """
+        Initializes a new instance of the BatchValidator class.
+        :param rows: An integer that represents the number of rows.
+        :param columns: An integer that represents the number of columns.
+        :return: A new instance of the BatchValidator class.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.table = get_attack_table(rows, columns)
+        self._matrices = {}
+        super(BatchValidator, self).__init__()
+
+    def validate(self, symbols, cells):
+        """
+        Checks a set of solutions.
+        :param symbols: A string of the piece type of every column.
+        :param cells: The cell indexes of the solutions, a flat
+        sequence of rows or a NumPy array of shape (solutions, pieces).
+        :return: A dict with the number of the solutions ("count"), the
+        indexes of the invalid ones ("invalid") and the indexes of the
+        repetitions of an earlier one ("duplicates").
+        """
+        if numpy is not None and self.table.cells <= MAX_MATRIX_CELLS:
+            matrix = numpy.asarray(cells, dtype=numpy.int64).reshape(
+                -1, len(symbols))
+            invalid = self._find_conflicts(symbols, matrix)
+            duplicates = self._find_duplicates(symbols, matrix)
+            count = len(matrix)
+        else:
+            rows = self._iter_rows(symbols, cells)
+            invalid, duplicates, count = self._check_rows(symbols, rows)
+        return {"count": count, "invalid": invalid,
+                "duplicates": duplicates}
+
+    def get_matrix(self, symbol):
+        """
+        Returns the boolean matrix of the cells a piece type attacks,
+        the item (cell, target) is set when a piece on the cell
+        attacks the target.
+        :param symbol: A string that represents the type of the piece.
+        :return: A NumPy array of shape (cells, cells).
+        """
+        matrix = self._matrices.get(symbol)
+        if matrix is None:
+            matrix = numpy.zeros((self.table.cells, self.table.cells),
+                                 dtype=bool)
+            for cell in xrange(self.table.cells):
+                mask = self.table.get_mask(symbol, cell)
+                while mask:
+                    bit = mask & -mask
+                    mask ^= bit
+                    matrix[cell, bit.bit_length() - 1] = True
+            self._matrices[symbol] = matrix
+        return matrix
+
+    def _find_conflicts(self, symbols, matrix):
+        """
+        Finds the rows with a piece outside the board or a pair of
+        pieces on the same cell or attacking each other.
+        :param symbols: A string of the piece type of every column.
+        :param matrix: A NumPy array of shape (solutions, pieces).
+        :return: A sorted list of the indexes of the rows.
+        """
+        outside = ((matrix < 0) | (matrix >= self.table.cells)).any(axis=1)
+        matrix = numpy.clip(matrix, 0, self.table.cells - 1)
+        conflicts = outside
+        for first in xrange(len(symbols)):
+            attacks = self.get_matrix(symbols[first])
+            for second in xrange(first + 1, len(symbols)):
+                conflicts = conflicts |\
+                    (matrix[:, first] == matrix[:, second]) |\
+                    attacks[matrix[:, first], matrix[:, second]] |\
+                    self.get_matrix(symbols[second])[matrix[:, second],
+                                                     matrix[:, first]]
+        return numpy.flatnonzero(conflicts).tolist()
+
+    def _find_duplicates(self, symbols, matrix):
+        """
+        Finds the rows that hold the same pieces as an earlier row.
+        :param symbols: A string of the piece type of every column.
+        :param matrix: A NumPy array of shape (solutions, pieces).
+        :return: A sorted list of the indexes of the rows.
+        """
+        if not len(matrix):
+            return []
+        matrix = matrix.copy()
+        # the pieces of a type can be in any order
+        start = 0
+        for end in xrange(1, len(symbols) + 1):
+            if end == len(symbols) or symbols[end] != symbols[start]:
+                matrix[:, start:end].sort(axis=1)
+                start = end
+        order = numpy.lexsort(matrix.T[::-1])
+        ordered = matrix[order]
+        repeated = numpy.zeros(len(matrix), dtype=bool)
+        repeated[1:] = (ordered[1:] == ordered[:-1]).all(axis=1)
+        # the earliest row of a group is the first of the stable sort
+        return sorted(order[repeated].tolist())
+
+    def _iter_rows(self, symbols, cells):
+        """
+        Splits the cell indexes of the solutions into rows.
+        :param symbols: A string of the piece type of every column.
+        :param cells: A flat sequence of rows or an array of rows.
+        :return: A generator of tuples of cell indexes.
+        """
+        if numpy is not None and isinstance(cells, numpy.ndarray):
+            cells = cells.ravel()
+        size = len(symbols)
+        for start in xrange(0, len(cells) - size + 1 if size else 0, size):
+            yield tuple(int(cell) for cell in cells[start:start + size])
+
+    def _check_rows(self, symbols, rows):
+        """
+        Checks the rows one by one with the attack bitmasks.
+        :param symbols: A string of the piece type of every column.
+        :param rows: An iterable of tuples of cell indexes.
+        :return: A tuple of the indexes of the invalid rows, the
+        indexes of the repeated rows and the number of rows.
+        """
+        invalid = []
+        duplicates = []
+        seen = set()
+        count = 0
+        for index, row in enumerate(rows):
+            count += 1
+            occupied = 0
+            attacked = 0
+            valid = True
+            for symbol, cell in zip(symbols, row):
+                if not 0 <= cell < self.table.cells:
+                    valid = False
+                    break
+                bit = 1 << cell
+                attacks = self.table.get_mask(symbol, cell)
+                if bit & (occupied | attacked) or attacks & occupied:
+                    valid = False
+                    break
+                occupied |= bit
+                attacked |= attacks
+            if not valid:
+                invalid.append(index)
+            key = tuple(sorted(zip(symbols, row)))
+            if key in seen:
+                duplicates.append(index)
+            seen.add(key)
+        return invalid, duplicates, count
+
+
+def verify_file(path, rows=None, columns=None):
+    """
+    Checks the solutions of a file, either a binary solution file
+    (see SolutionBuffer.save()) or a JSON lines file.
+    :param path: A string that represents the path of the file.
+    :param rows: An integer that represents the number of rows,
+    it is read from the header of the binary files.
+    :param columns: An integer that represents the number of columns,
+    it is read from the header of the binary files.
+    :return: A dict like BatchValidator.validate() returns, the lines of a
+    JSON lines file with other pieces than its first line or with pieces
+    outside the board being invalid.
+    """
+    try:
+        rows, columns, symbols, _ = read_header(path)
+    except InvalidArgumentException:
+        symbols = None
+    if symbols is not None:
+        if numpy is not None:
+            cells, _ = open_memmap(path)
+        else:
+            cells = SolutionBuffer.load(path).cells
+        return BatchValidator(rows, columns).validate(symbols, cells)
+
+    if rows is None or columns is None:
+        raise InvalidArgumentException(
+            "the board size of %s is not known" % path
+        )
+    solutions = None
+    indexes = []
+    mismatched = []
+    with open(path) as solutions_file:
+        for index, placement in enumerate(read_jsonl(solutions_file)):
+            if solutions is None:
+                counts = {}
+                for _, _, symbol in placement:
+                    counts[symbol] = counts.get(symbol, 0) + 1
+                solutions = SolutionBuffer(rows, columns, counts)
+            try:
+                solutions.write(placement)
+                indexes.append(index)
+            except InvalidArgumentException:
+                mismatched.append(index)
+    if solutions is None:
+        return {"count": 0, "invalid": [], "duplicates": []}
+    report = BatchValidator(rows, columns).validate(solutions.symbols,
+                                                    solutions.cells)
+    report["count"] += len(mismatched)
+    report["invalid"] = sorted([indexes[index]
+                                for index in report["invalid"]] + mismatched)
+    report["duplicates"] = [indexes[index]
+                            for index in report["duplicates"]]
+    return report